@@ -23,10 +23,14 @@ class Settings(BaseSettings):
     # Airtable
     airtable_api_key: str = ""
     airtable_base_id: str = ""
+    # Optional table of per-category insight counts read by get_stats
+    airtable_category_counts_table: str = ""
 
     # Scraping settings
     request_delay_seconds: float = 1.0
     max_retries: int = 3
+    # SQLite file caching fetched forum pages across runs; empty disables it
+    scraper_cache_path: str = ""
 
     # Target subreddits
     reddit_subreddits: list[str] = [
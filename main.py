@@ -2,6 +2,7 @@
 """CLI for Shopify Requirements Gatherer."""
 
 import asyncio
+import atexit
 from enum import Enum
 from typing import Optional
 
@@ -41,6 +42,17 @@ class StorageBackendType(str, Enum):
 app = typer.Typer(help="Shopify Requirements Gatherer - Find app opportunities")
 console = Console()
 
+# Scraped data points buffered before each bulk save
+SAVE_BATCH_SIZE = 50
+
+
+def _open_storage(backend: str, db_path: Optional[str]) -> StorageBackend:
+    """Open a storage backend and close it when the CLI exits."""
+    kwargs = {"db_path": db_path} if db_path and backend == "sqlite" else {}
+    storage = get_storage(backend=backend, **kwargs)
+    atexit.register(storage.close)
+    return storage
+
 
 @app.command()
 def scrape(
@@ -81,8 +93,7 @@ async def _scrape(
 
     storage: StorageBackend | None = None
     if save:
-        kwargs = {"db_path": db_path} if db_path and storage_backend == "sqlite" else {}
-        storage = get_storage(backend=storage_backend, **kwargs)
+        storage = _open_storage(storage_backend, db_path)
     total_scraped = 0
 
     for name, scraper in scrapers:
@@ -99,6 +110,7 @@ async def _scrape(
             continue
 
         count = 0
+        pending: list[RawDataPoint] = []
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -111,10 +123,13 @@ async def _scrape(
                 progress.update(task, description=f"Fetched {count} items from {name}")
 
                 if storage:
-                    try:
-                        storage.save_raw_datapoint(datapoint)
-                    except Exception as e:
-                        console.print(f"[red]Error saving: {e}[/red]")
+                    pending.append(datapoint)
+                    if len(pending) >= SAVE_BATCH_SIZE:
+                        _save_raw_batch(storage, pending)
+                        pending = []
+
+        if pending:
+            _save_raw_batch(storage, pending)
 
         console.print(f"[green]✓ Scraped {count} items from {name}[/green]")
         total_scraped += count
@@ -126,6 +141,23 @@ async def _scrape(
     console.print(f"\n[bold green]Total scraped: {total_scraped} items[/bold green]")
 
 
+def _save_raw_batch(storage: StorageBackend, datapoints: list[RawDataPoint]) -> None:
+    """Save a batch of scraped data points, reporting any failure."""
+    try:
+        storage.save_raw_datapoints(datapoints)
+    except Exception as e:
+        console.print(f"[red]Error saving: {e}[/red]")
+
+
+async def _save_insight_batch(storage: StorageBackend, insights: list[ClassifiedInsight]) -> None:
+    """Save a batch of insights and mark their sources processed, reporting any failure."""
+    try:
+        await storage.save_insights_async(insights)
+        storage.mark_batch_processed([insight.source_id for insight in insights])
+    except Exception as e:
+        console.print(f"[red]Error saving insights: {e}[/red]")
+
+
 @app.command()
 def classify(
     limit: int = typer.Option(100, "--limit", "-l", help="Max items to classify"),
@@ -143,8 +175,7 @@ def classify(
 
 async def _classify(limit: int, concurrency: int, storage_backend: str, db_path: Optional[str]):
     """Async classification implementation."""
-    kwargs = {"db_path": db_path} if db_path and storage_backend == "sqlite" else {}
-    storage = get_storage(backend=storage_backend, **kwargs)
+    storage = _open_storage(storage_backend, db_path)
     classifier = Classifier()
 
     console.print("[bold blue]Fetching unprocessed data...[/bold blue]")
@@ -174,6 +205,7 @@ async def _classify(limit: int, concurrency: int, storage_backend: str, db_path:
             console.print(f"[red]Error parsing record: {e}[/red]")
 
     classified_count = 0
+    pending: list[ClassifiedInsight] = []
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -184,12 +216,14 @@ async def _classify(limit: int, concurrency: int, storage_backend: str, db_path:
         async for insight in classifier.classify_batch(datapoints, concurrency):
             classified_count += 1
             progress.update(task, advance=1, description=f"Classified {classified_count}")
+            pending.append(insight)
+            # Save as we go so an interrupted run keeps the work done so far
+            if len(pending) >= SAVE_BATCH_SIZE:
+                await _save_insight_batch(storage, pending)
+                pending = []
 
-            try:
-                storage.save_insight(insight)
-                storage.mark_as_processed(insight.source_id)
-            except Exception as e:
-                console.print(f"[red]Error saving insight: {e}[/red]")
+    if pending:
+        await _save_insight_batch(storage, pending)
 
     console.print(f"\n[bold green]Classified {classified_count} items[/bold green]")
 
@@ -204,8 +238,7 @@ def stats(
     ),
 ):
     """Show statistics about collected data."""
-    kwargs = {"db_path": db_path} if db_path and storage.value == "sqlite" else {}
-    storage_inst = get_storage(backend=storage.value, **kwargs)
+    storage_inst = _open_storage(storage.value, db_path)
 
     try:
         data = storage_inst.get_stats()
@@ -251,8 +284,7 @@ def opportunities(
     ),
 ):
     """Show ranked app opportunities."""
-    kwargs = {"db_path": db_path} if db_path and storage.value == "sqlite" else {}
-    storage_inst = get_storage(backend=storage.value, **kwargs)
+    storage_inst = _open_storage(storage.value, db_path)
 
     try:
         opps = storage_inst.get_ranked_opportunities()[:top]
@@ -328,6 +360,7 @@ async def _check_reddit() -> tuple[bool, str]:
     # Use RSS-based scraper which doesn't require API credentials
     scraper = RedditSeleniumScraper()
     ok = await scraper.health_check()
+    await scraper.close()
     return ok, "Connected (RSS)" if ok else "Connection failed"
 
 
@@ -406,6 +439,7 @@ AIRTABLE_BASE_ID=
 # Scraping settings
 REQUEST_DELAY_SECONDS=1.0
 MAX_RETRIES=3
+SCRAPER_CACHE_PATH=
 """
 
     import os
@@ -677,8 +711,7 @@ def interview_opportunities(
     db_path: Optional[str] = typer.Option(None, "--db-path", help="SQLite database path"),
 ):
     """Show ranked opportunities with interview validation."""
-    kwargs = {"db_path": db_path} if db_path and storage_type.value == "sqlite" else {}
-    main_storage = get_storage(backend=storage_type.value, **kwargs)
+    main_storage = _open_storage(storage_type.value, db_path)
     interview_storage = InterviewStorage(db_path=db_path)
 
     try:
@@ -12,8 +12,12 @@ from research.transcription import (
     Transcript,
     TranscriptSegment,
     import_vtt_file,
+    iter_vtt_segments,
     transcribe_audio_whisper,
+    transcribe_audio_whisper_batch,
+    unload_whisper_cache,
     get_default_transcript_dir,
+    load_transcripts,
 )
 from research.transcript_classifier import (
     TranscriptClassifier,
@@ -35,8 +39,12 @@ __all__ = [
     "Transcript",
     "TranscriptSegment",
     "import_vtt_file",
+    "iter_vtt_segments",
     "transcribe_audio_whisper",
+    "transcribe_audio_whisper_batch",
+    "unload_whisper_cache",
     "get_default_transcript_dir",
+    "load_transcripts",
     # Transcript classification
     "TranscriptClassifier",
     "TranscriptAnalysis",
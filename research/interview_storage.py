@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import sqlite3
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
+
+import orjson
 
 from config import settings
 from analysis.classifier import ProblemCategory
@@ -19,19 +21,55 @@ from research.interview_schema import (
 )
 
 
+def _dumps(value: list[str]) -> str:
+    """Serialize a list column to JSON text."""
+    return orjson.dumps(value).decode()
+
+
+def _loads(value: str | None) -> list[str]:
+    """Deserialize a JSON list column, treating NULL as empty."""
+    return orjson.loads(value or "[]")
+
+
+# Insight columns safe to share in exports; recordings and interviewer
+# notes are left out
+_EXPORT_INSIGHT_COLUMNS = (
+    "interview_id",
+    "participant_id",
+    "pain_category",
+    "pain_summary",
+    "verbatim_quotes",
+    "frustration_level",
+    "frequency",
+    "business_impact",
+    "current_workaround",
+    "apps_tried",
+    "ideal_solution",
+    "wtp_amount_low",
+    "wtp_amount_high",
+    "wtp_quote",
+)
+
+
 class InterviewStorage:
     """Storage backend for interview research data."""
 
-    def __init__(self, db_path: str | None = None):
+    def __init__(self, db_path: str | None = None, cache_ttl: float = 30.0):
         """Initialize interview storage.
 
         Args:
             db_path: Path to SQLite database file. Defaults to settings or ./data/shopify.db
+            cache_ttl: Seconds to reuse aggregate query results. Writes made through
+                this instance invalidate the cache immediately; the TTL bounds how
+                stale results can get when other processes write to the database.
         """
         if db_path is None:
             db_path = getattr(settings, "sqlite_db_path", None) or "./data/shopify.db"
 
         self.db_path = Path(db_path)
+        self.cache_ttl = cache_ttl
+        self._agg_cache: dict[tuple[str, int], tuple[float, Any]] = {}
+        self._write_epoch = 0
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection."""
@@ -39,6 +77,44 @@ class InterviewStorage:
         conn.row_factory = sqlite3.Row
         return conn
 
+    def _cached_aggregate(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return a cached aggregate result, recomputing when stale.
+
+        The cache key includes the write epoch, so any write through this
+        instance makes previous entries unreachable.
+
+        Args:
+            name: Cache key for the aggregate.
+            compute: Callable producing a fresh result.
+
+        Returns:
+            The cached or freshly computed result (treat as read-only).
+        """
+        key = (name, self._write_epoch)
+        now = time.monotonic()
+        cached = self._agg_cache.get(key)
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            return cached[1]
+
+        value = compute()
+        self._agg_cache = {
+            k: v for k, v in self._agg_cache.items() if k[1] == self._write_epoch
+        }
+        self._agg_cache[key] = (now, value)
+        return value
+
+    def _on_connection(self, query: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run a query function on a fresh connection, closing it afterwards."""
+        conn = self._get_connection()
+        try:
+            return query(conn)
+        finally:
+            conn.close()
+
+    def _mark_written(self) -> None:
+        """Invalidate cached aggregates after a write."""
+        self._write_epoch += 1
+
     # -------------------------------------------------------------------------
     # Participants
     # -------------------------------------------------------------------------
@@ -108,6 +184,7 @@ class InterviewStorage:
                     )
                 )
             conn.commit()
+            self._mark_written()
             return participant.participant_id
         finally:
             conn.close()
@@ -131,17 +208,7 @@ class InterviewStorage:
             if not row:
                 return None
 
-            return InterviewParticipant(
-                participant_id=row["participant_id"],
-                interview_date=datetime.fromisoformat(row["interview_date"]),
-                store_vertical=row["store_vertical"],
-                monthly_gmv_range=row["monthly_gmv_range"],
-                store_age_months=row["store_age_months"],
-                team_size=row["team_size"],
-                app_count=row["app_count"],
-                monthly_app_budget=row["monthly_app_budget"],
-                beta_tester=bool(row["beta_tester"]),
-            )
+            return self._row_to_participant(row)
         finally:
             conn.close()
 
@@ -151,25 +218,35 @@ class InterviewStorage:
         Returns:
             List of all participants.
         """
+        return self._on_connection(self._query_all_participants)
+
+    def _query_all_participants(self, conn: sqlite3.Connection) -> list[InterviewParticipant]:
+        """Fetch every participant, most recent interview first."""
+        cursor = conn.execute(
+            "SELECT * FROM interview_participants ORDER BY interview_date DESC"
+        )
+        return [self._row_to_participant(row) for row in cursor.fetchall()]
+
+    def get_recent_participants(self, since: datetime) -> list[InterviewParticipant]:
+        """Get participants interviewed on or after a given time.
+
+        Args:
+            since: Earliest interview date to include.
+
+        Returns:
+            List of participants, most recent interview first.
+        """
         conn = self._get_connection()
         try:
             cursor = conn.execute(
-                "SELECT * FROM interview_participants ORDER BY interview_date DESC"
+                """
+                SELECT * FROM interview_participants
+                WHERE interview_date >= ?
+                ORDER BY interview_date DESC
+                """,
+                (since.isoformat(),),
             )
-            participants = []
-            for row in cursor.fetchall():
-                participants.append(InterviewParticipant(
-                    participant_id=row["participant_id"],
-                    interview_date=datetime.fromisoformat(row["interview_date"]),
-                    store_vertical=row["store_vertical"],
-                    monthly_gmv_range=row["monthly_gmv_range"],
-                    store_age_months=row["store_age_months"],
-                    team_size=row["team_size"],
-                    app_count=row["app_count"],
-                    monthly_app_budget=row["monthly_app_budget"],
-                    beta_tester=bool(row["beta_tester"]),
-                ))
-            return participants
+            return [self._row_to_participant(row) for row in cursor.fetchall()]
         finally:
             conn.close()
 
@@ -184,23 +261,31 @@ class InterviewStorage:
             cursor = conn.execute(
                 "SELECT * FROM interview_participants WHERE beta_tester = TRUE"
             )
-            participants = []
-            for row in cursor.fetchall():
-                participants.append(InterviewParticipant(
-                    participant_id=row["participant_id"],
-                    interview_date=datetime.fromisoformat(row["interview_date"]),
-                    store_vertical=row["store_vertical"],
-                    monthly_gmv_range=row["monthly_gmv_range"],
-                    store_age_months=row["store_age_months"],
-                    team_size=row["team_size"],
-                    app_count=row["app_count"],
-                    monthly_app_budget=row["monthly_app_budget"],
-                    beta_tester=True,
-                ))
-            return participants
+            return [self._row_to_participant(row) for row in cursor.fetchall()]
         finally:
             conn.close()
 
+    def _row_to_participant(self, row: sqlite3.Row) -> InterviewParticipant:
+        """Convert a database row to InterviewParticipant.
+
+        Args:
+            row: Database row.
+
+        Returns:
+            InterviewParticipant instance.
+        """
+        return InterviewParticipant(
+            participant_id=row["participant_id"],
+            interview_date=datetime.fromisoformat(row["interview_date"]),
+            store_vertical=row["store_vertical"],
+            monthly_gmv_range=row["monthly_gmv_range"],
+            store_age_months=row["store_age_months"],
+            team_size=row["team_size"],
+            app_count=row["app_count"],
+            monthly_app_budget=row["monthly_app_budget"],
+            beta_tester=bool(row["beta_tester"]),
+        )
+
     # -------------------------------------------------------------------------
     # Interview Insights
     # -------------------------------------------------------------------------
@@ -231,12 +316,12 @@ class InterviewStorage:
                     insight.recording_url,
                     insight.pain_category.value,
                     insight.pain_summary,
-                    json.dumps(insight.verbatim_quotes),
+                    _dumps(insight.verbatim_quotes),
                     insight.frustration_level,
                     insight.frequency.value,
                     insight.business_impact.value,
                     insight.current_workaround,
-                    json.dumps(insight.apps_tried),
+                    _dumps(insight.apps_tried),
                     insight.ideal_solution,
                     insight.wtp_amount_low,
                     insight.wtp_amount_high,
@@ -246,6 +331,7 @@ class InterviewStorage:
                 )
             )
             conn.commit()
+            self._mark_written()
             return str(cursor.lastrowid)
         finally:
             conn.close()
@@ -259,15 +345,10 @@ class InterviewStorage:
         Returns:
             List of insights.
         """
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT * FROM interview_insights WHERE participant_id = ?",
-                (participant_id,)
-            )
-            return [self._row_to_insight(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        return list(self._iter_insights(
+            "SELECT * FROM interview_insights WHERE participant_id = ?",
+            (participant_id,),
+        ))
 
     def get_insights_by_category(self, category: ProblemCategory) -> list[InterviewInsight]:
         """Get all interview insights for a specific category.
@@ -278,15 +359,10 @@ class InterviewStorage:
         Returns:
             List of insights.
         """
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT * FROM interview_insights WHERE pain_category = ?",
-                (category.value,)
-            )
-            return [self._row_to_insight(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        return list(self._iter_insights(
+            "SELECT * FROM interview_insights WHERE pain_category = ?",
+            (category.value,),
+        ))
 
     def get_all_insights(self) -> list[InterviewInsight]:
         """Get all interview insights.
@@ -294,12 +370,42 @@ class InterviewStorage:
         Returns:
             List of all insights.
         """
+        return list(self.iter_all_insights())
+
+    def iter_all_insights(self) -> Iterator[InterviewInsight]:
+        """Iterate over all interview insights without materializing them.
+
+        The underlying connection stays open until the iterator is exhausted
+        or closed.
+
+        Yields:
+            InterviewInsight instances, newest first.
+        """
+        return self._iter_insights(
+            "SELECT * FROM interview_insights ORDER BY created_at DESC"
+        )
+
+    def iter_insight_rows(self) -> Iterator[dict]:
+        """Iterate over insights as plain dicts for export.
+
+        Rows are not turned into InterviewInsight models, and only the
+        columns in _EXPORT_INSIGHT_COLUMNS are read.
+
+        Yields:
+            Insight dicts, newest first, with enums as their stored values
+            and list columns decoded.
+        """
         conn = self._get_connection()
         try:
             cursor = conn.execute(
-                "SELECT * FROM interview_insights ORDER BY created_at DESC"
+                f"SELECT {', '.join(_EXPORT_INSIGHT_COLUMNS)} FROM interview_insights "
+                "ORDER BY created_at DESC"
             )
-            return [self._row_to_insight(row) for row in cursor.fetchall()]
+            for row in cursor:
+                item = dict(row)
+                item["verbatim_quotes"] = _loads(item["verbatim_quotes"])
+                item["apps_tried"] = _loads(item["apps_tried"])
+                yield item
         finally:
             conn.close()
 
@@ -309,17 +415,12 @@ class InterviewStorage:
         Returns:
             List of insights with WTP data.
         """
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                """
-                SELECT * FROM interview_insights
-                WHERE wtp_amount_low IS NOT NULL OR wtp_amount_high IS NOT NULL
-                """
-            )
-            return [self._row_to_insight(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        return list(self._iter_insights(
+            """
+            SELECT * FROM interview_insights
+            WHERE wtp_amount_low IS NOT NULL OR wtp_amount_high IS NOT NULL
+            """
+        ))
 
     def get_high_frustration_insights(self, min_level: int = 4) -> list[InterviewInsight]:
         """Get insights with high frustration levels.
@@ -330,13 +431,25 @@ class InterviewStorage:
         Returns:
             List of high-frustration insights.
         """
+        return list(self._iter_insights(
+            "SELECT * FROM interview_insights WHERE frustration_level >= ?",
+            (min_level,),
+        ))
+
+    def _iter_insights(self, sql: str, params: tuple = ()) -> Iterator[InterviewInsight]:
+        """Run an insight query and convert rows as they are fetched.
+
+        Args:
+            sql: SELECT statement over interview_insights.
+            params: Query parameters.
+
+        Yields:
+            InterviewInsight instances.
+        """
         conn = self._get_connection()
         try:
-            cursor = conn.execute(
-                "SELECT * FROM interview_insights WHERE frustration_level >= ?",
-                (min_level,)
-            )
-            return [self._row_to_insight(row) for row in cursor.fetchall()]
+            for row in conn.execute(sql, params):
+                yield self._row_to_insight(row)
         finally:
             conn.close()
 
@@ -355,12 +468,12 @@ class InterviewStorage:
             recording_url=row["recording_url"],
             pain_category=ProblemCategory(row["pain_category"]),
             pain_summary=row["pain_summary"],
-            verbatim_quotes=json.loads(row["verbatim_quotes"] or "[]"),
+            verbatim_quotes=_loads(row["verbatim_quotes"]),
             frustration_level=row["frustration_level"],
             frequency=InterviewFrequency(row["frequency"]),
             business_impact=BusinessImpact(row["business_impact"]),
             current_workaround=row["current_workaround"],
-            apps_tried=json.loads(row["apps_tried"] or "[]"),
+            apps_tried=_loads(row["apps_tried"]),
             ideal_solution=row["ideal_solution"],
             wtp_amount_low=row["wtp_amount_low"],
             wtp_amount_high=row["wtp_amount_high"],
@@ -376,87 +489,102 @@ class InterviewStorage:
     def get_category_summary(self) -> dict[str, dict]:
         """Get summary of insights by category.
 
+        Results are cached for ``cache_ttl`` seconds or until the next write.
+
         Returns:
             Dictionary with category stats.
         """
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                """
-                SELECT
-                    pain_category,
-                    COUNT(*) as count,
-                    AVG(frustration_level) as avg_frustration,
-                    SUM(CASE WHEN wtp_amount_low IS NOT NULL OR wtp_amount_high IS NOT NULL THEN 1 ELSE 0 END) as wtp_count,
-                    AVG(COALESCE(wtp_amount_low, wtp_amount_high)) as avg_wtp
-                FROM interview_insights
-                GROUP BY pain_category
-                ORDER BY count DESC
-                """
-            )
-            result = {}
-            for row in cursor.fetchall():
-                result[row["pain_category"]] = {
-                    "count": row["count"],
-                    "avg_frustration": round(row["avg_frustration"], 2) if row["avg_frustration"] else 0,
-                    "wtp_count": row["wtp_count"],
-                    "avg_wtp": round(row["avg_wtp"], 2) if row["avg_wtp"] else None,
-                }
-            return result
-        finally:
-            conn.close()
+        return self._cached_aggregate(
+            "category_summary", lambda: self._on_connection(self._query_category_summary)
+        )
+
+    def _query_category_summary(self, conn: sqlite3.Connection) -> dict[str, dict]:
+        """Run the category summary aggregate query."""
+        cursor = conn.execute(
+            """
+            SELECT
+                pain_category,
+                COUNT(*) as count,
+                AVG(frustration_level) as avg_frustration,
+                SUM(
+                    CASE WHEN wtp_amount_low IS NOT NULL OR wtp_amount_high IS NOT NULL
+                    THEN 1 ELSE 0 END
+                ) as wtp_count,
+                AVG(COALESCE(wtp_amount_low, wtp_amount_high)) as avg_wtp
+            FROM interview_insights
+            GROUP BY pain_category
+            ORDER BY count DESC
+            """
+        )
+        result = {}
+        for row in cursor.fetchall():
+            result[row["pain_category"]] = {
+                "count": row["count"],
+                "avg_frustration": (
+                    round(row["avg_frustration"], 2) if row["avg_frustration"] else 0
+                ),
+                "wtp_count": row["wtp_count"],
+                "avg_wtp": round(row["avg_wtp"], 2) if row["avg_wtp"] else None,
+            }
+        return result
 
     def get_interview_stats(self) -> dict:
         """Get overall interview research statistics.
 
+        Results are cached for ``cache_ttl`` seconds or until the next write.
+
         Returns:
             Dictionary with stats.
         """
-        conn = self._get_connection()
-        try:
-            participants = conn.execute(
-                "SELECT COUNT(*) FROM interview_participants"
-            ).fetchone()[0]
-            insights = conn.execute(
-                "SELECT COUNT(*) FROM interview_insights"
-            ).fetchone()[0]
-            beta_testers = conn.execute(
-                "SELECT COUNT(*) FROM interview_participants WHERE beta_tester = TRUE"
-            ).fetchone()[0]
-            wtp_insights = conn.execute(
-                """
-                SELECT COUNT(*) FROM interview_insights
-                WHERE wtp_amount_low IS NOT NULL OR wtp_amount_high IS NOT NULL
-                """
-            ).fetchone()[0]
-
-            # Average insights per interview
-            avg_insights = insights / participants if participants > 0 else 0
+        return self._cached_aggregate(
+            "interview_stats", lambda: self._on_connection(self._query_interview_stats)
+        )
 
-            # WTP statistics
-            wtp_stats = conn.execute(
-                """
-                SELECT
-                    AVG(COALESCE(wtp_amount_low, wtp_amount_high)) as avg_wtp,
-                    MIN(wtp_amount_low) as min_wtp,
-                    MAX(wtp_amount_high) as max_wtp
-                FROM interview_insights
-                WHERE wtp_amount_low IS NOT NULL OR wtp_amount_high IS NOT NULL
-                """
-            ).fetchone()
-
-            return {
-                "total_participants": participants,
-                "total_insights": insights,
-                "avg_insights_per_interview": round(avg_insights, 1),
-                "beta_testers": beta_testers,
-                "insights_with_wtp": wtp_insights,
-                "wtp_rate": round(wtp_insights / insights * 100, 1) if insights > 0 else 0,
-                "avg_wtp_amount": round(wtp_stats["avg_wtp"], 2) if wtp_stats["avg_wtp"] else None,
-                "wtp_range": (wtp_stats["min_wtp"], wtp_stats["max_wtp"]) if wtp_stats["min_wtp"] else None,
-            }
-        finally:
-            conn.close()
+    def _query_interview_stats(self, conn: sqlite3.Connection) -> dict:
+        """Run the overall statistics aggregate queries."""
+        participants = conn.execute(
+            "SELECT COUNT(*) FROM interview_participants"
+        ).fetchone()[0]
+        insights = conn.execute(
+            "SELECT COUNT(*) FROM interview_insights"
+        ).fetchone()[0]
+        beta_testers = conn.execute(
+            "SELECT COUNT(*) FROM interview_participants WHERE beta_tester = TRUE"
+        ).fetchone()[0]
+        wtp_insights = conn.execute(
+            """
+            SELECT COUNT(*) FROM interview_insights
+            WHERE wtp_amount_low IS NOT NULL OR wtp_amount_high IS NOT NULL
+            """
+        ).fetchone()[0]
+
+        # Average insights per interview
+        avg_insights = insights / participants if participants > 0 else 0
+
+        # WTP statistics
+        wtp_stats = conn.execute(
+            """
+            SELECT
+                AVG(COALESCE(wtp_amount_low, wtp_amount_high)) as avg_wtp,
+                MIN(wtp_amount_low) as min_wtp,
+                MAX(wtp_amount_high) as max_wtp
+            FROM interview_insights
+            WHERE wtp_amount_low IS NOT NULL OR wtp_amount_high IS NOT NULL
+            """
+        ).fetchone()
+
+        return {
+            "total_participants": participants,
+            "total_insights": insights,
+            "avg_insights_per_interview": round(avg_insights, 1),
+            "beta_testers": beta_testers,
+            "insights_with_wtp": wtp_insights,
+            "wtp_rate": round(wtp_insights / insights * 100, 1) if insights > 0 else 0,
+            "avg_wtp_amount": round(wtp_stats["avg_wtp"], 2) if wtp_stats["avg_wtp"] else None,
+            "wtp_range": (
+                (wtp_stats["min_wtp"], wtp_stats["max_wtp"]) if wtp_stats["min_wtp"] else None
+            ),
+        }
 
     def generate_correlation_report(self, scraped_categories: set[str]) -> CorrelationReport:
         """Generate a correlation report comparing interview and scraped data.
@@ -9,14 +9,30 @@ Both paths produce a unified Transcript JSON format for downstream processing.
 
 from __future__ import annotations
 
-import json
+import gc
+import hashlib
+import importlib.util
+import mmap
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import dropwhile, takewhile
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional, Union
 
+import orjson
 from pydantic import BaseModel, Field
 
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+# parse_vtt scanner states
+_BLOCK_START, _TIMING, _TEXT, _SKIP = range(4)
+
+# Size cap for cached decoded audio; least recently used files are evicted
+_AUDIO_CACHE_MAX_BYTES = 2 * 1024**3
+
 
 class TranscriptSegment(BaseModel):
     """A single segment of transcribed speech."""
@@ -42,16 +58,19 @@ class Transcript(BaseModel):
     def to_json_file(self, output_path: Path) -> Path:
         """Save transcript to JSON file."""
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            f.write(self.model_dump_json(indent=2))
+        data = self.model_dump(mode="json")
+        output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         return output_path
 
     @classmethod
     def from_json_file(cls, path: Path) -> "Transcript":
         """Load transcript from JSON file."""
-        with open(path) as f:
-            data = json.load(f)
-        return cls(**data)
+        return cls.from_json_bytes(path.read_bytes())
+
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> "Transcript":
+        """Load transcript from JSON-encoded bytes."""
+        return cls.model_validate(orjson.loads(data))
 
 
 def parse_vtt_timestamp(timestamp: str) -> float:
@@ -68,6 +87,83 @@ def parse_vtt_timestamp(timestamp: str) -> float:
         raise ValueError(f"Invalid VTT timestamp: {timestamp}")
 
 
+def _parse_ts(timestamp: str) -> float:
+    """Parse a VTT timestamp by decoding its digits in place.
+
+    Handles the fixed-width ``MM:SS.mmm`` and ``H+:MM:SS.mmm`` forms without
+    splitting or calling ``float()``; anything else falls back to
+    parse_vtt_timestamp.
+    """
+    ts = timestamp.strip()
+    n = len(ts)
+    if n < 9 or ts[n - 4] != "." or ts[n - 7] != ":":
+        return parse_vtt_timestamp(ts)
+    if n == 9:
+        hours_end = 0
+    elif n >= 11 and ts[n - 10] == ":":
+        hours_end = n - 10
+    else:
+        return parse_vtt_timestamp(ts)
+
+    hours = 0
+    for k in range(hours_end):
+        digit = ord(ts[k]) - 48
+        if not 0 <= digit <= 9:
+            return parse_vtt_timestamp(ts)
+        hours = hours * 10 + digit
+
+    # Remaining layout from n - 9: MM ':' SS '.' mmm
+    millis = 0
+    for k in range(n - 9, n):
+        if k == n - 7 or k == n - 4:
+            continue
+        digit = ord(ts[k]) - 48
+        if not 0 <= digit <= 9:
+            return parse_vtt_timestamp(ts)
+        millis = millis * 10 + digit
+
+    # millis now holds MMSSmmm as a single integer
+    minutes, rest = divmod(millis, 100000)
+    return (hours * 3600 + minutes * 60) + rest / 1000
+
+
+def _parse_ts_bytes(ts: bytes) -> Optional[float]:
+    """Decode a fixed-width VTT timestamp straight from its bytes.
+
+    Indexing bytes yields ints, so digits are read without decoding the
+    line. Returns None for any other shape so callers can fall back to
+    _parse_ts on the decoded text.
+    """
+    n = len(ts)
+    if n < 9 or ts[n - 4] != 46 or ts[n - 7] != 58:  # '.' and ':'
+        return None
+    if n == 9:
+        hours_end = 0
+    elif n >= 11 and ts[n - 10] == 58:
+        hours_end = n - 10
+    else:
+        return None
+
+    hours = 0
+    for k in range(hours_end):
+        digit = ts[k] - 48
+        if not 0 <= digit <= 9:
+            return None
+        hours = hours * 10 + digit
+
+    millis = 0
+    for k in range(n - 9, n):
+        if k == n - 7 or k == n - 4:
+            continue
+        digit = ts[k] - 48
+        if not 0 <= digit <= 9:
+            return None
+        millis = millis * 10 + digit
+
+    minutes, rest = divmod(millis, 100000)
+    return (hours * 3600 + minutes * 60) + rest / 1000
+
+
 def parse_vtt(vtt_content: str) -> list[TranscriptSegment]:
     """Parse VTT content into transcript segments.
 
@@ -79,55 +175,192 @@ def parse_vtt(vtt_content: str) -> list[TranscriptSegment]:
 
     00:00:05.500 --> 00:00:12.000
     Second line of speech.
-    """
-    segments = []
 
-    # Split into blocks (separated by blank lines)
-    blocks = re.split(r"\n\s*\n", vtt_content.strip())
-
-    for block in blocks:
-        lines = block.strip().split("\n")
-
-        # Skip header and empty blocks
-        if not lines or lines[0].startswith("WEBVTT") or lines[0].startswith("NOTE"):
+    The content is scanned once, line by line, with a small state machine
+    instead of splitting it into blocks and lines up front.
+    """
+    # Every cue has one arrow, so this bounds the segment count; the list is
+    # filled by index and trimmed at the end instead of grown by appends.
+    segments: list[TranscriptSegment] = [None] * vtt_content.count("-->")
+    count = 0
+    state = _BLOCK_START
+    start = end = 0.0
+    text_lines: list[str] = []
+
+    i = 0
+    n = len(vtt_content)
+    while i < n:
+        nl = vtt_content.find("\n", i)
+        if nl == -1:
+            nl = n
+        line = vtt_content[i:nl].rstrip("\r")
+        i = nl + 1
+
+        if not line or line.isspace():
+            if state == _TEXT:
+                segment = _build_segment(start, end, " ".join(text_lines))
+                if segment is not None:
+                    segments[count] = segment
+                    count += 1
+            state = _BLOCK_START
             continue
 
-        # Find timestamp line (contains "-->")
-        timestamp_line = None
-        text_lines = []
+        if state == _BLOCK_START:
+            # Skip header and note blocks
+            if line.lstrip().startswith(("WEBVTT", "NOTE")):
+                state = _SKIP
+                continue
+            state = _TIMING
+
+        if state == _TIMING:
+            # Cue identifiers may precede the timestamp line
+            arrow = line.find("-->")
+            if arrow == -1:
+                continue
+            try:
+                start = _parse_ts(line[:arrow])
+                # End might have additional cue settings, take only the time part
+                end = _parse_ts(line[arrow + 3:].split()[0])
+            except (ValueError, IndexError):
+                # Skip malformed segments
+                state = _SKIP
+                continue
+            text_lines = []
+            state = _TEXT
+        elif state == _TEXT:
+            text_lines.append(line)
+
+    if state == _TEXT:
+        segment = _build_segment(start, end, " ".join(text_lines))
+        if segment is not None:
+            segments[count] = segment
+            count += 1
+
+    del segments[count:]
+    return segments
+
 
-        for i, line in enumerate(lines):
-            if "-->" in line:
-                timestamp_line = line
-                text_lines = lines[i + 1 :]
-                break
+def parse_vtt_bytes(vtt_data: bytes | mmap.mmap) -> list[TranscriptSegment]:
+    """Parse UTF-8 encoded VTT content into transcript segments.
 
-        if not timestamp_line:
+    Same scanner as parse_vtt, but works on raw bytes (or an mmap) so the
+    file never has to be decoded as a whole; only timing lines and cue text
+    are decoded.
+    """
+    return list(_iter_vtt_bytes(vtt_data))
+
+
+def _iter_vtt_bytes(vtt_data: bytes | mmap.mmap) -> Iterator[TranscriptSegment]:
+    """Yield segments from UTF-8 encoded VTT content as each cue ends."""
+    state = _BLOCK_START
+    start = end = 0.0
+    text_lines: list[bytes] = []
+
+    i = 0
+    n = len(vtt_data)
+    while i < n:
+        nl = vtt_data.find(b"\n", i)
+        if nl == -1:
+            nl = n
+        line = vtt_data[i:nl].rstrip(b"\r")
+        i = nl + 1
+
+        if not line or line.isspace():
+            if state == _TEXT:
+                segment = _build_segment(
+                    start, end, b" ".join(text_lines).decode("utf-8")
+                )
+                if segment is not None:
+                    yield segment
+            state = _BLOCK_START
             continue
 
-        # Parse timestamp
-        try:
-            # Handle optional cue settings after timestamp
-            timestamp_part = timestamp_line.split("-->")
-            start_str = timestamp_part[0].strip()
-            # End might have additional settings, take only the time part
-            end_str = timestamp_part[1].strip().split()[0]
+        if state == _BLOCK_START:
+            if line.lstrip().startswith((b"WEBVTT", b"NOTE")):
+                state = _SKIP
+                continue
+            state = _TIMING
+
+        if state == _TIMING:
+            arrow = line.find(b"-->")
+            if arrow == -1:
+                continue
+            try:
+                start = _parse_ts_bytes(line[:arrow].strip())
+                if start is None:
+                    start = _parse_ts(line[:arrow].decode("utf-8"))
+                end_field = line[arrow + 3:]
+                end_parts = end_field.split(None, 1)
+                end = _parse_ts_bytes(end_parts[0]) if end_parts else None
+                if end is None:
+                    end = _parse_ts(end_field.decode("utf-8").split()[0])
+            except (ValueError, IndexError):
+                state = _SKIP
+                continue
+            text_lines = []
+            state = _TEXT
+        elif state == _TEXT:
+            text_lines.append(line)
+
+    if state == _TEXT:
+        segment = _build_segment(start, end, b" ".join(text_lines).decode("utf-8"))
+        if segment is not None:
+            yield segment
+
+
+def _build_segment(start: float, end: float, text: str) -> Optional[TranscriptSegment]:
+    """Strip inline tags from a cue's joined text; None if nothing is left.
+
+    The scanners only pass floats from the timestamp parsers and decoded
+    str text, so validation is skipped with model_construct.
+    """
+    text = _HTML_TAG.sub("", text).strip()
+    if not text:
+        return None
+    return TranscriptSegment.model_construct(start=start, end=end, text=text)
 
-            start = parse_vtt_timestamp(start_str)
-            end = parse_vtt_timestamp(end_str)
 
-            # Join text lines, removing any HTML-like tags
-            text = " ".join(text_lines)
-            text = re.sub(r"<[^>]+>", "", text)  # Remove HTML tags
-            text = text.strip()
+def iter_vtt_segments(
+    source: Union[str, os.PathLike, BinaryIO],
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+) -> Iterator[TranscriptSegment]:
+    """Yield VTT segments lazily, optionally limited to a time window.
 
-            if text:
-                segments.append(TranscriptSegment(start=start, end=end, text=text))
+    Cues are parsed as they are reached and scanning stops at the first cue
+    starting after ``end``, so a window near the start of a long file only
+    parses that far.
 
-        except (ValueError, IndexError) as e:
-            # Skip malformed segments
-            continue
+    Args:
+        source: Path (str or path-like) to a VTT file, or a binary
+            file-like object
+        start: Skip segments that end before this many seconds
+        end: Stop at the first segment that starts after this many seconds
 
+    Yields:
+        TranscriptSegment objects in file order
+    """
+    if hasattr(source, "read"):
+        yield from _window_segments(_iter_vtt_bytes(source.read()), start, end)
+    else:
+        with open(Path(source), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap cannot map an empty file
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from _window_segments(_iter_vtt_bytes(mm), start, end)
+
+
+def _window_segments(
+    segments: Iterator[TranscriptSegment],
+    start: Optional[float],
+    end: Optional[float],
+) -> Iterator[TranscriptSegment]:
+    """Restrict time-ordered segments to those overlapping [start, end]."""
+    if start is not None:
+        segments = dropwhile(lambda seg: seg.end < start, segments)
+    if end is not None:
+        segments = takewhile(lambda seg: seg.start <= end, segments)
     return segments
 
 
@@ -149,13 +382,10 @@ def import_vtt_file(
     if not vtt_path.exists():
         raise FileNotFoundError(f"VTT file not found: {vtt_path}")
 
-    with open(vtt_path, "r", encoding="utf-8") as f:
-        vtt_content = f.read()
-
-    segments = parse_vtt(vtt_content)
+    segments = list(iter_vtt_segments(vtt_path))
 
     # Build full text from segments
-    full_text = " ".join(seg.text for seg in segments)
+    full_text = " ".join([seg.text for seg in segments])
 
     # Calculate duration from last segment
     duration = segments[-1].end if segments else None
@@ -177,19 +407,46 @@ def import_vtt_file(
     return transcript
 
 
+@lru_cache(maxsize=4)
+def _load_whisper(model_name: str, device: Optional[str] = None):
+    """Load a Whisper model once per (model_name, device) and reuse it."""
+    import whisper
+
+    return whisper.load_model(model_name, device=device)
+
+
+def unload_whisper_cache() -> None:
+    """Drop cached Whisper models and release their memory."""
+    _load_whisper.cache_clear()
+    gc.collect()
+    try:
+        import torch
+    except ImportError:
+        return
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
 def transcribe_audio_whisper(
     audio_path: Path,
     model_name: str = "base",
     participant_id: Optional[str] = None,
     output_dir: Optional[Path] = None,
+    device: Optional[str] = None,
+    use_cache: bool = True,
 ) -> Transcript:
     """Transcribe an audio file using OpenAI Whisper.
 
+    Loaded models are cached across calls; use unload_whisper_cache() to
+    free them.
+
     Args:
         audio_path: Path to the audio file (mp3, wav, m4a, etc.)
         model_name: Whisper model to use ('tiny', 'base', 'small', 'medium', 'large')
         participant_id: Optional participant ID to link
         output_dir: Optional output directory for JSON
+        device: Torch device for the model (defaults to CUDA when available)
+        use_cache: Reuse decoded audio from earlier runs on the same file
 
     Returns:
         Transcript object
@@ -198,38 +455,153 @@ def transcribe_audio_whisper(
         ImportError: If openai-whisper is not installed
         FileNotFoundError: If audio file doesn't exist
     """
-    try:
-        import whisper
-    except ImportError:
-        raise ImportError(
-            "openai-whisper is not installed. Install with: pip install openai-whisper"
-        )
+    _require_whisper()
 
     if not audio_path.exists():
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
     # Load model and transcribe
-    model = whisper.load_model(model_name)
-    result = model.transcribe(str(audio_path))
-
-    # Convert Whisper segments to our format
-    segments = []
-    for seg in result.get("segments", []):
-        segments.append(
-            TranscriptSegment(
-                start=seg["start"],
-                end=seg["end"],
-                text=seg["text"].strip(),
-            )
+    model = _load_whisper(model_name, device)
+    result = model.transcribe(_load_audio(audio_path, use_cache))
+
+    transcript = _whisper_result_to_transcript(result, audio_path, model_name, participant_id)
+
+    # Save to output directory if specified
+    if output_dir:
+        output_path = output_dir / f"{audio_path.stem}.json"
+        transcript.to_json_file(output_path)
+
+    return transcript
+
+
+def transcribe_audio_whisper_batch(
+    audio_paths: list[Path],
+    model_name: str = "base",
+    output_dir: Optional[Path] = None,
+    device: Optional[str] = None,
+    use_cache: bool = True,
+) -> list[Transcript]:
+    """Transcribe several audio files with a single loaded Whisper model.
+
+    JSON output files are written concurrently while the model is kept
+    busy on the next file.
+
+    Args:
+        audio_paths: Paths to the audio files
+        model_name: Whisper model to use ('tiny', 'base', 'small', 'medium', 'large')
+        output_dir: Optional output directory for JSON
+        device: Torch device for the model (defaults to CUDA when available)
+        use_cache: Reuse decoded audio from earlier runs on the same files
+
+    Returns:
+        Transcript objects in the same order as audio_paths
+
+    Raises:
+        ImportError: If openai-whisper is not installed
+        FileNotFoundError: If any audio file doesn't exist
+    """
+    _require_whisper()
+
+    missing = [path for path in audio_paths if not path.exists()]
+    if missing:
+        raise FileNotFoundError(f"Audio file not found: {missing[0]}")
+
+    model = _load_whisper(model_name, device)
+
+    transcripts: list[Transcript] = []
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        writes = []
+        for audio_path in audio_paths:
+            result = model.transcribe(_load_audio(audio_path, use_cache))
+            transcript = _whisper_result_to_transcript(result, audio_path, model_name)
+            transcripts.append(transcript)
+            if output_dir:
+                output_path = output_dir / f"{audio_path.stem}.json"
+                writes.append(pool.submit(transcript.to_json_file, output_path))
+        for write in writes:
+            write.result()
+
+    return transcripts
+
+
+def _load_audio(audio_path: Path, use_cache: bool = True):
+    """Decode audio to Whisper's 16 kHz waveform, reusing a cached copy.
+
+    Decoding shells out to ffmpeg and gives the same waveform for every
+    model, so it is stored as .npy keyed by a hash of the file contents.
+    """
+    import numpy as np
+    import whisper
+
+    if not use_cache:
+        return whisper.load_audio(str(audio_path))
+
+    with open(audio_path, "rb") as f:
+        digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16))
+    cache_dir = _whisper_cache_dir()
+    cached = cache_dir / f"{digest.hexdigest()}.npy"
+    if cached.exists():
+        os.utime(cached)  # Mark as recently used
+        return np.load(cached)
+
+    audio = whisper.load_audio(str(audio_path))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    partial = cached.with_suffix(".partial.npy")
+    np.save(partial, audio)
+    os.replace(partial, cached)
+    _evict_audio_cache(cache_dir, _AUDIO_CACHE_MAX_BYTES)
+    return audio
+
+
+def _whisper_cache_dir() -> Path:
+    """Get the directory holding cached decoded audio."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "shopifly" / "whisper"
+
+
+def _evict_audio_cache(cache_dir: Path, max_bytes: int) -> None:
+    """Delete least recently used cache files beyond max_bytes."""
+    entries = sorted(
+        cache_dir.glob("*.npy"), key=lambda path: path.stat().st_mtime, reverse=True
+    )
+    total = 0
+    for entry in entries:
+        total += entry.stat().st_size
+        if total > max_bytes:
+            entry.unlink(missing_ok=True)
+
+
+def _require_whisper() -> None:
+    """Raise a helpful ImportError if openai-whisper is unavailable."""
+    if importlib.util.find_spec("whisper") is None:
+        raise ImportError(
+            "openai-whisper is not installed. Install with: pip install openai-whisper"
         )
 
+
+def _whisper_result_to_transcript(
+    result: dict,
+    audio_path: Path,
+    model_name: str,
+    participant_id: Optional[str] = None,
+) -> Transcript:
+    """Convert a Whisper transcribe() result into a Transcript."""
+    # Convert Whisper segments to our format; Whisper always emits float
+    # times and str text, so validation is skipped
+    segments = [
+        TranscriptSegment.model_construct(
+            start=seg["start"], end=seg["end"], text=seg["text"].strip()
+        )
+        for seg in result.get("segments", [])
+    ]
+
     # Get full text
     full_text = result.get("text", "").strip()
 
     # Calculate duration from last segment or audio file
     duration = segments[-1].end if segments else None
 
-    transcript = Transcript(
+    return Transcript(
         source_file=str(audio_path),
         method="whisper",
         model=model_name,
@@ -240,20 +612,34 @@ def transcribe_audio_whisper(
         participant_id=participant_id,
     )
 
-    # Save to output directory if specified
-    if output_dir:
-        output_path = output_dir / f"{audio_path.stem}.json"
-        transcript.to_json_file(output_path)
-
-    return transcript
-
 
 def get_default_transcript_dir() -> Path:
     """Get the default transcript output directory."""
+    return _transcript_dir_for(os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _transcript_dir_for(cwd: str) -> Path:
+    """Resolve the transcript directory for a working directory (memoized)."""
     # Try to find project root
-    current = Path.cwd()
+    current = Path(cwd)
     for parent in [current] + list(current.parents):
         if (parent / "pyproject.toml").exists():
             return parent / "data" / "interviews" / "transcripts"
     # Fallback to current directory
     return current / "data" / "interviews" / "transcripts"
+
+
+def load_transcripts(transcript_dir: Path) -> list[Transcript]:
+    """Load every transcript JSON file in a directory.
+
+    Args:
+        transcript_dir: Directory containing transcript JSON files
+
+    Returns:
+        List of Transcript objects, ordered by file name
+    """
+    return [
+        Transcript.from_json_bytes(path.read_bytes())
+        for path in sorted(transcript_dir.glob("*.json"))
+    ]
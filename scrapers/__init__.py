@@ -1,16 +1,25 @@
 """Scrapers for various data sources."""
 
-from .base import BaseScraper, DataSource, RawDataPoint
-from .reddit import RedditScraper
-from .reddit_selenium import RedditSeleniumScraper, scrape_reddit_simple
-from .appstore import AppStoreScraper
-from .twitter import TwitterScraper
-from .community import CommunityScraper
+from importlib import import_module
+
+from .base import BaseScraper, DataSource, RawDataPoint, RawDataPointFast
+
+# Scraper classes are imported on first access so that `import scrapers`
+# does not pull in selenium, praw, tweepy, etc. until they are needed.
+_LAZY_ATTRS = {
+    "RedditScraper": ".reddit",
+    "RedditSeleniumScraper": ".reddit_selenium",
+    "scrape_reddit_simple": ".reddit_selenium",
+    "AppStoreScraper": ".appstore",
+    "TwitterScraper": ".twitter",
+    "CommunityScraper": ".community",
+}
 
 __all__ = [
     "BaseScraper",
     "DataSource",
     "RawDataPoint",
+    "RawDataPointFast",
     "RedditScraper",
     "RedditSeleniumScraper",
     "scrape_reddit_simple",
@@ -18,3 +27,18 @@ __all__ = [
     "TwitterScraper",
     "CommunityScraper",
 ]
+
+
+def __getattr__(name: str):
+    """Import a scraper class from its submodule on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List lazily loaded names alongside the eagerly imported ones."""
+    return sorted(set(globals()) | set(__all__))
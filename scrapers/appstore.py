@@ -3,19 +3,38 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import re
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import AsyncIterator, Optional
 
-from bs4 import BeautifulSoup
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from config import settings
-from .base import BaseScraper, DataSource, RawDataPoint
+from .base import BaseScraper, DataSource, RawDataPoint, build_keyword_automaton
+
+_RATING_RE = re.compile(r"(\d+) out of 5")
+_DATE_RE = re.compile(r"^([A-Z][a-z]+ \d{1,2}, \d{4})")
+_SHOW_MORE_RE = re.compile(r"Show (more|less).*$", re.IGNORECASE)
+_EDITED_RE = re.compile(r"^\s*Edited\s*")
+_RELATIVE_DATE_RE = re.compile(r"(\d+)\s*(day|week|month|year)s?\s*ago")
+
+# Review containers, and the star rating inside each one
+_REVIEW_CONTAINER_SELECTOR = ".tw-order-2, .lg\\:tw-col-span-3"
+_STAR_SELECTOR = '[aria-label*="out of 5 stars"]'
+# Only review containers (and their subtrees) are built when parsing a page.
+# Matched by regex because class is still a raw string at strain time.
+_REVIEW_STRAINER = SoupStrainer(
+    class_=re.compile(r"(?:^|\s)(?:tw-order-2|lg:tw-col-span-3)(?:\s|$)")
+)
 
 
 class AppStoreScraper(BaseScraper):
@@ -43,37 +62,111 @@ class AppStoreScraper(BaseScraper):
         "digital-downloads",       # Digital Downloads
     ]
 
-    def __init__(self, headless: bool = True):
+    # Phrases that flag issues in otherwise positive reviews
+    PAIN_WORDS = [
+        "but", "however", "wish", "missing", "would be nice",
+        "only issue", "could be better", "needs improvement",
+        "frustrating", "annoying", "difficult", "confusing",
+        "doesn't work", "not working", "broken", "bug",
+    ]
+    _PAIN_RE = re.compile("|".join(map(re.escape, PAIN_WORDS)), re.IGNORECASE)
+    _PAIN_AUTOMATON = build_keyword_automaton(PAIN_WORDS)
+
+    # Seconds to wait for review stars to render before parsing anyway
+    PAGE_LOAD_TIMEOUT = 10
+
+    def __init__(
+        self,
+        headless: bool = True,
+        max_workers: int = 3,
+        seen_ids_path: Optional[Path] = None,
+    ):
         """Initialize the scraper.
 
         Args:
             headless: Run browser in headless mode (default True).
+            max_workers: Number of browsers used to scrape apps concurrently.
+            seen_ids_path: Optional JSON file used to remember review IDs
+                across runs so already-seen reviews are skipped.
         """
         self.headless = headless
+        self.max_workers = max_workers
+        self.seen_ids_path = seen_ids_path
+        self._seen_review_ids: dict[str, set[str]] = {}
         self._driver: Optional[webdriver.Chrome] = None
+        self._drivers: list[webdriver.Chrome] = []
+        self._idle_drivers: list[webdriver.Chrome] = []
+        # Selenium calls still running in worker threads; see _in_thread
+        self._thread_calls: set[asyncio.Future] = set()
+
+    def _create_driver(self) -> webdriver.Chrome:
+        """Start a new Selenium WebDriver."""
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument(
+            "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        )
+        return webdriver.Chrome(options=options)
 
     def _get_driver(self) -> webdriver.Chrome:
         """Get or create the Selenium WebDriver."""
         if self._driver is None:
-            options = Options()
-            if self.headless:
-                options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument(
-                "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            )
-            self._driver = webdriver.Chrome(options=options)
+            self._driver = self._create_driver()
         return self._driver
 
+    def _create_pooled_driver(self) -> webdriver.Chrome:
+        """Start a driver and register it in the pool for _close_driver."""
+        driver = self._create_driver()
+        self._drivers.append(driver)
+        return driver
+
+    async def _acquire_driver(self) -> webdriver.Chrome:
+        """Take an idle pooled driver, starting a new one if none is free."""
+        if self._idle_drivers:
+            return self._idle_drivers.pop()
+        return await self._in_thread(self._create_pooled_driver)
+
+    async def _in_thread(self, func, *args):
+        """Run a blocking Selenium call in a worker thread.
+
+        Cancelling the caller does not stop the thread, so each call is
+        tracked until it returns and _wait_for_threads can hold off quitting
+        a driver that is still in use.
+        """
+        call = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        self._thread_calls.add(call)
+        call.add_done_callback(self._forget_thread_call)
+        return await asyncio.shield(call)
+
+    def _forget_thread_call(self, call: asyncio.Future) -> None:
+        """Drop a finished thread call, retrieving any exception it raised."""
+        self._thread_calls.discard(call)
+        if not call.cancelled():
+            call.exception()
+
+    async def _wait_for_threads(self) -> None:
+        """Wait for in-flight Selenium calls to return."""
+        if self._thread_calls:
+            await asyncio.wait(set(self._thread_calls))
+
     def _close_driver(self) -> None:
-        """Close the WebDriver if open."""
+        """Close the WebDriver and any pooled drivers."""
         if self._driver:
             self._driver.quit()
             self._driver = None
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._drivers.clear()
+        self._idle_drivers.clear()
 
     async def health_check(self) -> bool:
         """Check if we can access the Shopify App Store."""
@@ -97,37 +190,94 @@ class AppStoreScraper(BaseScraper):
         Yields:
             RawDataPoint for each review.
         """
+        self._batch_ts = datetime.utcnow()
         reviews_per_app = max(1, limit // len(self.TARGET_APPS))
         total_scraped = 0
+        self._seen_review_ids = self._load_seen_review_ids()
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        # Apps are scraped concurrently, one pooled browser per worker;
+        # reviews are yielded as each app finishes.
+        tasks = [
+            asyncio.create_task(
+                self._collect_app_reviews(app_slug, reviews_per_app, semaphore)
+            )
+            for app_slug in self.TARGET_APPS[:limit]
+        ]
 
         try:
-            for app_slug in self.TARGET_APPS:
-                if total_scraped >= limit:
-                    break
-
-                try:
-                    async for review in self._scrape_app_reviews(
-                        app_slug,
-                        min(reviews_per_app, limit - total_scraped)
-                    ):
-                        yield review
-                        total_scraped += 1
-                        if total_scraped >= limit:
-                            break
-                except Exception as e:
-                    print(f"Error scraping app {app_slug}: {e}")
-                    continue
+            for next_done in asyncio.as_completed(tasks):
+                for review in await next_done:
+                    yield review
+                    total_scraped += 1
+                    if total_scraped >= limit:
+                        return
         finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._wait_for_threads()
             self._close_driver()
 
+    async def _collect_app_reviews(
+        self, app_slug: str, limit: int, semaphore: asyncio.Semaphore
+    ) -> list[RawDataPoint]:
+        """Scrape one app's reviews on a pooled driver.
+
+        Args:
+            app_slug: The app's URL slug.
+            limit: Maximum reviews to scrape for this app.
+            semaphore: Bounds how many apps are scraped at once.
+
+        Returns:
+            List of RawDataPoint objects (empty if the app failed).
+        """
+        async with semaphore:
+            driver = None
+            try:
+                driver = await self._acquire_driver()
+                return [
+                    review
+                    async for review in self._scrape_app_reviews(app_slug, limit, driver)
+                ]
+            except Exception as e:
+                print(f"Error scraping app {app_slug}: {e}")
+                return []
+            finally:
+                if driver is not None:
+                    self._idle_drivers.append(driver)
+
+    def _load_reviews_page(self, driver: webdriver.Chrome, url: str) -> str:
+        """Navigate to a reviews page and return its HTML once stars render.
+
+        Args:
+            driver: WebDriver to load the page with.
+            url: Reviews page URL.
+
+        Returns:
+            Rendered page source.
+        """
+        driver.get(url)
+        try:
+            WebDriverWait(driver, self.PAGE_LOAD_TIMEOUT).until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, '[aria-label*="out of 5 stars"]')
+                )
+            )
+        except TimeoutException:
+            # Filters with no reviews never render stars; parse what we have
+            pass
+        return driver.page_source
+
     async def _scrape_app_reviews(
-        self, app_slug: str, limit: int
+        self, app_slug: str, limit: int, driver: Optional[webdriver.Chrome] = None
     ) -> AsyncIterator[RawDataPoint]:
         """Scrape reviews for a specific app.
 
         Args:
             app_slug: The app's URL slug.
             limit: Maximum reviews to scrape for this app.
+            driver: WebDriver to use (defaults to the scraper's own driver).
 
         Yields:
             RawDataPoint for each review.
@@ -135,9 +285,10 @@ class AppStoreScraper(BaseScraper):
         app_url = f"{self.BASE_URL}/{app_slug}"
         reviews_url = f"{app_url}/reviews"
         reviews_scraped = 0
-        seen_review_ids: set[str] = set()
+        seen_review_ids = self._seen_review_ids.setdefault(app_slug, set())
 
-        driver = self._get_driver()
+        if driver is None:
+            driver = self._get_driver()
 
         # Start with 1-star reviews to get pain points first
         rating_filters = [1, 2, 3, 4, 5]
@@ -149,12 +300,13 @@ class AppStoreScraper(BaseScraper):
             filter_url = f"{reviews_url}?ratings%5B%5D={rating_filter}"
 
             try:
-                driver.get(filter_url)
-                # Wait for reviews to load
-                await asyncio.sleep(3)
+                # Selenium calls block, so run them off the event loop
+                page_source = await self._in_thread(
+                    self._load_reviews_page, driver, filter_url
+                )
 
                 # Parse the rendered HTML
-                soup = BeautifulSoup(driver.page_source, "html.parser")
+                soup = BeautifulSoup(page_source, "lxml", parse_only=_REVIEW_STRAINER)
                 reviews = self._extract_reviews_from_soup(soup, app_slug, app_url)
 
                 for review in reviews:
@@ -191,29 +343,36 @@ class AppStoreScraper(BaseScraper):
             List of RawDataPoint objects.
         """
         reviews: list[RawDataPoint] = []
-
-        # Find all star rating elements (skip first 2 which are app summary)
-        star_elements = soup.find_all(
-            attrs={"aria-label": lambda x: x and "out of 5 stars" in x}
-        )[2:]  # Skip app-level ratings
-
-        for star_el in star_elements:
+        claimed_stars: set[int] = set()
+
+        # Select review containers directly; app summary ratings sit outside
+        # them. Visit in reverse document order so nested containers come
+        # before their ancestors and each star pairs with its nearest one.
+        for container in reversed(soup.select(_REVIEW_CONTAINER_SELECTOR)):
+            star_el = container.select_one(_STAR_SELECTOR)
+            if star_el is None or id(star_el) in claimed_stars:
+                continue
+            claimed_stars.add(id(star_el))
             try:
-                datapoint = self._parse_review_element(star_el, app_slug, app_url)
+                datapoint = self._parse_review_element(
+                    container, star_el, app_slug, app_url
+                )
                 if datapoint:
                     reviews.append(datapoint)
             except Exception as e:
                 print(f"Error parsing review element: {e}")
                 continue
 
+        reviews.reverse()
         return reviews
 
     def _parse_review_element(
-        self, star_element, app_slug: str, app_url: str
+        self, container, star_element, app_slug: str, app_url: str
     ) -> Optional[RawDataPoint]:
-        """Parse a single review from its star rating element.
+        """Parse a single review from its container element.
 
         Args:
+            container: BeautifulSoup element wrapping the whole review.
             star_element: BeautifulSoup element containing the star rating.
             app_slug: The app's URL slug.
             app_url: The app's full URL.
@@ -223,30 +382,16 @@ class AppStoreScraper(BaseScraper):
         """
         # Extract rating from aria-label
         rating_text = star_element.get("aria-label", "")
-        rating_match = re.search(r"(\d+) out of 5", rating_text)
+        rating_match = _RATING_RE.search(rating_text)
         rating = int(rating_match.group(1)) if rating_match else 0
 
-        # Navigate up to find the review container
-        parent = star_element
-        for _ in range(15):
-            parent = parent.parent
-            if parent is None:
-                return None
-            classes = parent.get("class", [])
-            # Look for the review container class
-            if "tw-order-2" in classes or "lg:tw-col-span-3" in classes:
-                break
-
-        if parent is None:
-            return None
-
         # Extract text content
-        text = parent.get_text(separator=" ", strip=True)
+        text = container.get_text(separator=" ", strip=True)
         if not text or len(text) < 10:
             return None
 
         # Extract date (format: "Month DD, YYYY" at the beginning)
-        date_match = re.search(r"^([A-Z][a-z]+ \d{1,2}, \d{4})", text)
+        date_match = _DATE_RE.search(text)
         date_str = date_match.group(1) if date_match else ""
 
         # Extract review content (everything after date)
@@ -255,14 +400,15 @@ class AppStoreScraper(BaseScraper):
             content = text[len(date_str):].strip()
 
         # Clean up "Show more/less" and other UI text
-        content = re.sub(r"Show (more|less).*$", "", content, flags=re.IGNORECASE).strip()
-        content = re.sub(r"^\s*Edited\s*", "", content).strip()
+        content = _SHOW_MORE_RE.sub("", content).strip()
+        content = _EDITED_RE.sub("", content).strip()
 
         if not content or len(content) < 10:
             return None
 
-        # Generate unique ID from content hash
-        review_id = f"{app_slug}_{hash(content)}"
+        # Generate a stable unique ID from content hash
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+        review_id = f"{app_slug}_{digest}"
 
         return RawDataPoint(
             source=self.source,
@@ -272,6 +418,7 @@ class AppStoreScraper(BaseScraper):
             content=content,
             author="Anonymous",  # Author info not readily available in new UI
             created_at=self._parse_date(date_str),
+            scraped_at=self._scraped_at(),
             metadata={
                 "app_slug": app_slug,
                 "rating": rating,
@@ -306,7 +453,7 @@ class AppStoreScraper(BaseScraper):
         if "today" in date_str_lower or "just now" in date_str_lower:
             return now
 
-        match = re.search(r"(\d+)\s*(day|week|month|year)s?\s*ago", date_str_lower)
+        match = _RELATIVE_DATE_RE.search(date_str_lower)
         if match:
             amount = int(match.group(1))
             unit = match.group(2)
@@ -337,15 +484,28 @@ class AppStoreScraper(BaseScraper):
             return True
 
         # Also include higher-rated reviews that mention issues
-        pain_words = [
-            "but", "however", "wish", "missing", "would be nice",
-            "only issue", "could be better", "needs improvement",
-            "frustrating", "annoying", "difficult", "confusing",
-            "doesn't work", "not working", "broken", "bug",
-        ]
-        content_lower = datapoint.content.lower()
-        return any(word in content_lower for word in pain_words)
+        if self._PAIN_AUTOMATON is not None:
+            matches = self._PAIN_AUTOMATON.iter(datapoint.content.lower())
+            return next(matches, None) is not None
+        return self._PAIN_RE.search(datapoint.content) is not None
+
+    def _load_seen_review_ids(self) -> dict[str, set[str]]:
+        """Load review IDs seen in previous runs, keyed by app slug."""
+        if self.seen_ids_path is None or not self.seen_ids_path.exists():
+            return {}
+        data = orjson.loads(self.seen_ids_path.read_bytes())
+        return {app_slug: set(ids) for app_slug, ids in data.items()}
+
+    def _save_seen_review_ids(self) -> None:
+        """Persist seen review IDs so the next run can skip them."""
+        if self.seen_ids_path is None:
+            return
+        self.seen_ids_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {app_slug: sorted(ids) for app_slug, ids in self._seen_review_ids.items()}
+        self.seen_ids_path.write_bytes(orjson.dumps(data))
 
     async def close(self) -> None:
-        """Close the browser."""
+        """Close the browser and persist seen review IDs."""
+        await self._wait_for_threads()
         self._close_driver()
+        self._save_seen_review_ids()
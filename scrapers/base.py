@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from typing import AsyncIterator
 
 from pydantic import BaseModel, Field
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def build_keyword_automaton(words: list[str]):
+    """Build an Aho-Corasick automaton over lowercase words.
+
+    Returns None when pyahocorasick is not installed, in which case callers
+    fall back to a compiled regex.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word.lower(), word)
+    automaton.make_automaton()
+    return automaton
+
 
 class DataSource(str, Enum):
     """Enumeration of data sources."""
@@ -40,11 +63,107 @@ class RawDataPoint(BaseModel):
         return self.content
 
 
+@dataclass(slots=True, frozen=True)
+class RawDataPointFast:
+    """Slotted, unvalidated counterpart of RawDataPoint.
+
+    For holding large batches in memory; convert with to_model() where a
+    validated RawDataPoint is needed.
+    """
+
+    source: DataSource
+    source_id: str
+    url: str
+    content: str
+    created_at: datetime
+    title: str | None = None
+    author: str | None = None
+    scraped_at: datetime = field(default_factory=datetime.utcnow)
+    metadata: dict = field(default_factory=dict)
+
+    @property
+    def full_text(self) -> str:
+        """Combine title and content for analysis."""
+        if self.title:
+            return f"{self.title}\n\n{self.content}"
+        return self.content
+
+    @classmethod
+    def from_model(cls, datapoint: RawDataPoint) -> RawDataPointFast:
+        """Copy a RawDataPoint's fields into the slotted form."""
+        return cls(**dict(datapoint))
+
+    def to_model(self, validate: bool = False) -> RawDataPoint:
+        """Convert to a RawDataPoint.
+
+        Args:
+            validate: Run pydantic validation instead of trusting the fields.
+        """
+        values = {f.name: getattr(self, f.name) for f in fields(self)}
+        if validate:
+            return RawDataPoint.model_validate(values)
+        return RawDataPoint.model_construct(**values)
+
+
+class RateLimiter:
+    """Async token bucket spacing requests interval seconds apart on average.
+
+    Up to burst requests may start back to back while tokens are banked;
+    after that each waits only as long as the budget requires, instead of
+    sleeping a fixed delay after every request. Waiters are served in
+    arrival order.
+    """
+
+    def __init__(self, interval: float, burst: int = 1):
+        """Initialize the limiter.
+
+        Args:
+            interval: Seconds per token; 0 or less disables limiting.
+            burst: Most tokens that can be banked, starting full.
+        """
+        self.interval = interval
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        if self.interval <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) / self.interval
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.interval)
+
+    async def __aenter__(self) -> RateLimiter:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
 class BaseScraper(ABC):
     """Abstract base class for all scrapers."""
 
     source: DataSource
 
+    # Set once at the start of each scrape() and stamped on every datapoint
+    # of that batch as scraped_at
+    _batch_ts: datetime | None = None
+
+    def _scraped_at(self) -> datetime:
+        """Timestamp for datapoints of the current scrape batch."""
+        return self._batch_ts or datetime.utcnow()
+
     @abstractmethod
     async def scrape(self, limit: int = 100) -> AsyncIterator[RawDataPoint]:
         """Scrape data from the source.
@@ -4,16 +4,233 @@ from __future__ import annotations
 
 import asyncio
 import re
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
 from typing import AsyncIterator
 from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from config import settings
-from .base import BaseScraper, DataSource, RawDataPoint
+from .base import BaseScraper, DataSource, RateLimiter, RawDataPoint
+from .page_cache import PageCache
+
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+_TOPIC_ID_RE = re.compile(r"/t/[^/]+/(\d+)")
+_DIGITS_RE = re.compile(r"\d+")
+_REL_DATE_RE = re.compile(r"(\d+)\s*(day|week|month|year|hour|minute)s?\s*ago")
+_UNIT_DELTAS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365),
+}
+
+# CSS selectors compiled once rather than on every page
+_TOPIC_LINKS = sv.compile("a.topic-title, a.title, .topic-list-item a")
+_TOPIC_LINKS_ALT = sv.compile("[data-topic-id] a, .topic-link")
+# Only the subtrees _TOPIC_LINKS can match are built when parsing a board
+# page. Matched by regex because class is still a raw string at strain time.
+_TOPIC_LINK_STRAINER = SoupStrainer(
+    class_=re.compile(r"(?:^|\s)(?:topic-title|title|topic-list-item)(?:\s|$)")
+)
+
+
+def _has_class(*names: str) -> str:
+    """Build an XPath predicate matching elements with any of the classes."""
+    return " or ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+        for name in names
+    )
+
+
+# Topic pages are read with lxml directly; these XPaths mirror the CSS
+# selectors the forum layouts need and are compiled once.
+
+# Single-value fields of a topic page as (tags, classes, attribute) that
+# identify them. One XPath collects every candidate in document order and
+# each field takes its first match, instead of a tree walk per field.
+_HEADER_FIELDS = {
+    "title": (("h1",), ("topic-title", "thread-title"), None),
+    "author": (
+        (),
+        ("author-name", "username", "user-link", "lia-user-name-link"),
+        "data-user-card",
+    ),
+    "date": (("time",), ("post-date", "relative-date", "DateTime"), None),
+    "reply_count": ((), ("reply-count", "replies"), None),
+    "views": ((), ("view-count", "views"), None),
+    "likes": ((), ("like-count", "likes"), None),
+}
+_HEADER_NODES = etree.XPath(
+    "//*[%s]"
+    % " or ".join(
+        [f"self::{tag}" for tags, _, _ in _HEADER_FIELDS.values() for tag in tags]
+        + [f"@{attr}" for _, _, attr in _HEADER_FIELDS.values() if attr]
+        + [_has_class(*classes) for _, classes, _ in _HEADER_FIELDS.values()]
+    )
+)
+# Post body selectors for different forum layouts, tried in order
+_POST_BODIES = [
+    etree.XPath(f"//*[{_has_class(name)}]")
+    for name in (
+        "post-body",
+        "topic-body",
+        "message-body",
+        "cooked",
+        "lia-message-body-content",
+        "MessageBody",
+        "message-content",
+    )
+] + [etree.XPath(f"//article//*[{_has_class('content')}]")]
+_ARTICLE = etree.XPath("//article")
+_REPLY_AUTHOR = etree.XPath(
+    "(.//*[%s])[1]"
+    % _has_class("author-name", "username", "user-link", "lia-user-name-link", "UserName")
+)
+
+
+def _make_soup(html: str, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+    """Parse HTML with lxml, optionally keeping only strained subtrees."""
+    return BeautifulSoup(html, "lxml", parse_only=parse_only)
+
+
+def _first(xpath: etree.XPath, node: etree._Element) -> etree._Element | None:
+    """Return the first element an XPath selects, or None."""
+    found = xpath(node)
+    return found[0] if found else None
+
+
+def _text(elem: etree._Element) -> str:
+    """Join an element's stripped text nodes, like bs4's get_text(strip=True)."""
+    return "".join(text.strip() for text in elem.itertext())
+
+
+def _header_elements(tree: etree._Element) -> dict[str, etree._Element]:
+    """Find the first element for each of _HEADER_FIELDS in one pass."""
+    found = {}
+    for elem in _HEADER_NODES(tree):
+        classes = (elem.get("class") or "").split()
+        for field, (tags, names, attr) in _HEADER_FIELDS.items():
+            if field in found:
+                continue
+            if (
+                elem.tag in tags
+                or (attr and elem.get(attr) is not None)
+                or any(name in classes for name in names)
+            ):
+                found[field] = elem
+        if len(found) == len(_HEADER_FIELDS):
+            break
+    return found
+
+
+def _number(elem: etree._Element | None) -> int:
+    """Extract the first number from an element's text, or 0."""
+    if elem is not None:
+        number = _DIGITS_RE.search(_text(elem))
+        if number:
+            return int(number.group())
+    return 0
+
+
+def _parse_topic_html(html: str) -> dict | None:
+    """Extract the fields of a topic page.
+
+    Kept at module level so it can run in a worker process.
+
+    Args:
+        html: Topic page HTML.
+
+    Returns:
+        Dict of title, content, author, raw date string, replies and counts,
+        or None if the page has no opening post.
+    """
+    tree = lxml.html.document_fromstring(html)
+    # bs4 leaves script and style text out of get_text(); match that
+    etree.strip_elements(tree, "script", "style", with_tail=False)
+
+    header = _header_elements(tree)
+
+    # Extract title
+    title_elem = header.get("title")
+    title = _text(title_elem) if title_elem is not None else ""
+
+    # Extract ALL posts in the thread (OP + replies)
+    # Try multiple selectors for different forum layouts
+    all_posts = []
+    for selector in _POST_BODIES:
+        posts = selector(tree)
+        if posts:
+            all_posts = posts
+            break
+
+    # If no posts found with specific selectors, try article tags
+    if not all_posts:
+        all_posts = _ARTICLE(tree)
+
+    if not all_posts:
+        return None
+
+    # First post is the OP
+    content = _text(all_posts[0])
+
+    if not content:
+        return None
+
+    # Extract replies (all posts after the first)
+    replies_content = []
+    for i, post_elem in enumerate(all_posts[1:], start=1):
+        reply_text = _text(post_elem)
+        if reply_text and len(reply_text) > 5:  # Skip empty/trivial replies
+            # Try to extract reply author
+            reply_author = "Anonymous"
+            # Look for author in parent/sibling elements
+            parent = post_elem.getparent()
+            for _ in range(5):
+                if parent is None:
+                    break
+                author_elem = _first(_REPLY_AUTHOR, parent)
+                if author_elem is not None:
+                    reply_author = _text(author_elem)
+                    break
+                parent = parent.getparent()
+
+            replies_content.append({
+                "author": reply_author,
+                "content": reply_text,
+                "position": i,
+            })
+
+    # Extract OP author
+    author_elem = header.get("author")
+    author = _text(author_elem) if author_elem is not None else "Anonymous"
+
+    # Extract date (parsed relative to now by the caller)
+    date_elem = header.get("date")
+    date_str = date_elem.get("datetime") or _text(date_elem) if date_elem is not None else ""
+
+    return {
+        "title": title,
+        "content": content,
+        "author": author,
+        "date_str": date_str,
+        "replies": replies_content,
+        "reply_count": _number(header.get("reply_count")),
+        "views": _number(header.get("views")),
+        "likes": _number(header.get("likes")),
+    }
 
 
 class CommunityScraper(BaseScraper):
@@ -53,16 +270,51 @@ class CommunityScraper(BaseScraper):
         "suggestion",
         "alternative",
     ]
+    _PAIN_RE = re.compile("|".join(map(re.escape, PAIN_KEYWORDS)), re.IGNORECASE)
+
+    # Board listing pages fetched speculatively per round trip
+    BOARD_PAGE_PREFETCH = 3
 
-    def __init__(self):
-        self.client = httpx.AsyncClient(
+    # Maximum requests in flight against the forum at once
+    MAX_CONCURRENT_REQUESTS = 4
+
+    # Worker processes parsing topic pages off the event loop
+    PARSE_WORKERS = 2
+
+    # Seconds a cached page is used without asking the forum again
+    BOARD_CACHE_TTL = 24 * 60 * 60
+    TOPIC_CACHE_TTL = 7 * 24 * 60 * 60
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        cache_path: str | None = None,
+    ):
+        """Initialize the scraper.
+
+        Args:
+            client: HTTP client to share with other callers. The scraper
+                creates and owns one if not given; a shared client is left
+                open by close().
+            cache_path: SQLite file caching fetched pages. Defaults to
+                settings.scraper_cache_path; caching is off if neither is set.
+        """
+        if cache_path is None:
+            cache_path = settings.scraper_cache_path
+        self._page_cache = PageCache(cache_path) if cache_path else None
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
             headers={
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
                 "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             },
             timeout=30.0,
             follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=40, max_keepalive_connections=20),
         )
+        self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._parse_pool: ProcessPoolExecutor | None = None
 
     async def health_check(self) -> bool:
         """Check if we can access the Shopify Community."""
@@ -81,6 +333,7 @@ class CommunityScraper(BaseScraper):
         Yields:
             RawDataPoint for each relevant post.
         """
+        self._batch_ts = datetime.utcnow()
         posts_per_board = max(10, limit // len(self.BOARDS))
         total_scraped = 0
 
@@ -113,50 +366,72 @@ class CommunityScraper(BaseScraper):
         board_url = urljoin(self.BASE_URL, board_path)
         page = 1
         posts_scraped = 0
+        prefetched: list[str | None] = []
+        limiter = RateLimiter(settings.request_delay_seconds)
 
         while posts_scraped < limit:
             try:
-                # Fetch board listing page
-                html = await self._fetch_page(f"{board_url}?page={page}")
+                # Fetch the next few listing pages at once; results are
+                # consumed in order and the scan stops at the first empty one
+                if not prefetched:
+                    prefetched = list(await asyncio.gather(*[
+                        self._fetch_page(
+                            f"{board_url}?page={p}", max_age=self.BOARD_CACHE_TTL
+                        )
+                        for p in range(page, page + self.BOARD_PAGE_PREFETCH)
+                    ]))
+                html = prefetched.pop(0)
                 if not html:
                     break
 
-                soup = BeautifulSoup(html, "html.parser")
+                soup = _make_soup(html, parse_only=_TOPIC_LINK_STRAINER)
 
                 # Find topic links (adjust selectors based on actual HTML structure)
-                topics = soup.select("a.topic-title, a.title, .topic-list-item a")
+                topics = _TOPIC_LINKS.select(soup)
 
                 if not topics:
-                    # Try alternative selectors
-                    topics = soup.select("[data-topic-id] a, .topic-link")
+                    # Try alternative selectors; these need the whole page
+                    topics = _TOPIC_LINKS_ALT.select(_make_soup(html))
 
                 if not topics:
                     break
 
-                for topic in topics:
+                # Only fetch as many topics as are still wanted
+                topic_urls = [
+                    urljoin(self.BASE_URL, topic.get("href"))
+                    for topic in topics
+                    if topic.get("href")
+                ][: limit - posts_scraped]
+
+                # Fetch and parse the page's topics together; the limiter keeps
+                # topic requests request_delay_seconds apart and the request
+                # semaphore bounds how many hit the forum at once
+                datapoints = await asyncio.gather(
+                    *[
+                        self._scrape_topic_paced(topic_url, limiter)
+                        for topic_url in topic_urls
+                    ]
+                )
+                for datapoint in datapoints:
                     if posts_scraped >= limit:
                         break
-
-                    topic_url = topic.get("href", "")
-                    if not topic_url:
-                        continue
-
-                    topic_url = urljoin(self.BASE_URL, topic_url)
-
-                    # Fetch and parse the topic
-                    datapoint = await self._scrape_topic(topic_url)
                     if datapoint and self._is_relevant(datapoint):
                         yield datapoint
                         posts_scraped += 1
 
-                    await asyncio.sleep(settings.request_delay_seconds)
-
                 page += 1
 
             except Exception as e:
                 print(f"Error on page {page} of {board_path}: {e}")
                 break
 
+    async def _scrape_topic_paced(
+        self, topic_url: str, limiter: RateLimiter
+    ) -> RawDataPoint | None:
+        """Scrape a topic once the limiter allows another request."""
+        await limiter.acquire()
+        return await self._scrape_topic(topic_url)
+
     async def _scrape_topic(self, topic_url: str) -> RawDataPoint | None:
         """Scrape a single topic/thread including all replies.
 
@@ -167,108 +442,33 @@ class CommunityScraper(BaseScraper):
             RawDataPoint if successfully scraped, None otherwise.
         """
         try:
-            html = await self._fetch_page(topic_url)
+            html = await self._fetch_page(topic_url, max_age=self.TOPIC_CACHE_TTL)
             if not html:
                 return None
 
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Extract title
-            title_elem = soup.select_one("h1, .topic-title, .thread-title")
-            title = title_elem.get_text(strip=True) if title_elem else ""
-
-            # Extract ALL posts in the thread (OP + replies)
-            # Try multiple selectors for different forum layouts
-            post_selectors = [
-                ".post-body",
-                ".topic-body",
-                ".message-body",
-                ".cooked",
-                ".lia-message-body-content",
-                ".MessageBody",
-                ".message-content",
-                "article .content",
-            ]
-
-            all_posts = []
-            for selector in post_selectors:
-                posts = soup.select(selector)
-                if posts:
-                    all_posts = posts
-                    break
-
-            # If no posts found with specific selectors, try article tags
-            if not all_posts:
-                all_posts = soup.select("article")
-
-            if not all_posts:
-                return None
-
-            # First post is the OP
-            content = all_posts[0].get_text(strip=True) if all_posts else ""
-
-            if not content:
+            fields = await self._parse_topic(html)
+            if fields is None:
                 return None
-
-            # Extract replies (all posts after the first)
-            replies_content = []
-            for i, post_elem in enumerate(all_posts[1:], start=1):
-                reply_text = post_elem.get_text(strip=True)
-                if reply_text and len(reply_text) > 5:  # Skip empty/trivial replies
-                    # Try to extract reply author
-                    reply_author = "Anonymous"
-                    # Look for author in parent/sibling elements
-                    parent = post_elem.parent
-                    for _ in range(5):
-                        if parent is None:
-                            break
-                        author_elem = parent.select_one(
-                            ".author-name, .username, .user-link, .lia-user-name-link, .UserName"
-                        )
-                        if author_elem:
-                            reply_author = author_elem.get_text(strip=True)
-                            break
-                        parent = parent.parent
-
-                    replies_content.append({
-                        "author": reply_author,
-                        "content": reply_text,
-                        "position": i,
-                    })
-
-            # Extract OP author
-            author_elem = soup.select_one(
-                ".author-name, .username, .user-link, [data-user-card], .lia-user-name-link"
-            )
-            author = author_elem.get_text(strip=True) if author_elem else "Anonymous"
-
-            # Extract date
-            date_elem = soup.select_one("time, .post-date, .relative-date, .DateTime")
-            date_str = date_elem.get("datetime") or date_elem.get_text(strip=True) if date_elem else ""
-            created_at = self._parse_date(date_str)
-
-            # Extract metadata
-            reply_count = self._extract_number(soup, ".reply-count, .replies")
-            views = self._extract_number(soup, ".view-count, .views")
-            likes = self._extract_number(soup, ".like-count, .likes")
+            created_at = self._parse_date(fields.pop("date_str"))
 
             # Generate unique ID from URL
-            topic_id = re.search(r"/t/[^/]+/(\d+)", topic_url)
+            topic_id = _TOPIC_ID_RE.search(topic_url)
             source_id = topic_id.group(1) if topic_id else str(hash(topic_url))
 
-            return RawDataPoint(
+            return RawDataPoint.model_construct(
                 source=self.source,
                 source_id=f"community_{source_id}",
                 url=topic_url,
-                title=title,
-                content=content,
-                author=author,
+                title=fields["title"],
+                content=fields["content"],
+                author=fields["author"],
                 created_at=created_at,
+                scraped_at=self._scraped_at(),
                 metadata={
-                    "reply_count": reply_count,
-                    "replies": replies_content,
-                    "views": views,
-                    "likes": likes,
+                    "reply_count": fields["reply_count"],
+                    "replies": fields["replies"],
+                    "views": fields["views"],
+                    "likes": fields["likes"],
                     "type": "topic",
                 },
             )
@@ -277,37 +477,60 @@ class CommunityScraper(BaseScraper):
             print(f"Error scraping topic {topic_url}: {e}")
             return None
 
+    async def _parse_topic(self, html: str) -> dict | None:
+        """Parse a topic page in the worker pool, creating it on first use."""
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.PARSE_WORKERS)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._parse_pool, _parse_topic_html, html)
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def _fetch_page(self, url: str) -> str | None:
-        """Fetch a page with retry logic."""
-        response = await self.client.get(url)
+    async def _fetch_page(self, url: str, max_age: float = 0) -> str | None:
+        """Fetch a page with retry logic.
+
+        With the page cache enabled, a page cached less than max_age seconds
+        ago is returned without a request, and an older one is revalidated
+        with If-Modified-Since.
+        """
+        cached = self._page_cache.get(url) if self._page_cache else None
+        if cached and cached.is_fresh(max_age):
+            return cached.body
+
+        headers = {}
+        if cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        async with self._request_semaphore:
+            if headers:
+                response = await self.client.get(url, headers=headers)
+            else:
+                response = await self.client.get(url)
+
+        if response.status_code == 304 and cached:
+            self._page_cache.touch(url)
+            return cached.body
         if response.status_code == 200:
+            if self._page_cache:
+                self._page_cache.set(
+                    url, response.text, response.headers.get("last-modified")
+                )
             return response.text
         return None
 
     def _is_relevant(self, datapoint: RawDataPoint) -> bool:
         """Check if a post is relevant (contains pain point indicators)."""
-        text = datapoint.full_text.lower()
-        return any(keyword in text for keyword in self.PAIN_KEYWORDS)
-
-    def _extract_number(self, soup: BeautifulSoup, selector: str) -> int:
-        """Extract a number from an element."""
-        elem = soup.select_one(selector)
-        if elem:
-            text = elem.get_text(strip=True)
-            numbers = re.findall(r"\d+", text)
-            if numbers:
-                return int(numbers[0])
-        return 0
+        return self._PAIN_RE.search(datapoint.full_text) is not None
 
     def _parse_date(self, date_str: str) -> datetime:
         """Parse various date formats."""
         if not date_str:
             return datetime.utcnow()
 
-        # Try ISO format first
+        # Try ISO format first; ciso8601 is much faster when installed
         try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            if ciso8601 is not None:
+                return ciso8601.parse_datetime(date_str)
+            return datetime.fromisoformat(date_str)
         except ValueError:
             pass
 
@@ -318,25 +541,19 @@ class CommunityScraper(BaseScraper):
         if "today" in date_str or "just now" in date_str:
             return now
 
-        match = re.search(r"(\d+)\s*(day|week|month|year|hour|minute)s?\s*ago", date_str)
+        match = _REL_DATE_RE.search(date_str)
         if match:
-            amount = int(match.group(1))
-            unit = match.group(2)
-            if unit == "minute":
-                return now
-            elif unit == "hour":
-                return now
-            elif unit == "day":
-                return now.replace(day=max(1, now.day - amount))
-            elif unit == "week":
-                return now.replace(day=max(1, now.day - amount * 7))
-            elif unit == "month":
-                return now.replace(month=max(1, now.month - amount))
-            elif unit == "year":
-                return now.replace(year=now.year - amount)
+            return now - _UNIT_DELTAS[match.group(2)] * int(match.group(1))
 
         return now
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP client (if owned) and the parse worker pool."""
+        if self._owns_client:
+            await self.client.aclose()
+        if self._page_cache is not None:
+            self._page_cache.close()
+            self._page_cache = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(cancel_futures=True)
+            self._parse_pool = None
@@ -0,0 +1,76 @@
+"""On-disk cache of fetched pages, keyed by URL."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+
+class CachedPage(NamedTuple):
+    """A cached response body and the validator needed to revalidate it."""
+
+    body: str
+    last_modified: str | None
+    fetched_at: float
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Whether the page was fetched less than max_age seconds ago."""
+        return time.time() - self.fetched_at < max_age
+
+
+class PageCache:
+    """SQLite-backed cache of page bodies for scrapers.
+
+    Entries never expire on their own; callers decide per lookup how old a
+    page may be, and can revalidate stale pages with If-Modified-Since.
+    """
+
+    def __init__(self, path: str | Path):
+        """Open (or create) the cache.
+
+        Args:
+            path: SQLite file holding the cache.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> CachedPage | None:
+        """Return the cached page for a URL, however old, or None."""
+        row = self._conn.execute(
+            "SELECT body, last_modified, fetched_at FROM pages WHERE url = ?", (url,)
+        ).fetchone()
+        return CachedPage(*row) if row else None
+
+    def set(self, url: str, body: str, last_modified: str | None = None) -> None:
+        """Store a freshly fetched page."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pages (url, body, last_modified, fetched_at) "
+            "VALUES (?, ?, ?, ?)",
+            (url, body, last_modified, time.time()),
+        )
+        self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark a cached page as fresh again after a 304 Not Modified."""
+        self._conn.execute(
+            "UPDATE pages SET fetched_at = ? WHERE url = ?", (time.time(), url)
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
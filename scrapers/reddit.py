@@ -1,6 +1,7 @@
 """Reddit scraper for Shopify-related discussions."""
 
 import asyncio
+import re
 from datetime import datetime
 from typing import AsyncIterator
 
@@ -8,7 +9,7 @@ import praw
 from praw.models import Submission
 
 from config import settings
-from .base import BaseScraper, DataSource, RawDataPoint
+from .base import BaseScraper, DataSource, RawDataPoint, build_keyword_automaton
 
 
 class RedditScraper(BaseScraper):
@@ -42,14 +43,21 @@ class RedditScraper(BaseScraper):
         "suggestion",
         "advice",
     ]
+    _PAIN_RE = re.compile("|".join(map(re.escape, PAIN_POINT_KEYWORDS)), re.IGNORECASE)
+    _PAIN_AUTOMATON = build_keyword_automaton(PAIN_POINT_KEYWORDS)
+    _SHOPIFY_RE = re.compile("shopify", re.IGNORECASE)
 
     def __init__(self):
-        self.reddit = praw.Reddit(
+        self.reddit = self._make_reddit()
+        self.subreddits = settings.reddit_subreddits
+
+    def _make_reddit(self) -> praw.Reddit:
+        """Create a read-only PRAW client from settings."""
+        return praw.Reddit(
             client_id=settings.reddit_client_id,
             client_secret=settings.reddit_client_secret,
             user_agent=settings.reddit_user_agent,
         )
-        self.subreddits = settings.reddit_subreddits
 
     async def health_check(self) -> bool:
         """Check Reddit API connectivity."""
@@ -79,60 +87,93 @@ class RedditScraper(BaseScraper):
         Yields:
             RawDataPoint for each relevant post/comment.
         """
-        loop = asyncio.get_event_loop()
+        self._batch_ts = datetime.utcnow()
+        # Subreddits are scanned concurrently, each on its own PRAW client
+        # since PRAW instances are not thread safe. Workers push datapoints
+        # as they find them and None when done.
+        queue: asyncio.Queue[RawDataPoint | None] = asyncio.Queue()
+        tasks = [
+            asyncio.create_task(self._scrape_subreddit(subreddit_name, limit, queue))
+            for subreddit_name in self.subreddits
+        ]
 
-        for subreddit_name in self.subreddits:
-            try:
-                subreddit = await loop.run_in_executor(
-                    None, lambda name=subreddit_name: self.reddit.subreddit(name)
-                )
+        try:
+            remaining = len(tasks)
+            while remaining:
+                datapoint = await queue.get()
+                if datapoint is None:
+                    remaining -= 1
+                    continue
+                yield datapoint
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _scrape_subreddit(
+        self,
+        subreddit_name: str,
+        limit: int,
+        queue: asyncio.Queue[RawDataPoint | None],
+    ) -> None:
+        """Scan one subreddit for relevant posts and comments.
+
+        Blocking PRAW calls run in worker threads.
+
+        Args:
+            subreddit_name: Subreddit to search.
+            limit: Maximum posts for this subreddit.
+            queue: Receives each datapoint, then None once the scan ends.
+        """
+        try:
+            reddit = self._make_reddit()
+            subreddit = await asyncio.to_thread(reddit.subreddit, subreddit_name)
 
-                # Search for Shopify-related posts
-                search_queries = ["shopify", "shopify app", "shopify problem", "shopify help"]
+            # Search for Shopify-related posts
+            search_queries = ["shopify", "shopify app", "shopify problem", "shopify help"]
 
-                for query in search_queries:
-                    submissions = await loop.run_in_executor(
-                        None,
-                        lambda q=query: list(
-                            subreddit.search(q, sort="new", time_filter="month", limit=limit // 4)
-                        ),
+            for query in search_queries:
+                submissions = await asyncio.to_thread(
+                    lambda q=query: list(
+                        subreddit.search(q, sort="new", time_filter="month", limit=limit // 4)
                     )
+                )
 
-                    for submission in submissions:
-                        if self._is_relevant(submission):
-                            yield self._submission_to_datapoint(submission)
+                for submission in submissions:
+                    if self._is_relevant(submission):
+                        await queue.put(self._submission_to_datapoint(submission))
 
-                            # Also get top-level comments
-                            await loop.run_in_executor(
-                                None, lambda s=submission: s.comments.replace_more(limit=0)
-                            )
+                        # Also get top-level comments
+                        await asyncio.to_thread(submission.comments.replace_more, limit=0)
 
-                            for comment in submission.comments[:10]:
-                                if hasattr(comment, "body") and self._has_pain_keywords(
-                                    comment.body
-                                ):
-                                    yield self._comment_to_datapoint(comment, submission)
+                        for comment in submission.comments[:10]:
+                            if hasattr(comment, "body") and self._has_pain_keywords(
+                                comment.body
+                            ):
+                                await queue.put(self._comment_to_datapoint(comment, submission))
 
-                        # Rate limiting
-                        await asyncio.sleep(settings.request_delay_seconds)
+                    # Rate limiting
+                    await asyncio.sleep(settings.request_delay_seconds)
 
-            except Exception as e:
-                print(f"Error scraping r/{subreddit_name}: {e}")
-                continue
+        except Exception as e:
+            print(f"Error scraping r/{subreddit_name}: {e}")
+        finally:
+            queue.put_nowait(None)
 
     def _is_relevant(self, submission: Submission) -> bool:
         """Check if a submission is relevant to Shopify pain points."""
-        text = f"{submission.title} {submission.selftext}".lower()
-        return "shopify" in text and self._has_pain_keywords(text)
+        text = f"{submission.title} {submission.selftext}"
+        return self._SHOPIFY_RE.search(text) is not None and self._has_pain_keywords(text)
 
     def _has_pain_keywords(self, text: str) -> bool:
         """Check if text contains pain point indicators."""
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in self.PAIN_POINT_KEYWORDS)
+        if self._PAIN_AUTOMATON is not None:
+            return next(self._PAIN_AUTOMATON.iter(text.lower()), None) is not None
+        return self._PAIN_RE.search(text) is not None
 
     def _submission_to_datapoint(self, submission: Submission) -> RawDataPoint:
         """Convert a Reddit submission to a RawDataPoint."""
-        return RawDataPoint(
+        return RawDataPoint.model_construct(
             source=self.source,
             source_id=f"reddit_post_{submission.id}",
             url=f"https://reddit.com{submission.permalink}",
@@ -140,6 +181,7 @@ class RedditScraper(BaseScraper):
             content=submission.selftext or "[No body text]",
             author=str(submission.author) if submission.author else "[deleted]",
             created_at=datetime.utcfromtimestamp(submission.created_utc),
+            scraped_at=self._scraped_at(),
             metadata={
                 "subreddit": str(submission.subreddit),
                 "score": submission.score,
@@ -151,7 +193,7 @@ class RedditScraper(BaseScraper):
 
     def _comment_to_datapoint(self, comment, submission: Submission) -> RawDataPoint:
         """Convert a Reddit comment to a RawDataPoint."""
-        return RawDataPoint(
+        return RawDataPoint.model_construct(
             source=self.source,
             source_id=f"reddit_comment_{comment.id}",
             url=f"https://reddit.com{comment.permalink}",
@@ -159,6 +201,7 @@ class RedditScraper(BaseScraper):
             content=comment.body,
             author=str(comment.author) if comment.author else "[deleted]",
             created_at=datetime.utcfromtimestamp(comment.created_utc),
+            scraped_at=self._scraped_at(),
             metadata={
                 "subreddit": str(submission.subreddit),
                 "score": comment.score,
@@ -7,15 +7,20 @@ Selenium as a fallback for HTML parsing when needed.
 from __future__ import annotations
 
 import asyncio
-import json
+import atexit
 import re
-import time
-import xml.etree.ElementTree as ET
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from html import unescape
-from typing import AsyncIterator
+from io import BytesIO
+from typing import AsyncIterator, Iterator
 
+import lxml.html
+import orjson
 import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -25,7 +30,13 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
-from .base import BaseScraper, DataSource, RawDataPoint
+from .base import (
+    BaseScraper,
+    DataSource,
+    RateLimiter,
+    RawDataPoint,
+    build_keyword_automaton,
+)
 
 
 # Default headers for httpx requests
@@ -34,6 +45,46 @@ DEFAULT_HEADERS = {
     "Accept": "application/rss+xml, application/xml, text/xml, */*",
 }
 
+# Patterns used to turn RSS content HTML into plain text
+# Line breaks in one pass: </p> becomes a blank line, <br>, </div> and
+# </li> a single newline
+_RE_BREAKS = re.compile(r"(</p>)|</div>|</li>|<br\s*/?>", re.IGNORECASE)
+_RE_TAG = re.compile(r"<[^>]+>")
+_RE_BLANKS = re.compile(r"\n{3,}")
+_RE_LINKCOMMENTS = re.compile(r"\[link\]\s*\[comments\]", re.IGNORECASE)
+_RE_SUBMITTED = re.compile(r"submitted by.*$", re.MULTILINE | re.IGNORECASE)
+
+# Pooled keep-alive connections per host; sized above the number of
+# concurrent fetches so worker threads never wait for or discard a socket
+_POOL_MAXSIZE = 20
+
+# Session shared by the standalone scrape functions, created on first use
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+# Atom namespace used by Reddit RSS feeds, and the paths read from each
+# entry in Clark notation so find() skips prefix resolution
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+_ATOM = f"{{{_ATOM_NS}}}"
+_ATOM_ENTRY = _ATOM + "entry"
+_ATOM_TITLE = _ATOM + "title"
+_ATOM_LINK = _ATOM + "link[@href]"
+_ATOM_AUTHOR_NAME = f"{_ATOM}author/{_ATOM}name"
+_ATOM_CONTENT = _ATOM + "content"
+_ATOM_UPDATED = _ATOM + "updated"
+
+# Compiled readers for the same fields, for entries known to be lxml
+# elements; each evaluates in libxml2 and returns a plain str, "" when the
+# field is absent
+_XPATH_NS = {"atom": _ATOM_NS}
+_XP_TITLE = etree.XPath("string(atom:title)", namespaces=_XPATH_NS)
+_XP_LINK = etree.XPath("string(atom:link/@href)", namespaces=_XPATH_NS)
+_XP_AUTHOR_NAME = etree.XPath("string(atom:author/atom:name)", namespaces=_XPATH_NS)
+_XP_CONTENT = etree.XPath("string(atom:content)", namespaces=_XPATH_NS)
+_XP_UPDATED = etree.XPath("string(atom:updated)", namespaces=_XPATH_NS)
+
+_COMMENTS_RE = re.compile(r"/comments/([^/]+)")
+
 # RSS endpoints for different sort types
 RSS_ENDPOINTS = {
     "hot": "https://www.reddit.com/r/shopify/.rss",
@@ -58,24 +109,35 @@ class RedditSeleniumScraper(BaseScraper):
         "alternative", "better", "help", "stuck", "can't", "doesn't work",
         "looking for", "recommend", "suggestion", "advice",
     ]
+    _PAIN_RE = re.compile("|".join(map(re.escape, PAIN_POINT_KEYWORDS)), re.IGNORECASE)
+    _PAIN_AUTOMATON = build_keyword_automaton(PAIN_POINT_KEYWORDS)
+    _SHOPIFY_RE = re.compile("shopify", re.IGNORECASE)
+
+    # RSS feeds fetched at once; each holds its slot for request_delay after
+    MAX_CONCURRENT_FEEDS = 4
 
-    def __init__(self, headless: bool = True, request_delay: float = 2.0):
+    def __init__(
+        self, headless: bool = True, request_delay: float = 2.0, use_json: bool = False
+    ):
         """Initialize the scraper.
 
         Args:
             headless: Run browser in headless mode (default True).
             request_delay: Delay between requests in seconds (default 2.0).
+            use_json: Try each listing's JSON endpoint before its RSS feed
+                (default False, as Reddit usually denies JSON access). The
+                first denied JSON request turns this off for the session.
         """
         self.headless = headless
         self.request_delay = request_delay
+        self.use_json = use_json
         self._driver = None
         self._client = None
 
     def _get_session(self) -> requests.Session:
         """Get or create requests session."""
         if self._client is None:
-            self._client = requests.Session()
-            self._client.headers.update(DEFAULT_HEADERS)
+            self._client = _make_session()
         return self._client
 
     def _close_client(self):
@@ -111,6 +173,11 @@ class RedditSeleniumScraper(BaseScraper):
             self._driver.quit()
             self._driver = None
 
+    async def close(self) -> None:
+        """Close the HTTP session and the WebDriver if open."""
+        self._close_client()
+        self._close_driver()
+
     async def health_check(self) -> bool:
         """Check if we can connect to Reddit."""
         try:
@@ -119,8 +186,6 @@ class RedditSeleniumScraper(BaseScraper):
             return resp.status_code == 200 and "<feed" in resp.text
         except Exception:
             return False
-        finally:
-            self._close_client()
 
     async def scrape(self, limit: int = 100) -> AsyncIterator[RawDataPoint]:
         """Scrape Reddit posts about Shopify.
@@ -131,87 +196,243 @@ class RedditSeleniumScraper(BaseScraper):
         Yields:
             RawDataPoint for each relevant post.
         """
-        loop = asyncio.get_event_loop()
-        posts = await loop.run_in_executor(None, self._scrape_posts, limit)
-
-        for post in posts:
+        self._batch_ts = datetime.utcnow()
+        async for post in self._iter_posts(limit):
             yield post
 
-    def _scrape_posts(self, limit: int) -> list[RawDataPoint]:
-        """Scrape posts using RSS feeds."""
-        results = []
+    async def _scrape_posts(self, limit: int) -> list[RawDataPoint]:
+        """Scrape posts from all listing feeds into a list."""
+        return [post async for post in self._iter_posts(limit)]
+
+    async def _iter_posts(self, limit: int) -> AsyncIterator[RawDataPoint]:
+        """Stream relevant posts from all listing feeds as they are parsed.
+
+        Feeds are fetched concurrently in worker threads, which hand each
+        post to the event loop through a queue as soon as it is parsed.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[RawDataPoint | None] = asyncio.Queue()
+        stop = threading.Event()
         seen_ids = set()
+        # Bare post ids, shared by the feed workers so duplicates are skipped
+        # before a RawDataPoint is built. Workers race on it, so seen_ids
+        # still guards the consumer.
+        seen_post_ids: set[str] = set()
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FEEDS)
+
+        # The session outlives a single scrape so its pooled connections are
+        # reused by later calls; close() releases it.
+        session = self._get_session()
+        tasks = [
+            asyncio.create_task(
+                self._stream_feed(
+                    session, url, semaphore, seen_post_ids, loop, queue, stop
+                )
+            )
+            for url in RSS_ENDPOINTS.values()
+        ]
 
         try:
-            session = self._get_session()
+            remaining = len(tasks)
+            yielded = 0
+            while remaining and yielded < limit:
+                post = await queue.get()
+                if post is None:
+                    remaining -= 1
+                    continue
+                if post.source_id not in seen_ids:
+                    seen_ids.add(post.source_id)
+                    if self._is_relevant(post.title or "", post.content):
+                        yield post
+                        yielded += 1
+        finally:
+            stop.set()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _stream_feed(
+        self,
+        session: requests.Session,
+        url: str,
+        semaphore: asyncio.Semaphore,
+        seen_post_ids: set[str],
+        loop: asyncio.AbstractEventLoop,
+        queue: asyncio.Queue[RawDataPoint | None],
+        stop: threading.Event,
+    ) -> None:
+        """Fetch one listing in a worker thread, bounded by the semaphore.
+
+        Posts are put on the queue as they are parsed, then None once the
+        listing is done.
+        """
 
-            for sort_type, url in RSS_ENDPOINTS.items():
-                if len(results) >= limit:
+        def pump() -> None:
+            for post in self._iter_listing_posts(session, url, seen_post_ids):
+                if stop.is_set():
                     break
+                loop.call_soon_threadsafe(queue.put_nowait, post)
 
-                posts = self._fetch_rss_posts(session, url)
-                for post in posts:
-                    if len(results) >= limit:
-                        break
-                    if post.source_id not in seen_ids:
-                        seen_ids.add(post.source_id)
-                        if self._is_relevant(post.title or "", post.content):
-                            results.append(post)
-
-                time.sleep(self.request_delay)
-
+        try:
+            async with semaphore:
+                await asyncio.to_thread(pump)
+                await asyncio.sleep(self.request_delay)
         finally:
-            self._close_client()
+            queue.put_nowait(None)
+
+    def _fetch_listing_posts(
+        self,
+        session: requests.Session,
+        url: str,
+        seen_post_ids: set[str] | None = None,
+    ) -> list[RawDataPoint]:
+        """Fetch a listing's posts from RSS, or JSON when use_json is set."""
+        return list(self._iter_listing_posts(session, url, seen_post_ids))
+
+    def _iter_listing_posts(
+        self,
+        session: requests.Session,
+        url: str,
+        seen_post_ids: set[str] | None = None,
+    ) -> Iterator[RawDataPoint]:
+        """Yield a listing's posts from RSS, or JSON when use_json is set."""
+        posts = None
+        if self.use_json:
+            posts = self._fetch_json_posts(session, _json_listing_url(url), seen_post_ids)
+            if posts is None:
+                # Denied once means denied for every feed; stop paying for it
+                self.use_json = False
+        if posts is None:
+            posts = self._iter_rss_posts(session, url, seen_post_ids)
+        yield from posts
+
+    def _fetch_json_posts(
+        self,
+        session: requests.Session,
+        url: str,
+        seen_post_ids: set[str] | None = None,
+    ) -> list[RawDataPoint] | None:
+        """Fetch posts from a JSON listing endpoint.
+
+        Returns:
+            The listing's posts, or None if the endpoint is unavailable or
+            did not return a listing, so the caller can fall back to RSS.
+        """
+        try:
+            resp = session.get(url, timeout=30)
+            if resp.status_code != 200:
+                return None
+            children = orjson.loads(resp.content)["data"]["children"]
+        except Exception:
+            return None
 
+        results = []
+        for child in children:
+            try:
+                datapoint = self._parse_json_post(child["data"], seen_post_ids)
+                if datapoint:
+                    results.append(datapoint)
+            except Exception:
+                continue
         return results
 
-    def _fetch_rss_posts(self, session: requests.Session, url: str) -> list[RawDataPoint]:
-        """Fetch posts from an RSS endpoint."""
-        results = []
+    def _parse_json_post(
+        self, data: dict, seen_post_ids: set[str] | None = None
+    ) -> RawDataPoint | None:
+        """Parse a JSON listing child into a RawDataPoint.
+
+        Returns None for posts whose id is already in seen_post_ids.
+        """
+        post_id = data.get("id", "")
+        if seen_post_ids is not None and post_id:
+            if post_id in seen_post_ids:
+                return None
+            seen_post_ids.add(post_id)
+
+        created_utc = data.get("created_utc")
+        return RawDataPoint.model_construct(
+            source=self.source,
+            source_id=f"reddit_post_{post_id}",
+            url=f"https://www.reddit.com{data.get('permalink', '')}",
+            title=data.get("title", ""),
+            content=data.get("selftext") or "[No body text]",
+            author=data.get("author") or "[unknown]",
+            created_at=(
+                datetime.utcfromtimestamp(created_utc) if created_utc else datetime.utcnow()
+            ),
+            scraped_at=self._scraped_at(),
+            metadata={
+                "subreddit": data.get("subreddit", "shopify"),
+                "type": "post",
+                "score": data.get("score", 0),
+                "num_comments": data.get("num_comments", 0),
+                "scrape_method": "json",
+            },
+        )
+
+    def _fetch_rss_posts(
+        self,
+        session: requests.Session,
+        url: str,
+        seen_post_ids: set[str] | None = None,
+    ) -> list[RawDataPoint]:
+        """Fetch posts from an RSS endpoint, skipping ids in seen_post_ids."""
+        return list(self._iter_rss_posts(session, url, seen_post_ids))
+
+    def _iter_rss_posts(
+        self,
+        session: requests.Session,
+        url: str,
+        seen_post_ids: set[str] | None = None,
+    ) -> Iterator[RawDataPoint]:
+        """Yield posts from an RSS endpoint as its entries are parsed."""
         try:
             resp = session.get(url, timeout=30)
             if resp.status_code != 200:
-                return results
-
-            root = ET.fromstring(resp.text)
-            ns = {"atom": "http://www.w3.org/2005/Atom"}
+                return
 
-            for entry in root.findall("atom:entry", ns):
+            for entry in _iter_atom_entries(resp.text.encode()):
                 try:
-                    datapoint = self._parse_rss_entry(entry, ns)
-                    if datapoint:
-                        results.append(datapoint)
+                    datapoint = self._parse_rss_entry(entry, seen_post_ids)
                 except Exception:
                     continue
+                if datapoint:
+                    yield datapoint
 
         except Exception:
             pass
 
-        return results
-
-    def _parse_rss_entry(self, entry, ns: dict) -> RawDataPoint | None:
-        """Parse an RSS entry into a RawDataPoint."""
-        title_elem = entry.find("atom:title", ns)
-        title = title_elem.text if title_elem is not None else ""
+    def _parse_rss_entry(
+        self, entry, seen_post_ids: set[str] | None = None
+    ) -> RawDataPoint | None:
+        """Parse an RSS entry into a RawDataPoint.
 
-        link_elem = entry.find("atom:link[@href]", ns)
+        Returns None without building the datapoint when the entry's post id
+        is already in seen_post_ids; otherwise the id is added to it.
+        """
+        link_elem = entry.find(_ATOM_LINK)
         url = link_elem.get("href") if link_elem is not None else ""
 
-        author_elem = entry.find("atom:author/atom:name", ns)
+        match = _COMMENTS_RE.search(url) if url else None
+        post_id = match.group(1) if match else ""
+
+        if seen_post_ids is not None and post_id:
+            if post_id in seen_post_ids:
+                return None
+            seen_post_ids.add(post_id)
+
+        title_elem = entry.find(_ATOM_TITLE)
+        title = title_elem.text if title_elem is not None else ""
+
+        author_elem = entry.find(_ATOM_AUTHOR_NAME)
         author = author_elem.text if author_elem is not None else ""
         author = author.replace("/u/", "") if author else "[unknown]"
 
-        content_elem = entry.find("atom:content", ns)
+        content_elem = entry.find(_ATOM_CONTENT)
         content_html = content_elem.text if content_elem is not None else ""
         selftext = _extract_selftext_from_html(content_html)
 
-        post_id = ""
-        if url and "/comments/" in url:
-            parts = url.split("/comments/")
-            if len(parts) > 1:
-                post_id = parts[1].split("/")[0]
-
-        updated_elem = entry.find("atom:updated", ns)
+        updated_elem = entry.find(_ATOM_UPDATED)
         updated_str = updated_elem.text if updated_elem is not None else ""
         created_at = datetime.utcnow()
         if updated_str:
@@ -220,7 +441,7 @@ class RedditSeleniumScraper(BaseScraper):
             except Exception:
                 pass
 
-        return RawDataPoint(
+        return RawDataPoint.model_construct(
             source=self.source,
             source_id=f"reddit_post_{post_id}",
             url=url,
@@ -228,6 +449,7 @@ class RedditSeleniumScraper(BaseScraper):
             content=selftext or "[No body text]",
             author=author,
             created_at=created_at,
+            scraped_at=self._scraped_at(),
             metadata={
                 "subreddit": "shopify",
                 "type": "post",
@@ -237,134 +459,296 @@ class RedditSeleniumScraper(BaseScraper):
 
     def _is_relevant(self, title: str, selftext: str) -> bool:
         """Check if a post is relevant to Shopify pain points."""
-        text = f"{title} {selftext}".lower()
-        return "shopify" in text or self._has_pain_keywords(text)
+        text = f"{title} {selftext}"
+        return self._SHOPIFY_RE.search(text) is not None or self._has_pain_keywords(text)
 
     def _has_pain_keywords(self, text: str) -> bool:
         """Check if text contains pain point indicators."""
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in self.PAIN_POINT_KEYWORDS)
+        if self._PAIN_AUTOMATON is not None:
+            return next(self._PAIN_AUTOMATON.iter(text.lower()), None) is not None
+        return self._PAIN_RE.search(text) is not None
+
+
+def _make_session() -> requests.Session:
+    """Create a session with the default headers and a sized connection pool."""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_maxsize=_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _shared_session() -> requests.Session:
+    """Return the module-wide session, creating it on first use.
+
+    Successive scrape calls reuse its pooled connections instead of paying
+    a fresh DNS lookup and TLS handshake each time. It is closed at exit.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = _make_session()
+            atexit.register(_SESSION.close)
+        return _SESSION
+
+
+def _json_listing_url(rss_url: str) -> str:
+    """Map an RSS listing URL to the equivalent JSON listing URL."""
+    return rss_url.replace("/.rss", "/.json", 1)
+
+
+def _iter_atom_entries(xml: bytes) -> Iterator[etree._Element]:
+    """Stream the entries of an Atom feed, freeing each once it is consumed.
+
+    Args:
+        xml: Raw feed document.
+
+    Yields:
+        Each complete ``<entry>`` element in document order.
+    """
+    for _, entry in etree.iterparse(BytesIO(xml), tag=_ATOM_ENTRY):
+        yield entry
+        entry.clear()
+        while entry.getprevious() is not None:
+            del entry.getparent()[0]
 
 
 # ============================================================================
 # Simple standalone functions
 # ============================================================================
 
-def scrape_reddit_posts(
+# Requests in flight at once across feeds and comment threads
+MAX_CONCURRENT_REQUESTS = 5
+
+# Worker processes parsing feed bodies off the event loop
+PARSE_WORKERS = 2
+
+
+async def iter_reddit_posts(
     limit: int = 25,
     sort_types: list[str] | None = None,
     include_comments: bool = False,
     request_delay: float = 2.0,
     debug: bool = False,
-) -> list[dict]:
-    """Scrape Reddit r/shopify posts with optional comments.
+) -> AsyncIterator[dict]:
+    """Stream Reddit r/shopify posts with optional comments as they are ready.
+
+    All sort feeds are requested at once and consumed in the order they
+    complete. A post's comment fetch starts as soon as the post is first
+    seen, and the post is yielded once its comments arrive. At most
+    MAX_CONCURRENT_REQUESTS requests are in flight, and a token bucket
+    starts them request_delay apart on average. Feed bodies are parsed in
+    a pool of PARSE_WORKERS processes so parsing never stalls the fetches.
 
     Args:
         limit: Maximum number of posts to fetch.
         sort_types: List of sort types to use. Options: hot, new, top_day, top_week,
                    top_month, top_year, top_all, rising. Default: ["hot", "new", "top_week"].
         include_comments: Whether to fetch comments for each post.
-        request_delay: Delay between requests in seconds.
+        request_delay: Average seconds between request starts.
         debug: Print debug information.
 
-    Returns:
-        List of dicts with 'title', 'selftext', 'comments', and other metadata.
+    Yields:
+        Dicts with 'title', 'selftext', 'comments', and other metadata.
     """
     if sort_types is None:
         sort_types = ["hot", "new", "top_week"]
 
-    results = []
-    seen_ids = set()
-
-    session = requests.Session()
-    session.headers.update(DEFAULT_HEADERS)
-
-    try:
-        for sort_type in sort_types:
-            if len(results) >= limit:
-                break
-
-            url = RSS_ENDPOINTS.get(sort_type)
-            if not url:
-                if debug:
-                    print(f"Unknown sort type: {sort_type}")
-                continue
-
+    feed_urls = []
+    for sort_type in sort_types:
+        url = RSS_ENDPOINTS.get(sort_type)
+        if not url:
             if debug:
-                print(f"Fetching {sort_type} posts...")
+                print(f"Unknown sort type: {sort_type}")
+            continue
+        feed_urls.append(url)
 
-            posts = _fetch_rss_simple(session, url, debug)
+    yielded = 0
+    seen_ids = set()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    limiter = RateLimiter(request_delay, burst=MAX_CONCURRENT_REQUESTS)
+
+    session = _shared_session()
+    loop = asyncio.get_running_loop()
+    parse_pool: ProcessPoolExecutor | None = None
+
+    async def fetch(url, parse):
+        nonlocal parse_pool
+        # requests is blocking, so each call runs in a worker thread
+        async with semaphore, limiter:
+            body = await asyncio.to_thread(_fetch_feed, session, url, debug)
+        if not body:
+            return []
+        if parse_pool is None:
+            parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+        return await loop.run_in_executor(parse_pool, parse, body, debug)
+
+    if debug:
+        print(f"Fetching {len(feed_urls)} feeds...")
+    feed_tasks = [asyncio.create_task(fetch(url, _parse_rss_simple)) for url in feed_urls]
+    comment_tasks = []
 
-            for post in posts:
-                if len(results) >= limit:
+    try:
+        for next_feed in asyncio.as_completed(feed_tasks):
+            # Claim this feed's new posts and start their comment fetches
+            # before yielding any of them
+            batch = []
+            for post in await next_feed:
+                if yielded + len(batch) >= limit:
                     break
 
                 if post["id"] and post["id"] not in seen_ids:
                     seen_ids.add(post["id"])
-
+                    post["comments"] = []
+                    comments_task = None
                     if include_comments and post["url"]:
                         if debug:
                             print(f"  Fetching comments for: {post['title'][:50]}...")
-                        time.sleep(request_delay)
-                        post["comments"] = _fetch_post_comments(session, post["id"], debug)
-                    else:
-                        post["comments"] = []
-
-                    results.append(post)
-
-            time.sleep(request_delay)
+                        comments_task = asyncio.create_task(
+                            fetch(_comments_feed_url(post["id"]), _parse_post_comments)
+                        )
+                        comment_tasks.append(comments_task)
+                    batch.append((post, comments_task))
+
+            for post, comments_task in batch:
+                if comments_task is not None:
+                    post["comments"] = await comments_task
+                yield post
+                yielded += 1
+
+            if yielded >= limit:
+                break
 
         if debug:
-            print(f"Total posts scraped: {len(results)}")
+            print(f"Total posts scraped: {yielded}")
 
     finally:
-        session.close()
+        for task in feed_tasks + comment_tasks:
+            task.cancel()
+        await asyncio.gather(*feed_tasks, *comment_tasks, return_exceptions=True)
+        if parse_pool is not None:
+            parse_pool.shutdown(cancel_futures=True)
+
+
+async def scrape_reddit_posts_async(
+    limit: int = 25,
+    sort_types: list[str] | None = None,
+    include_comments: bool = False,
+    request_delay: float = 2.0,
+    debug: bool = False,
+) -> list[dict]:
+    """Collect iter_reddit_posts into a list.
+
+    Args:
+        limit: Maximum number of posts to fetch.
+        sort_types: List of sort types to use. Default: ["hot", "new", "top_week"].
+        include_comments: Whether to fetch comments for each post.
+        request_delay: Average seconds between request starts.
+        debug: Print debug information.
+
+    Returns:
+        List of dicts with 'title', 'selftext', 'comments', and other metadata.
+    """
+    return [
+        post
+        async for post in iter_reddit_posts(
+            limit=limit,
+            sort_types=sort_types,
+            include_comments=include_comments,
+            request_delay=request_delay,
+            debug=debug,
+        )
+    ]
 
-    return results
+
+def scrape_reddit_posts(
+    limit: int = 25,
+    sort_types: list[str] | None = None,
+    include_comments: bool = False,
+    request_delay: float = 2.0,
+    debug: bool = False,
+) -> list[dict]:
+    """Scrape Reddit r/shopify posts with optional comments.
+
+    Synchronous wrapper around scrape_reddit_posts_async; call that
+    directly from code that is already running an event loop.
+
+    Args:
+        limit: Maximum number of posts to fetch.
+        sort_types: List of sort types to use. Options: hot, new, top_day, top_week,
+                   top_month, top_year, top_all, rising. Default: ["hot", "new", "top_week"].
+        include_comments: Whether to fetch comments for each post.
+        request_delay: Average seconds between request starts.
+        debug: Print debug information.
+
+    Returns:
+        List of dicts with 'title', 'selftext', 'comments', and other metadata.
+    """
+    return asyncio.run(
+        scrape_reddit_posts_async(
+            limit=limit,
+            sort_types=sort_types,
+            include_comments=include_comments,
+            request_delay=request_delay,
+            debug=debug,
+        )
+    )
 
 
 def _fetch_rss_simple(session: requests.Session, url: str, debug: bool = False) -> list[dict]:
     """Fetch posts from an RSS endpoint."""
-    results = []
+    body = _fetch_feed(session, url, debug)
+    return _parse_rss_simple(body, debug) if body else []
+
+
+def _fetch_post_comments(session: requests.Session, post_id: str, debug: bool = False) -> list[dict]:
+    """Fetch comments for a specific post."""
+    body = _fetch_feed(session, _comments_feed_url(post_id), debug)
+    return _parse_post_comments(body, debug) if body else []
 
+
+def _comments_feed_url(post_id: str) -> str:
+    """RSS feed URL for a post's comment thread."""
+    return f"https://www.reddit.com/r/shopify/comments/{post_id}/.rss"
+
+
+def _fetch_feed(session: requests.Session, url: str, debug: bool = False) -> bytes | None:
+    """Fetch a feed body, or None on an HTTP or network error."""
     try:
         resp = session.get(url, timeout=30)
         if resp.status_code != 200:
             if debug:
                 print(f"  HTTP {resp.status_code} from {url}")
-            return results
-
-        root = ET.fromstring(resp.text)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-
-        entries = root.findall("atom:entry", ns)
+            return None
+        return resp.text.encode()
+    except Exception as e:
         if debug:
-            print(f"  Found {len(entries)} entries")
+            print(f"  Error fetching {url}: {e}")
+        return None
 
-        for entry in entries:
-            try:
-                title_elem = entry.find("atom:title", ns)
-                title = title_elem.text if title_elem is not None else ""
 
-                link_elem = entry.find("atom:link[@href]", ns)
-                url = link_elem.get("href") if link_elem is not None else ""
+def _parse_rss_simple(xml: bytes, debug: bool = False) -> list[dict]:
+    """Parse the posts out of an RSS listing body.
 
-                author_elem = entry.find("atom:author/atom:name", ns)
-                author = author_elem.text if author_elem is not None else ""
-                author = author.replace("/u/", "") if author else ""
+    Kept at module level so it can run in a worker process.
+    """
+    results = []
 
-                content_elem = entry.find("atom:content", ns)
-                content_html = content_elem.text if content_elem is not None else ""
-                selftext = _extract_selftext_from_html(content_html)
+    try:
+        entry_count = 0
+        for entry in _iter_atom_entries(xml):
+            entry_count += 1
+            try:
+                title = _XP_TITLE(entry)
+                url = _XP_LINK(entry)
+                author = _XP_AUTHOR_NAME(entry).replace("/u/", "")
+                selftext = _extract_selftext_from_html(_XP_CONTENT(entry))
 
-                post_id = ""
-                if url and "/comments/" in url:
-                    parts = url.split("/comments/")
-                    if len(parts) > 1:
-                        post_id = parts[1].split("/")[0]
+                match = _COMMENTS_RE.search(url)
+                post_id = match.group(1) if match else ""
 
-                updated_elem = entry.find("atom:updated", ns)
-                updated_str = updated_elem.text if updated_elem is not None else ""
+                updated_str = _XP_UPDATED(entry)
 
                 results.append({
                     "title": title,
@@ -382,50 +766,37 @@ def _fetch_rss_simple(session: requests.Session, url: str, debug: bool = False)
                     print(f"  Error parsing entry: {e}")
                 continue
 
+        if debug:
+            print(f"  Found {entry_count} entries")
+
     except Exception as e:
         if debug:
-            print(f"  Error fetching RSS: {e}")
+            print(f"  Error parsing RSS: {e}")
 
     return results
 
 
-def _fetch_post_comments(session: requests.Session, post_id: str, debug: bool = False) -> list[dict]:
-    """Fetch comments for a specific post."""
+def _parse_post_comments(xml: bytes, debug: bool = False) -> list[dict]:
+    """Parse the comments out of a post's RSS body.
+
+    Kept at module level so it can run in a worker process.
+    """
     comments = []
-    url = f"https://www.reddit.com/r/shopify/comments/{post_id}/.rss"
 
     try:
-        resp = session.get(url, timeout=30)
-        if resp.status_code != 200:
-            if debug:
-                print(f"    HTTP {resp.status_code} fetching comments")
-            return comments
-
-        root = ET.fromstring(resp.text)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-
-        entries = root.findall("atom:entry", ns)
-
         # First entry is usually the post itself, rest are comments
-        for i, entry in enumerate(entries):
-            if i == 0:
+        is_post = True
+        for entry in _iter_atom_entries(xml):
+            if is_post:
                 # Skip the post itself
+                is_post = False
                 continue
 
             try:
-                author_elem = entry.find("atom:author/atom:name", ns)
-                author = author_elem.text if author_elem is not None else ""
-                author = author.replace("/u/", "") if author else ""
-
-                content_elem = entry.find("atom:content", ns)
-                content_html = content_elem.text if content_elem is not None else ""
-                content = _extract_selftext_from_html(content_html)
-
-                link_elem = entry.find("atom:link[@href]", ns)
-                comment_url = link_elem.get("href") if link_elem is not None else ""
-
-                updated_elem = entry.find("atom:updated", ns)
-                updated_str = updated_elem.text if updated_elem is not None else ""
+                author = _XP_AUTHOR_NAME(entry).replace("/u/", "")
+                content = _extract_selftext_from_html(_XP_CONTENT(entry))
+                comment_url = _XP_LINK(entry)
+                updated_str = _XP_UPDATED(entry)
 
                 comments.append({
                     "author": author,
@@ -444,27 +815,37 @@ def _fetch_post_comments(session: requests.Session, post_id: str, debug: bool =
 
     except Exception as e:
         if debug:
-            print(f"    Error fetching comments: {e}")
+            print(f"    Error parsing comments: {e}")
 
     return comments
 
 
+def _line_break(match: re.Match) -> str:
+    """Replacement for a _RE_BREAKS match."""
+    return "\n\n" if match.group(1) else "\n"
+
+
 def _extract_selftext_from_html(html_content: str) -> str:
     """Extract selftext from RSS HTML content."""
     if not html_content:
         return ""
 
-    html_content = unescape(html_content)
-
-    text = re.sub(r"<br\s*/?>", "\n", html_content, flags=re.IGNORECASE)
-    text = re.sub(r"</p>", "\n\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"</div>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"</li>", "\n", text, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", "", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    if "<" in html_content:
+        # The feed parser has already decoded the XML layer, so this is plain
+        # HTML and its entities are left for the HTML parser to decode
+        text = _RE_BREAKS.sub(_line_break, html_content)
+        try:
+            # One C-level parse drops tags and comments and decodes entities
+            text = lxml.html.fragment_fromstring(text, create_parent="div").text_content()
+        except (etree.ParserError, ValueError):
+            text = unescape(_RE_TAG.sub("", text))
+    else:
+        # No markup, as on most link posts, so there is nothing to parse
+        text = unescape(html_content) if "&" in html_content else html_content
+    text = _RE_BLANKS.sub("\n\n", text)
     text = text.strip()
-    text = re.sub(r"\[link\]\s*\[comments\]", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"submitted by.*$", "", text, flags=re.MULTILINE | re.IGNORECASE)
+    text = _RE_LINKCOMMENTS.sub("", text)
+    text = _RE_SUBMITTED.sub("", text)
 
     return text.strip()
 
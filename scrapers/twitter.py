@@ -10,7 +10,7 @@ import tweepy
 from tweepy import Client
 
 from config import settings
-from .base import BaseScraper, DataSource, RawDataPoint
+from .base import BaseScraper, DataSource, RateLimiter, RawDataPoint
 
 
 class TwitterScraper(BaseScraper):
@@ -34,6 +34,10 @@ class TwitterScraper(BaseScraper):
         '"shopify" "looking for" -is:retweet',
     ]
 
+    # Searches in flight at once; a token bucket spaces their starts by the
+    # configured request delay
+    MAX_CONCURRENT_QUERIES = 3
+
     def __init__(self):
         self.client = Client(
             bearer_token=settings.twitter_bearer_token,
@@ -77,27 +81,30 @@ class TwitterScraper(BaseScraper):
         Yields:
             RawDataPoint for each relevant tweet.
         """
-        loop = asyncio.get_event_loop()
+        self._batch_ts = datetime.utcnow()
         tweets_per_query = max(10, limit // len(self.SEARCH_QUERIES))
         total_scraped = 0
 
-        for query in self.SEARCH_QUERIES:
-            if total_scraped >= limit:
-                break
+        # Queries are searched concurrently but consumed in order, so the
+        # limit keeps the same tweets a sequential scan would
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_QUERIES)
+        limiter = RateLimiter(
+            settings.request_delay_seconds, burst=self.MAX_CONCURRENT_QUERIES
+        )
+        tasks = [
+            asyncio.create_task(
+                self._search(query, tweets_per_query, semaphore, limiter)
+            )
+            for query in self.SEARCH_QUERIES
+        ]
 
-            try:
-                response = await loop.run_in_executor(
-                    None,
-                    lambda q=query: self.client.search_recent_tweets(
-                        q,
-                        max_results=min(tweets_per_query, 100),  # API limit
-                        tweet_fields=["created_at", "author_id", "public_metrics", "context_annotations"],
-                        expansions=["author_id"],
-                        user_fields=["username"],
-                    ),
-                )
+        try:
+            for query, task in zip(self.SEARCH_QUERIES, tasks):
+                if total_scraped >= limit:
+                    break
 
-                if not response.data:
+                response = await task
+                if response is None or not response.data:
                     continue
 
                 # Build author lookup
@@ -114,15 +121,50 @@ class TwitterScraper(BaseScraper):
                     if datapoint:
                         yield datapoint
                         total_scraped += 1
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _search(
+        self,
+        query: str,
+        max_results: int,
+        semaphore: asyncio.Semaphore,
+        limiter: RateLimiter,
+    ):
+        """Run one search query, bounded by the semaphore and rate limiter.
+
+        A rate-limited query is retried once after waiting out the limit.
+
+        Returns:
+            The search response, or None if the query failed.
+        """
+        loop = asyncio.get_event_loop()
+        async with semaphore:
+            for attempt in range(2):
+                await limiter.acquire()
+                try:
+                    response = await loop.run_in_executor(
+                        None,
+                        lambda: self.client.search_recent_tweets(
+                            query,
+                            max_results=min(max_results, 100),  # API limit
+                            tweet_fields=["created_at", "author_id", "public_metrics", "context_annotations"],
+                            expansions=["author_id"],
+                            user_fields=["username"],
+                        ),
+                    )
+                except tweepy.errors.TooManyRequests:
+                    print("Twitter rate limit reached, waiting...")
+                    await asyncio.sleep(60)
+                    continue
+                except Exception as e:
+                    print(f"Error searching Twitter for '{query}': {e}")
+                    return None
 
-                await asyncio.sleep(settings.request_delay_seconds)
-
-            except tweepy.errors.TooManyRequests:
-                print("Twitter rate limit reached, waiting...")
-                await asyncio.sleep(60)
-            except Exception as e:
-                print(f"Error searching Twitter for '{query}': {e}")
-                continue
+                return response
+        return None
 
     def _tweet_to_datapoint(
         self, tweet, authors: dict, query: str
@@ -140,6 +182,7 @@ class TwitterScraper(BaseScraper):
                 content=tweet.text,
                 author=username,
                 created_at=tweet.created_at or datetime.utcnow(),
+                scraped_at=self._scraped_at(),
                 metadata={
                     "query": query,
                     "likes": metrics.get("like_count", 0),
@@ -4,10 +4,14 @@
 from __future__ import annotations
 
 import argparse
-import json
+import atexit
+import io
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import BinaryIO
+
+import orjson
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -33,15 +37,10 @@ def generate_weekly_summary(
     """
     stats = interview_storage.get_interview_stats()
     category_stats = interview_storage.get_category_summary()
-    participants = interview_storage.get_all_participants()
-    insights = interview_storage.get_all_insights()
 
     # Get recent participants (last 7 days)
     now = datetime.utcnow()
-    recent_participants = [
-        p for p in participants
-        if (now - p.interview_date).days <= 7
-    ]
+    recent_participants = interview_storage.get_recent_participants(now - timedelta(days=7))
 
     lines = [
         "=" * 80,
@@ -138,11 +137,12 @@ def generate_correlation_report(
     Returns:
         Formatted report string.
     """
-    scraped_insights = main_storage.get_all_insights()
-    interview_insights = interview_storage.get_all_insights()
+    # Only counts are reported, so skip loading the insights themselves
+    scraped_insight_count = main_storage.get_stats()["classified_insights"]
+    interview_insight_count = interview_storage.get_interview_stats()["total_insights"]
 
     # Get unique categories from scraped data
-    scraped_categories = {i.get("category", "other") for i in scraped_insights}
+    scraped_categories = main_storage.get_distinct_categories()
 
     correlation = interview_storage.generate_correlation_report(scraped_categories)
 
@@ -154,8 +154,8 @@ def generate_correlation_report(
         "",
         "## Data Sources",
         "",
-        f"- Scraped Insights: {len(scraped_insights)}",
-        f"- Interview Insights: {len(interview_insights)}",
+        f"- Scraped Insights: {scraped_insight_count}",
+        f"- Interview Insights: {interview_insight_count}",
         f"- Scraped Categories: {len(scraped_categories)}",
         "",
         "## Correlation Analysis",
@@ -229,28 +229,30 @@ def generate_opportunity_report(
 def export_json(
     interview_storage: InterviewStorage,
     main_storage,
-) -> str:
+    out: BinaryIO | None = None,
+) -> str | None:
     """Export all interview data as JSON.
 
     Args:
         interview_storage: Interview data storage.
         main_storage: Main insights storage.
+        out: Binary stream to write the UTF-8 JSON to; insights are
+            written as they are read. When omitted the JSON is returned as a
+            string instead.
 
     Returns:
-        JSON string.
+        JSON string, or None when written to out.
     """
     participants = interview_storage.get_all_participants()
-    insights = interview_storage.get_all_insights()
     stats = interview_storage.get_interview_stats()
     category_stats = interview_storage.get_category_summary()
 
     # Get correlation
-    scraped_insights = main_storage.get_all_insights()
-    scraped_categories = {i.get("category", "other") for i in scraped_insights}
+    scraped_categories = main_storage.get_distinct_categories()
     correlation = interview_storage.generate_correlation_report(scraped_categories)
 
     data = {
-        "generated_at": datetime.utcnow().isoformat(),
+        "generated_at": datetime.utcnow(),
         "stats": stats,
         "category_summary": category_stats,
         "correlation": {
@@ -259,42 +261,27 @@ def export_json(
             "scraped_only": correlation.scraped_only,
             "wtp_validated": correlation.wtp_validated,
         },
-        "participants": [
-            {
-                "participant_id": p.participant_id,
-                "interview_date": p.interview_date.isoformat(),
-                "store_vertical": p.store_vertical,
-                "monthly_gmv_range": p.monthly_gmv_range,
-                "store_age_months": p.store_age_months,
-                "team_size": p.team_size,
-                "app_count": p.app_count,
-                "monthly_app_budget": p.monthly_app_budget,
-                "beta_tester": p.beta_tester,
-            }
-            for p in participants
-        ],
-        "insights": [
-            {
-                "interview_id": i.interview_id,
-                "participant_id": i.participant_id,
-                "pain_category": i.pain_category.value,
-                "pain_summary": i.pain_summary,
-                "verbatim_quotes": i.verbatim_quotes,
-                "frustration_level": i.frustration_level,
-                "frequency": i.frequency.value,
-                "business_impact": i.business_impact.value,
-                "current_workaround": i.current_workaround,
-                "apps_tried": i.apps_tried,
-                "ideal_solution": i.ideal_solution,
-                "wtp_amount_low": i.wtp_amount_low,
-                "wtp_amount_high": i.wtp_amount_high,
-                "wtp_quote": i.wtp_quote,
-            }
-            for i in insights
-        ],
+        # orjson encodes the datetimes and enums left in these dumps natively
+        "participants": [p.model_dump() for p in participants],
     }
 
-    return json.dumps(data, indent=2)
+    stream = io.BytesIO() if out is None else out
+    # Write everything but the closing brace, then stream the insights array
+    # row by row in the same two-space indented layout
+    stream.write(orjson.dumps(data, option=orjson.OPT_INDENT_2)[:-2])
+    stream.write(b',\n  "insights": [')
+    written = False
+    for row in interview_storage.iter_insight_rows():
+        stream.write(b",\n    " if written else b"\n    ")
+        stream.write(
+            orjson.dumps(row, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n    ")
+        )
+        written = True
+    stream.write(b"\n  ]\n}" if written else b"]\n}")
+
+    if out is None:
+        return stream.getvalue().decode()
+    return None
 
 
 def main():
@@ -331,6 +318,7 @@ def main():
     # Initialize storage
     interview_storage = InterviewStorage(db_path=args.db_path)
     main_storage = get_storage(backend="sqlite", db_path=args.db_path)
+    atexit.register(main_storage.close)
 
     # Generate report
     if args.format == "weekly":
@@ -340,7 +328,17 @@ def main():
     elif args.format == "opportunities":
         report = generate_opportunity_report(interview_storage, main_storage, args.top)
     elif args.format == "json":
-        report = export_json(interview_storage, main_storage)
+        # Written straight from orjson's bytes, skipping a str round trip
+        if args.output:
+            output_path = Path(args.output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with output_path.open("wb") as out:
+                export_json(interview_storage, main_storage, out)
+            print(f"Report written to: {args.output}")
+        else:
+            export_json(interview_storage, main_storage, sys.stdout.buffer)
+            sys.stdout.buffer.write(b"\n")
+        return
     else:
         print(f"Unknown format: {args.format}", file=sys.stderr)
         sys.exit(1)
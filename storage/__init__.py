@@ -1,5 +1,7 @@
 """Storage modules for persisting data."""
 
+from config import settings
+
 from .base import StorageBackend
 from .airtable import AirtableStorage
 from .sqlite import SQLiteStorage
@@ -19,7 +21,9 @@ def get_storage(backend: str = "airtable", **kwargs) -> StorageBackend:
         ValueError: If backend type is unknown.
     """
     if backend == "airtable":
-        return AirtableStorage()
+        return AirtableStorage(
+            category_counts_table=settings.airtable_category_counts_table or None
+        )
     elif backend == "sqlite":
         return SQLiteStorage(**kwargs)
     else:
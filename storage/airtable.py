@@ -1,16 +1,114 @@
 """Airtable storage integration."""
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
+from functools import cached_property
+from typing import Any, Callable, Iterator, Sequence
 
+import orjson
 from pyairtable import Api, Table
 from pyairtable.formulas import match
+from requests import HTTPError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config import settings
 from scrapers.base import RawDataPoint
 from analysis.classifier import ClassifiedInsight, ProblemCategory
 from storage.base import StorageBackend
 
+# Connect and read timeouts in seconds; pyairtable waits forever by default
+_TIMEOUT = (10, 60)
+# Rate limiting plus transient server errors are retried with backoff
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Methods safe to replay after a server error or read timeout; POST is left
+# out because a batch_create may have committed before the error
+_IDEMPOTENT_METHODS = Retry.DEFAULT_ALLOWED_METHODS | {"PATCH"}
+# Largest page the Airtable list endpoint returns
+_MAX_PAGE_SIZE = 100
+# Airtable allows 5 requests per second per base
+_REQUESTS_PER_SECOND = 5
+# Records per batch_create request, the Airtable API maximum
+_MAX_BATCH_SIZE = 10
+# Batch requests in flight at once from the async save path
+_MAX_CONCURRENT_WRITES = 8
+# Longest text Airtable accepts in a long text field
+_MAX_CONTENT_LENGTH = 100_000
+# Category filter formulas, built once rather than on every read
+_CATEGORY_FORMULAS = {c: str(match({"category": c.value})) for c in ProblemCategory}
+
+
+class _RateLimiter:
+    """Blocking token bucket spacing requests interval seconds apart on average.
+
+    Thread-safe counterpart of scrapers.base.RateLimiter. Up to burst
+    requests may start back to back; later ones wait only as long as the
+    budget requires, in arrival order.
+    """
+
+    def __init__(self, interval: float, burst: int = 1):
+        """Initialize the limiter.
+
+        Args:
+            interval: Seconds per token; 0 or less disables limiting.
+            burst: Most tokens that can be banked, starting full.
+        """
+        self.interval = interval
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available and take it."""
+        if self.interval <= 0:
+            return
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) / self.interval
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                time.sleep((1 - self._tokens) * self.interval)
+
+
+class _IdempotentRetry(Retry):
+    """Retry policy that replays any method on 429 but others only if idempotent.
+
+    A 429 means Airtable rejected the request without acting on it, so even
+    a POST can be sent again. Server errors and read timeouts are retried
+    only for the methods in allowed_methods.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429:
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class _ThrottledAdapter(HTTPAdapter):
+    """HTTP adapter that takes a rate limiter token before each request."""
+
+    def __init__(self, limiter: _RateLimiter, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._limiter = limiter
+
+    def send(self, request, **kwargs):
+        self._limiter.acquire()
+        return super().send(request, **kwargs)
+
+
+def _fields_key(fields: list[str] | None) -> tuple[str, ...] | None:
+    """Hashable form of a field projection for read cache keys."""
+    return tuple(fields) if fields is not None else None
+
 
 class AirtableStorage(StorageBackend):
     """Storage backend using Airtable."""
@@ -21,16 +119,126 @@ class AirtableStorage(StorageBackend):
     CLUSTERS_TABLE = "Problem Clusters"
     SCORES_TABLE = "Opportunity Scores"
 
-    def __init__(self):
-        self.api = Api(settings.airtable_api_key)
+    def __init__(self, cache_ttl: float = 30.0, category_counts_table: str | None = None):
+        """Initialize Airtable storage.
+
+        Args:
+            cache_ttl: Seconds to reuse insight, cluster and score reads.
+                Writes made through this instance drop the written table's
+                entries immediately; the TTL bounds how stale reads can get
+                when others edit the base.
+            category_counts_table: Optional summary table with one record
+                per category and a numeric "count" field (e.g. a COUNT of
+                linked insights). When set, get_stats reads it instead of
+                scanning every insight.
+        """
+        # The Api keeps one pooled keep-alive session for every table call
+        # pyairtable's default count and backoff, with a method-aware policy
+        retry = _IdempotentRetry(
+            total=5,
+            backoff_factor=0.1,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=_IDEMPOTENT_METHODS,
+        )
+        self.api = Api(settings.airtable_api_key, timeout=_TIMEOUT, retry_strategy=retry)
+        # Pace requests under Airtable's rate limit rather than tripping 429s
+        # and waiting out the retry backoff
+        limiter = _RateLimiter(1 / _REQUESTS_PER_SECOND, burst=_REQUESTS_PER_SECOND)
+        self.api.session.mount("https://", _ThrottledAdapter(limiter, max_retries=retry))
         self.base_id = settings.airtable_base_id
-        self._tables: dict[str, Table] = {}
+        # Per table, source_id -> record ID; see _known_ids
+        self._source_ids: dict[str, dict[str, str]] = {}
+        self.cache_ttl = cache_ttl
+        self.category_counts_table = category_counts_table
+        # Keyed by (table name, read arguments...)
+        self._read_cache: dict[tuple, tuple[float, list[dict]]] = {}
+
+    @cached_property
+    def raw_table(self) -> Table:
+        """The Raw Sources table."""
+        return self.api.table(self.base_id, self.RAW_SOURCES_TABLE)
+
+    @cached_property
+    def insights_table(self) -> Table:
+        """The Insights table."""
+        return self.api.table(self.base_id, self.INSIGHTS_TABLE)
+
+    @cached_property
+    def clusters_table(self) -> Table:
+        """The Problem Clusters table."""
+        return self.api.table(self.base_id, self.CLUSTERS_TABLE)
+
+    @cached_property
+    def scores_table(self) -> Table:
+        """The Opportunity Scores table."""
+        return self.api.table(self.base_id, self.SCORES_TABLE)
+
+    def _known_ids(self, table: Table) -> dict[str, str]:
+        """Map each existing source_id in a table to its record ID.
+
+        The map is loaded with one projected scan on first use and kept up
+        to date with records created through this instance, so saves need
+        no per-record lookup request. Records added by other clients after
+        the scan are not seen.
 
-    def _get_table(self, table_name: str) -> Table:
-        """Get or create a table reference."""
-        if table_name not in self._tables:
-            self._tables[table_name] = self.api.table(self.base_id, table_name)
-        return self._tables[table_name]
+        Args:
+            table: A table keyed by source_id.
+
+        Returns:
+            The live source_id to record ID map for the table.
+        """
+        known = self._source_ids.get(table.name)
+        if known is None:
+            records = table.all(fields=["source_id"])
+            known = {
+                r["fields"]["source_id"]: r["id"]
+                for r in records
+                if r["fields"].get("source_id")
+            }
+            self._source_ids[table.name] = known
+        return known
+
+    def _all_fields(
+        self, table: Table, fields: list[str] | None = None, **options: Any
+    ) -> list[dict]:
+        """Scan a table and return each record's fields.
+
+        Args:
+            table: Table to scan.
+            fields: Field names to fetch. Defaults to every field.
+            **options: Other pyairtable list options, e.g. formula or sort.
+
+        Returns:
+            The fields dict of every matching record.
+        """
+        if fields is not None:
+            options["fields"] = fields
+        return [r["fields"] for r in table.all(**options)]
+
+    def _cached(self, key: tuple, read: Callable[[], list[dict]]) -> list[dict]:
+        """Return a cached table read, re-reading when stale.
+
+        Args:
+            key: Cache key whose first item is the table read.
+            read: Callable performing the read.
+
+        Returns:
+            The cached or freshly read records (treat as read-only).
+        """
+        now = time.monotonic()
+        cached = self._read_cache.get(key)
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            return cached[1]
+
+        records = read()
+        self._read_cache[key] = (now, records)
+        return records
+
+    def _invalidate(self, table_name: str) -> None:
+        """Drop cached reads of a table after writing to it."""
+        self._read_cache = {
+            k: v for k, v in self._read_cache.items() if k[0] != table_name
+        }
 
     # -------------------------------------------------------------------------
     # Raw Sources
@@ -45,44 +253,65 @@ class AirtableStorage(StorageBackend):
         Returns:
             The Airtable record ID.
         """
-        table = self._get_table(self.RAW_SOURCES_TABLE)
-
         # Check for duplicates
-        existing = table.first(formula=match({"source_id": datapoint.source_id}))
-        if existing:
-            return existing["id"]
+        known = self._known_ids(self.raw_table)
+        if datapoint.source_id in known:
+            return known[datapoint.source_id]
 
-        record = table.create(
-            {
-                "source_id": datapoint.source_id,
-                "source": datapoint.source.value,
-                "url": datapoint.url,
-                "title": datapoint.title or "",
-                "content": datapoint.content[:100000],  # Airtable field limit
-                "author": datapoint.author or "",
-                "created_at": datapoint.created_at.isoformat(),
-                "scraped_at": datapoint.scraped_at.isoformat(),
-                "metadata": str(datapoint.metadata),
-            }
-        )
+        record = self.raw_table.create(self._raw_fields(datapoint))
+        known[datapoint.source_id] = record["id"]
         return record["id"]
 
-    def get_unprocessed_raw_data(self, limit: int = 100) -> list[dict]:
+    def save_raw_datapoints(self, datapoints: list[RawDataPoint]) -> list[str]:
+        """Save several raw data points with batched creates.
+
+        Args:
+            datapoints: The raw scraped data.
+
+        Returns:
+            The Airtable record IDs, in input order.
+        """
+        return self._save_batch(self.raw_table, datapoints, self._raw_fields)
+
+    def _raw_fields(self, datapoint: RawDataPoint) -> dict[str, Any]:
+        """Build the Raw Sources fields for a data point."""
+        return {
+            "source_id": datapoint.source_id,
+            "source": datapoint.source.value,
+            "url": datapoint.url,
+            "title": datapoint.title or "",
+            # Slicing a short enough str returns it as is, without a copy
+            "content": datapoint.content[:_MAX_CONTENT_LENGTH],
+            "author": datapoint.author or "",
+            "created_at": datapoint.created_at.isoformat(),
+            "scraped_at": datapoint.scraped_at.isoformat(),
+            "metadata": orjson.dumps(datapoint.metadata, default=str).decode(),
+        }
+
+    def get_unprocessed_raw_data(
+        self, limit: int = 100, fields: list[str] | None = None
+    ) -> list[dict]:
         """Get raw data points that haven't been classified yet.
 
         Args:
             limit: Maximum records to return.
+            fields: Field names to fetch. Defaults to every field.
 
         Returns:
             List of raw data records.
         """
-        table = self._get_table(self.RAW_SOURCES_TABLE)
-        # Get records where 'processed' field is empty or false
-        records = table.all(
-            formula="{processed} = ''",
-            max_records=limit,
-        )
-        return [r["fields"] for r in records]
+        options: dict[str, Any] = {"page_size": min(limit, _MAX_PAGE_SIZE)}
+        if fields is not None:
+            options["fields"] = fields
+
+        records: list[dict] = []
+        table = self.raw_table
+        # Unchecked checkboxes are blank, which NOT() treats as false
+        for page in table.iterate(formula="NOT({processed})", max_records=limit, **options):
+            records.extend(r["fields"] for r in page)
+            if len(records) >= limit:
+                break
+        return records[:limit]
 
     def mark_as_processed(self, source_id: str) -> None:
         """Mark a raw data point as processed.
@@ -90,10 +319,23 @@ class AirtableStorage(StorageBackend):
         Args:
             source_id: The source_id of the record.
         """
-        table = self._get_table(self.RAW_SOURCES_TABLE)
-        record = table.first(formula=match({"source_id": source_id}))
-        if record:
-            table.update(record["id"], {"processed": True})
+        self.mark_batch_processed([source_id])
+
+    def mark_batch_processed(self, source_ids: list[str]) -> None:
+        """Mark raw data points as processed with batched updates.
+
+        Record IDs come from the known source_id map, so no lookup request
+        is made per record; source_ids without a record are skipped.
+        pyairtable's batch_update sends up to 10 records per request.
+
+        Args:
+            source_ids: The source_ids of the records.
+        """
+        known = self._known_ids(self.raw_table)
+        record_ids = dict.fromkeys(known[sid] for sid in source_ids if sid in known)
+        if record_ids:
+            table = self.raw_table
+            table.batch_update([{"id": rid, "fields": {"processed": True}} for rid in record_ids])
 
     # -------------------------------------------------------------------------
     # Insights
@@ -109,14 +351,47 @@ class AirtableStorage(StorageBackend):
         Returns:
             The Airtable record ID.
         """
-        table = self._get_table(self.INSIGHTS_TABLE)
-
         # Check for duplicates
-        existing = table.first(formula=match({"source_id": insight.source_id}))
-        if existing:
-            return existing["id"]
+        known = self._known_ids(self.insights_table)
+        if insight.source_id in known:
+            return known[insight.source_id]
 
-        fields: dict[str, Any] = {
+        fields = self._insight_fields(insight)
+        if raw_record_id:
+            fields["raw_source"] = [raw_record_id]
+
+        record = self.insights_table.create(fields)
+        known[insight.source_id] = record["id"]
+        self._invalidate(self.INSIGHTS_TABLE)
+        return record["id"]
+
+    def save_insights(self, insights: list[ClassifiedInsight]) -> list[str]:
+        """Save several classified insights with batched creates.
+
+        Args:
+            insights: The classified insights.
+
+        Returns:
+            The Airtable record IDs, in input order.
+        """
+        return self._save_batch(self.insights_table, insights, self._insight_fields)
+
+    async def save_insights_async(self, insights: list[ClassifiedInsight]) -> list[str]:
+        """Save several classified insights with concurrent batched creates.
+
+        Args:
+            insights: The classified insights.
+
+        Returns:
+            The Airtable record IDs, in input order.
+        """
+        return await self._save_batch_async(
+            self.insights_table, insights, self._insight_fields
+        )
+
+    def _insight_fields(self, insight: ClassifiedInsight) -> dict[str, Any]:
+        """Build the Insights fields for a classified insight."""
+        return {
             "source_id": insight.source_id,
             "source_url": insight.source_url,
             "problem_statement": insight.problem_statement,
@@ -132,34 +407,146 @@ class AirtableStorage(StorageBackend):
             "content_snippet": insight.content_snippet,
         }
 
-        if raw_record_id:
-            fields["raw_source"] = [raw_record_id]
-
-        record = table.create(fields)
-        return record["id"]
-
-    def get_insights_by_category(self, category: ProblemCategory) -> list[dict]:
+    def get_insights_by_category(
+        self, category: ProblemCategory, fields: list[str] | None = None
+    ) -> list[dict]:
         """Get all insights for a specific category.
 
         Args:
             category: The category to filter by.
+            fields: Field names to fetch. Defaults to every field.
 
         Returns:
             List of insight records.
         """
-        table = self._get_table(self.INSIGHTS_TABLE)
-        records = table.all(formula=match({"category": category.value}))
-        return [r["fields"] for r in records]
+        return self._cached(
+            (self.INSIGHTS_TABLE, category.value, _fields_key(fields)),
+            lambda: self._all_fields(
+                self.insights_table, fields, formula=_CATEGORY_FORMULAS[category]
+            ),
+        )
 
-    def get_all_insights(self) -> list[dict]:
+    def get_all_insights(self, fields: list[str] | None = None) -> list[dict]:
         """Get all insights.
 
+        Args:
+            fields: Field names to fetch. Defaults to every field.
+
         Returns:
             List of all insight records.
         """
-        table = self._get_table(self.INSIGHTS_TABLE)
-        records = table.all()
-        return [r["fields"] for r in records]
+        return self._cached(
+            (self.INSIGHTS_TABLE, None, _fields_key(fields)),
+            lambda: self._all_fields(self.insights_table, fields),
+        )
+
+    def iter_all_insights(self, fields: list[str] | None = None) -> Iterator[dict]:
+        """Iterate over all insights a page at a time.
+
+        Records are streamed as pyairtable fetches each page, so only one
+        page is held at once. Unlike get_all_insights, reads are not cached.
+
+        Args:
+            fields: Field names to fetch. Defaults to every field.
+
+        Yields:
+            The fields dict of each insight record.
+        """
+        options: dict[str, Any] = {"page_size": _MAX_PAGE_SIZE}
+        if fields is not None:
+            options["fields"] = fields
+        for page in self.insights_table.iterate(**options):
+            for record in page:
+                yield record["fields"]
+
+    def _save_batch(
+        self,
+        table: Table,
+        items: Sequence[RawDataPoint | ClassifiedInsight],
+        to_fields: Callable[[Any], dict[str, Any]],
+    ) -> list[str]:
+        """Create records for the items not already in a table.
+
+        pyairtable's batch_create sends up to 10 records per request. Items
+        sharing a source_id are created once, from the last of them; later
+        duplicates override earlier ones.
+
+        Args:
+            table: Table to write to, keyed by source_id.
+            items: Data points or insights, matched to records by source_id.
+            to_fields: Builds the record fields for an item.
+
+        Returns:
+            Record IDs in input order; existing records keep their IDs.
+        """
+        new_items = self._new_items(table, items)
+
+        if new_items:
+            created = table.batch_create([to_fields(item) for item in new_items])
+            self._remember_created(table, new_items, created)
+            self._invalidate(table.name)
+        return self._record_ids(table, items)
+
+    async def _save_batch_async(
+        self,
+        table: Table,
+        items: Sequence[RawDataPoint | ClassifiedInsight],
+        to_fields: Callable[[Any], dict[str, Any]],
+    ) -> list[str]:
+        """Create records for new items with concurrent batch requests.
+
+        Same result as _save_batch, but each 10-record chunk is sent from a
+        worker thread, at most _MAX_CONCURRENT_WRITES at a time. The session
+        adapter still paces every request to the base's rate limit.
+        """
+        new_items = await asyncio.to_thread(self._new_items, table, items)
+        if not new_items:
+            return self._record_ids(table, items)
+
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_WRITES)
+
+        async def create(chunk: list[RawDataPoint | ClassifiedInsight]) -> None:
+            async with semaphore:
+                created = await asyncio.to_thread(
+                    table.batch_create, [to_fields(item) for item in chunk]
+                )
+            self._remember_created(table, chunk, created)
+
+        chunks = [
+            new_items[start:start + _MAX_BATCH_SIZE]
+            for start in range(0, len(new_items), _MAX_BATCH_SIZE)
+        ]
+        try:
+            await asyncio.gather(*(create(chunk) for chunk in chunks))
+        finally:
+            self._invalidate(table.name)
+        return self._record_ids(table, items)
+
+    def _new_items(
+        self, table: Table, items: Sequence[RawDataPoint | ClassifiedInsight]
+    ) -> list[RawDataPoint | ClassifiedInsight]:
+        """Return the items with no record yet, one per source_id (the last)."""
+        known = self._known_ids(table)
+        unique = {item.source_id: item for item in items}
+        return [item for source_id, item in unique.items() if source_id not in known]
+
+    def _remember_created(
+        self,
+        table: Table,
+        items: Sequence[RawDataPoint | ClassifiedInsight],
+        created: list[dict[str, Any]],
+    ) -> None:
+        """Add newly created records to the table's known source_id map."""
+        known = self._known_ids(table)
+        for item, record in zip(items, created):
+            known[item.source_id] = record["id"]
+
+    def _record_ids(
+        self, table: Table, items: Sequence[RawDataPoint | ClassifiedInsight]
+    ) -> list[str]:
+        """Map items to their record IDs, or "" where none was created."""
+        known = self._known_ids(table)
+        return [known.get(item.source_id, "") for item in items]
 
     # -------------------------------------------------------------------------
     # Problem Clusters
@@ -185,7 +572,7 @@ class AirtableStorage(StorageBackend):
         Returns:
             The Airtable record ID.
         """
-        table = self._get_table(self.CLUSTERS_TABLE)
+        table = self.clusters_table
 
         record = table.create(
             {
@@ -197,17 +584,22 @@ class AirtableStorage(StorageBackend):
                 "created_at": datetime.utcnow().isoformat(),
             }
         )
+        self._invalidate(self.CLUSTERS_TABLE)
         return record["id"]
 
-    def get_clusters(self) -> list[dict]:
+    def get_clusters(self, fields: list[str] | None = None) -> list[dict]:
         """Get all problem clusters.
 
+        Args:
+            fields: Field names to fetch. Defaults to every field.
+
         Returns:
             List of cluster records.
         """
-        table = self._get_table(self.CLUSTERS_TABLE)
-        records = table.all()
-        return [r["fields"] for r in records]
+        return self._cached(
+            (self.CLUSTERS_TABLE, _fields_key(fields)),
+            lambda: self._all_fields(self.clusters_table, fields),
+        )
 
     # -------------------------------------------------------------------------
     # Opportunity Scores
@@ -239,7 +631,7 @@ class AirtableStorage(StorageBackend):
         Returns:
             The Airtable record ID.
         """
-        table = self._get_table(self.SCORES_TABLE)
+        table = self.scores_table
 
         record = table.create(
             {
@@ -254,17 +646,22 @@ class AirtableStorage(StorageBackend):
                 "scored_at": datetime.utcnow().isoformat(),
             }
         )
+        self._invalidate(self.SCORES_TABLE)
         return record["id"]
 
-    def get_ranked_opportunities(self) -> list[dict]:
+    def get_ranked_opportunities(self, fields: list[str] | None = None) -> list[dict]:
         """Get opportunities ranked by total score.
 
+        Args:
+            fields: Field names to fetch. Defaults to every field.
+
         Returns:
             List of opportunity records sorted by score descending.
         """
-        table = self._get_table(self.SCORES_TABLE)
-        records = table.all(sort=["-total_score"])
-        return [r["fields"] for r in records]
+        return self._cached(
+            (self.SCORES_TABLE, _fields_key(fields)),
+            lambda: self._all_fields(self.scores_table, fields, sort=["-total_score"]),
+        )
 
     # -------------------------------------------------------------------------
     # Stats
@@ -276,27 +673,60 @@ class AirtableStorage(StorageBackend):
         Returns:
             Dictionary with counts and stats.
         """
-        raw_table = self._get_table(self.RAW_SOURCES_TABLE)
-        insights_table = self._get_table(self.INSIGHTS_TABLE)
-        clusters_table = self._get_table(self.CLUSTERS_TABLE)
-        scores_table = self._get_table(self.SCORES_TABLE)
-
-        raw_count = len(raw_table.all())
-        insights_count = len(insights_table.all())
-        clusters_count = len(clusters_table.all())
-        scores_count = len(scores_table.all())
-
-        # Category breakdown
-        insights = insights_table.all()
-        category_counts: dict[str, int] = {}
-        for record in insights:
-            cat = record["fields"].get("category", "other")
-            category_counts[cat] = category_counts.get(cat, 0) + 1
+        # One small field per table is enough to count records
+        projections = [
+            (self.raw_table, ["source_id"]),
+            (self.clusters_table, ["name"]),
+            (self.scores_table, ["cluster_name"]),
+        ]
+        # The reads are independent, so they run side by side
+        with ThreadPoolExecutor(max_workers=len(projections) + 1) as executor:
+            futures = [
+                executor.submit(table.all, fields=fields)
+                for table, fields in projections
+            ]
+            category_future = executor.submit(self._category_counts)
+            raw, clusters, scores = (f.result() for f in futures)
+            category_counts = category_future.result()
 
         return {
-            "raw_data_points": raw_count,
-            "classified_insights": insights_count,
-            "problem_clusters": clusters_count,
-            "scored_opportunities": scores_count,
+            "raw_data_points": len(raw),
+            "classified_insights": sum(category_counts.values()),
+            "problem_clusters": len(clusters),
+            "scored_opportunities": len(scores),
             "category_breakdown": category_counts,
         }
+
+    def _category_counts(self) -> dict[str, int]:
+        """Count insights per category.
+
+        Reads the summary table when one is configured, which costs one
+        request per hundred categories. Without one, or if the base lacks
+        it, falls back to scanning the category of every insight.
+
+        Returns:
+            Insight count by category; uncategorized insights count as "other".
+        """
+        if self.category_counts_table:
+            try:
+                records = self.api.table(self.base_id, self.category_counts_table).all(
+                    fields=["category", "count"]
+                )
+            except HTTPError as e:
+                if e.response is None or e.response.status_code not in (403, 404):
+                    raise
+                # Missing table (Airtable answers 403 or 404); stop asking
+                self.category_counts_table = None
+            else:
+                counts: dict[str, int] = {}
+                for record in records:
+                    fields = record["fields"]
+                    cat = fields.get("category") or "other"
+                    counts[cat] = counts.get(cat, 0) + int(fields.get("count") or 0)
+                return counts
+
+        counts = {}
+        for record in self.insights_table.all(fields=["category"]):
+            cat = record["fields"].get("category", "other")
+            counts[cat] = counts.get(cat, 0) + 1
+        return counts
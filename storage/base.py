@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from scrapers.base import RawDataPoint
 from analysis.classifier import ClassifiedInsight, ProblemCategory
@@ -27,6 +29,20 @@ class StorageBackend(ABC):
         """
         pass
 
+    def save_raw_datapoints(self, datapoints: list[RawDataPoint]) -> list[str]:
+        """Save several raw data points.
+
+        Backends that can write in bulk override this; the default saves
+        one record at a time.
+
+        Args:
+            datapoints: The raw scraped data.
+
+        Returns:
+            The record IDs, in input order.
+        """
+        return [self.save_raw_datapoint(datapoint) for datapoint in datapoints]
+
     @abstractmethod
     def get_unprocessed_raw_data(self, limit: int = 100) -> list[dict]:
         """Get raw data points that haven't been classified yet.
@@ -48,6 +64,18 @@ class StorageBackend(ABC):
         """
         pass
 
+    def mark_batch_processed(self, source_ids: list[str]) -> None:
+        """Mark several raw data points as processed.
+
+        Backends that can update in bulk override this; the default marks
+        one record at a time.
+
+        Args:
+            source_ids: The source_ids of the records.
+        """
+        for source_id in source_ids:
+            self.mark_as_processed(source_id)
+
     # -------------------------------------------------------------------------
     # Insights
     # -------------------------------------------------------------------------
@@ -65,6 +93,33 @@ class StorageBackend(ABC):
         """
         pass
 
+    def save_insights(self, insights: list[ClassifiedInsight]) -> list[str]:
+        """Save several classified insights.
+
+        Backends that can write in bulk override this; the default saves
+        one record at a time.
+
+        Args:
+            insights: The classified insights.
+
+        Returns:
+            The record IDs, in input order.
+        """
+        return [self.save_insight(insight) for insight in insights]
+
+    async def save_insights_async(self, insights: list[ClassifiedInsight]) -> list[str]:
+        """Save several classified insights without blocking the event loop.
+
+        The default runs save_insights in a worker thread.
+
+        Args:
+            insights: The classified insights.
+
+        Returns:
+            The record IDs, in input order.
+        """
+        return await asyncio.to_thread(self.save_insights, insights)
+
     @abstractmethod
     def get_insights_by_category(self, category: ProblemCategory) -> list[dict]:
         """Get all insights for a specific category.
@@ -86,6 +141,17 @@ class StorageBackend(ABC):
         """
         pass
 
+    def iter_all_insights(self) -> Iterator[dict]:
+        """Iterate over all insights.
+
+        Backends that can page through results override this to avoid
+        holding every record at once; the default walks get_all_insights.
+
+        Yields:
+            Insight records.
+        """
+        yield from self.get_all_insights()
+
     # -------------------------------------------------------------------------
     # Clusters (placeholder for future)
     # -------------------------------------------------------------------------
@@ -176,3 +242,9 @@ class StorageBackend(ABC):
             Dictionary with counts and stats.
         """
         pass
+
+    def close(self) -> None:
+        """Release any resources held by the backend.
+
+        Backends holding connections override this; the default does nothing.
+        """
@@ -2,16 +2,65 @@
 
 from __future__ import annotations
 
-import json
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import orjson
 
 from config import settings
 from scrapers.base import RawDataPoint
 from analysis.classifier import ClassifiedInsight, ProblemCategory
 from storage.base import StorageBackend
 
+# Per-connection tuning. WAL lets readers run alongside a writer, and with
+# WAL, synchronous=NORMAL only syncs at checkpoints instead of every commit.
+# cache_size is in KiB when negative (64 MiB); mmap_size is 256 MiB.
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA cache_size = -65536;
+"""
+
+_INSERT_RAW_SQL = """
+    INSERT INTO raw_sources
+    (source_id, source, url, title, content, author, created_at, scraped_at, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_INSIGHT_SQL = """
+    INSERT INTO insights
+    (source_id, source_url, problem_statement, category, secondary_categories,
+     frustration_level, clarity_score, willingness_to_pay, wtp_quotes,
+     current_workaround, keywords, original_title, content_snippet, raw_source_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Appended to an insert to dedupe on source_id in the same statement: a
+# duplicate leaves the existing row as it is and returns its id
+_RETURNING_ID_SQL = """
+    ON CONFLICT(source_id) DO UPDATE SET source_id = excluded.source_id
+    RETURNING id
+"""
+
+# Statements are built once so every call passes the same SQL text and
+# hits the connection's prepared-statement cache instead of re-parsing
+_UPSERT_RAW_SQL = _INSERT_RAW_SQL + _RETURNING_ID_SQL
+_UPSERT_INSIGHT_SQL = _INSERT_INSIGHT_SQL + _RETURNING_ID_SQL
+
+# Bulk source_id lookups take the IDs as one JSON array parameter, so the
+# statement text does not vary with the batch size
+_IDS_BY_SOURCE_ID_SQL = {
+    table: f"""
+        SELECT id, source_id FROM {table}
+        WHERE source_id IN (SELECT value FROM json_each(?))
+    """
+    for table in ("raw_sources", "insights")
+}
+
 
 class SQLiteStorage(StorageBackend):
     """Storage backend using SQLite."""
@@ -27,19 +76,59 @@ class SQLiteStorage(StorageBackend):
 
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        # Every per-thread connection, so close() can reach them all
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
 
         self._init_db()
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        conn = sqlite3.connect(str(self.db_path))
+    def _get_connection(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """Open a new database connection."""
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=check_same_thread)
         conn.row_factory = sqlite3.Row
+        conn.executescript(_CONNECTION_PRAGMAS)
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use.
+
+        Each thread keeps one connection for the life of the storage, so
+        repeated calls skip the connect and pragma setup and keep a warm
+        page cache. SQLite's own locking serializes writers across threads.
+        Connections are registered so close() can close them from any
+        thread; each is still only used by the thread that opened it.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._get_connection(check_same_thread=False)
+            with self._connections_lock:
+                self._connections.append(conn)
         return conn
 
+    def close(self) -> None:
+        """Close every connection opened by any thread.
+
+        Runs PRAGMA optimize on each first so the query planner statistics
+        stay current, as SQLite recommends before closing a connection.
+        Call it once the storage is no longer in use by other threads; a
+        later call from any thread opens a fresh connection.
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.execute("PRAGMA optimize")
+            conn.close()
+
     def _init_db(self) -> None:
         """Initialize database schema."""
-        conn = self._get_connection()
-        try:
+        conn = self._connection()
+        with conn:
+            # The journal mode is stored in the database file, so setting it
+            # once here covers every later connection
+            conn.execute("PRAGMA journal_mode = WAL")
+            self._drop_full_processed_index(conn)
             conn.executescript("""
                 -- Raw scraped data
                 CREATE TABLE IF NOT EXISTS raw_sources (
@@ -52,8 +141,8 @@ class SQLiteStorage(StorageBackend):
                     author TEXT,
                     created_at TIMESTAMP NOT NULL,
                     scraped_at TIMESTAMP NOT NULL,
-                    metadata TEXT,
-                    processed BOOLEAN DEFAULT FALSE
+                    metadata BLOB,
+                    processed BOOLEAN NOT NULL DEFAULT FALSE
                 );
 
                 -- Classified insights
@@ -81,7 +170,7 @@ class SQLiteStorage(StorageBackend):
                     name TEXT NOT NULL,
                     description TEXT NOT NULL,
                     category TEXT NOT NULL,
-                    insight_ids TEXT,
+                    insight_ids BLOB,
                     frequency INTEGER NOT NULL,
                     created_at TIMESTAMP NOT NULL
                 );
@@ -101,10 +190,13 @@ class SQLiteStorage(StorageBackend):
                 );
 
                 -- Indexes for common queries
-                CREATE INDEX IF NOT EXISTS idx_raw_sources_processed ON raw_sources(processed);
+                -- Partial: only unprocessed rows, which is all the queue query reads
+                CREATE INDEX IF NOT EXISTS idx_raw_sources_processed ON raw_sources(id)
+                    WHERE processed = 0;
                 CREATE INDEX IF NOT EXISTS idx_raw_sources_source ON raw_sources(source);
                 CREATE INDEX IF NOT EXISTS idx_insights_category ON insights(category);
-                CREATE INDEX IF NOT EXISTS idx_opportunity_scores_total ON opportunity_scores(total_score DESC);
+                CREATE INDEX IF NOT EXISTS idx_opportunity_scores_total
+                    ON opportunity_scores(total_score DESC);
 
                 -- Interview participants (anonymized)
                 CREATE TABLE IF NOT EXISTS interview_participants (
@@ -145,13 +237,43 @@ class SQLiteStorage(StorageBackend):
                 );
 
                 -- Indexes for interview data
-                CREATE INDEX IF NOT EXISTS idx_interview_participants_id ON interview_participants(participant_id);
-                CREATE INDEX IF NOT EXISTS idx_interview_insights_category ON interview_insights(pain_category);
-                CREATE INDEX IF NOT EXISTS idx_interview_insights_participant ON interview_insights(participant_id);
+                CREATE INDEX IF NOT EXISTS idx_interview_participants_id
+                    ON interview_participants(participant_id);
+                CREATE INDEX IF NOT EXISTS idx_interview_participants_date
+                    ON interview_participants(interview_date);
+                CREATE INDEX IF NOT EXISTS idx_interview_insights_category
+                    ON interview_insights(pain_category);
+                CREATE INDEX IF NOT EXISTS idx_interview_insights_participant
+                    ON interview_insights(participant_id);
             """)
-            conn.commit()
-        finally:
-            conn.close()
+
+    @staticmethod
+    def _drop_full_processed_index(conn: sqlite3.Connection) -> None:
+        """Drop the old whole-column processed index so it is rebuilt as partial.
+
+        The partial index only covers processed = 0, so rows left NULL by
+        older versions are normalized to 0 first.
+        """
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'index' AND name = ?",
+            ("idx_raw_sources_processed",),
+        ).fetchone()
+        if row is not None and "WHERE" not in row["sql"].upper():
+            conn.execute("UPDATE raw_sources SET processed = 0 WHERE processed IS NULL")
+            conn.execute("DROP INDEX idx_raw_sources_processed")
+
+    def _fetch_dicts(self, sql: str, params: tuple = ()) -> list[dict]:
+        """Run a query and return its rows as plain dicts.
+
+        The rows are fetched as tuples and zipped with the column names read
+        once per query, which is cheaper than building sqlite3.Row objects
+        and copying each into a dict by name.
+        """
+        cursor = self._connection().cursor()
+        cursor.row_factory = None
+        cursor.execute(sql, params)
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row)) for row in cursor]
 
     # -------------------------------------------------------------------------
     # Raw Sources
@@ -166,39 +288,41 @@ class SQLiteStorage(StorageBackend):
         Returns:
             The record ID as string.
         """
-        conn = self._get_connection()
-        try:
-            # Check for duplicates
-            cursor = conn.execute(
-                "SELECT id FROM raw_sources WHERE source_id = ?",
-                (datapoint.source_id,)
-            )
-            existing = cursor.fetchone()
-            if existing:
-                return str(existing["id"])
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(_UPSERT_RAW_SQL, self._raw_row(datapoint))
+            return str(cursor.fetchone()[0])
 
-            cursor = conn.execute(
-                """
-                INSERT INTO raw_sources
-                (source_id, source, url, title, content, author, created_at, scraped_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    datapoint.source_id,
-                    datapoint.source.value,
-                    datapoint.url,
-                    datapoint.title or "",
-                    datapoint.content[:100000],
-                    datapoint.author or "",
-                    datapoint.created_at.isoformat(),
-                    datapoint.scraped_at.isoformat(),
-                    json.dumps(datapoint.metadata),
-                )
-            )
-            conn.commit()
-            return str(cursor.lastrowid)
-        finally:
-            conn.close()
+    def save_raw_datapoints(self, datapoints: list[RawDataPoint]) -> list[str]:
+        """Save several raw data points in one transaction.
+
+        Existing source_ids are looked up in bulk and the rest inserted with
+        executemany. If a source_id repeats, its last data point is saved.
+
+        Args:
+            datapoints: The raw scraped data.
+
+        Returns:
+            The record IDs as strings, in input order.
+        """
+        return self._save_many(
+            "raw_sources", _INSERT_RAW_SQL, datapoints, self._raw_row
+        )
+
+    @staticmethod
+    def _raw_row(datapoint: RawDataPoint) -> tuple:
+        """Build the raw_sources insert parameters for a data point."""
+        return (
+            datapoint.source_id,
+            datapoint.source.value,
+            datapoint.url,
+            datapoint.title or "",
+            datapoint.content[:100000],
+            datapoint.author or "",
+            datapoint.created_at.isoformat(),
+            datapoint.scraped_at.isoformat(),
+            orjson.dumps(datapoint.metadata),
+        )
 
     def get_unprocessed_raw_data(self, limit: int = 100) -> list[dict]:
         """Get raw data points that haven't been classified yet.
@@ -209,21 +333,17 @@ class SQLiteStorage(StorageBackend):
         Returns:
             List of raw data records.
         """
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                """
-                SELECT source_id, source, url, title, content, author, created_at, metadata
-                FROM raw_sources
-                WHERE processed = FALSE OR processed IS NULL
-                LIMIT ?
-                """,
-                (limit,)
-            )
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
-        finally:
-            conn.close()
+        return self._fetch_dicts(
+            """
+            SELECT source_id, source, url, title, content, author, created_at,
+                   CAST(metadata AS TEXT) AS metadata
+            FROM raw_sources
+            WHERE processed = 0
+            ORDER BY id
+            LIMIT ?
+            """,
+            (limit,)
+        )
 
     def mark_as_processed(self, source_id: str) -> None:
         """Mark a raw data point as processed.
@@ -231,15 +351,12 @@ class SQLiteStorage(StorageBackend):
         Args:
             source_id: The source_id of the record.
         """
-        conn = self._get_connection()
-        try:
+        conn = self._connection()
+        with conn:
             conn.execute(
                 "UPDATE raw_sources SET processed = TRUE WHERE source_id = ?",
                 (source_id,)
             )
-            conn.commit()
-        finally:
-            conn.close()
 
     # -------------------------------------------------------------------------
     # Insights
@@ -255,46 +372,93 @@ class SQLiteStorage(StorageBackend):
         Returns:
             The record ID as string.
         """
-        conn = self._get_connection()
-        try:
-            # Check for duplicates
-            cursor = conn.execute(
-                "SELECT id FROM insights WHERE source_id = ?",
-                (insight.source_id,)
-            )
-            existing = cursor.fetchone()
-            if existing:
-                return str(existing["id"])
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(_UPSERT_INSIGHT_SQL, self._insight_row(insight, raw_record_id))
+            return str(cursor.fetchone()[0])
 
-            cursor = conn.execute(
-                """
-                INSERT INTO insights
-                (source_id, source_url, problem_statement, category, secondary_categories,
-                 frustration_level, clarity_score, willingness_to_pay, wtp_quotes,
-                 current_workaround, keywords, original_title, content_snippet, raw_source_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    insight.source_id,
-                    insight.source_url,
-                    insight.problem_statement,
-                    insight.category.value,
-                    ", ".join(c.value for c in insight.secondary_categories),
-                    insight.frustration_level,
-                    insight.clarity_score,
-                    insight.willingness_to_pay,
-                    "\n".join(insight.wtp_quotes),
-                    insight.current_workaround or "",
-                    ", ".join(insight.keywords),
-                    insight.original_title or "",
-                    insight.content_snippet,
-                    int(raw_record_id) if raw_record_id else None,
+    def save_insights(self, insights: list[ClassifiedInsight]) -> list[str]:
+        """Save several classified insights in one transaction.
+
+        Existing source_ids are looked up in bulk and the rest inserted with
+        executemany. If a source_id repeats, its last insight is saved.
+
+        Args:
+            insights: The classified insights.
+
+        Returns:
+            The record IDs as strings, in input order.
+        """
+        return self._save_many(
+            "insights", _INSERT_INSIGHT_SQL, insights, self._insight_row
+        )
+
+    @staticmethod
+    def _insight_row(insight: ClassifiedInsight, raw_record_id: str | None = None) -> tuple:
+        """Build the insights insert parameters for a classified insight."""
+        return (
+            insight.source_id,
+            insight.source_url,
+            insight.problem_statement,
+            insight.category.value,
+            ", ".join(c.value for c in insight.secondary_categories),
+            insight.frustration_level,
+            insight.clarity_score,
+            insight.willingness_to_pay,
+            "\n".join(insight.wtp_quotes),
+            insight.current_workaround or "",
+            ", ".join(insight.keywords),
+            insight.original_title or "",
+            insight.content_snippet,
+            int(raw_record_id) if raw_record_id else None,
+        )
+
+    def _save_many(
+        self,
+        table: str,
+        insert_sql: str,
+        items: list[RawDataPoint] | list[ClassifiedInsight],
+        to_row: Callable[[Any], tuple],
+    ) -> list[str]:
+        """Insert the items whose source_id is not yet in a table.
+
+        Runs in a single BEGIN IMMEDIATE transaction, so no other writer can
+        add a source_id between the lookup and the insert.
+
+        Args:
+            table: Table keyed by a unique source_id column.
+            insert_sql: INSERT statement taking to_row's parameters.
+            items: Data points or insights; the last item per source_id wins.
+            to_row: Builds the insert parameters for an item.
+
+        Returns:
+            The record IDs as strings, in input order.
+        """
+        if not items:
+            return []
+        unique = {item.source_id: item for item in items}
+
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            ids = self._ids_by_source_id(conn, table, list(unique))
+            new = [item for source_id, item in unique.items() if source_id not in ids]
+            if new:
+                conn.executemany(insert_sql, [to_row(item) for item in new])
+                ids.update(
+                    self._ids_by_source_id(conn, table, [item.source_id for item in new])
                 )
-            )
-            conn.commit()
-            return str(cursor.lastrowid)
-        finally:
-            conn.close()
+        return [str(ids[item.source_id]) for item in items]
+
+    @staticmethod
+    def _ids_by_source_id(
+        conn: sqlite3.Connection, table: str, source_ids: list[str]
+    ) -> dict[str, int]:
+        """Map the source_ids present in a table to their row IDs."""
+        cursor = conn.execute(
+            _IDS_BY_SOURCE_ID_SQL[table], (orjson.dumps(source_ids).decode(),)
+        )
+        return {row["source_id"]: row["id"] for row in cursor}
 
     def get_insights_by_category(self, category: ProblemCategory) -> list[dict]:
         """Get all insights for a specific category.
@@ -305,16 +469,10 @@ class SQLiteStorage(StorageBackend):
         Returns:
             List of insight records.
         """
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT * FROM insights WHERE category = ?",
-                (category.value,)
-            )
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
-        finally:
-            conn.close()
+        return self._fetch_dicts(
+            "SELECT * FROM insights WHERE category = ?",
+            (category.value,)
+        )
 
     def get_all_insights(self) -> list[dict]:
         """Get all insights.
@@ -322,14 +480,67 @@ class SQLiteStorage(StorageBackend):
         Returns:
             List of all insight records.
         """
+        return self._fetch_dicts("SELECT * FROM insights")
+
+    def export_insights_json(self) -> bytes:
+        """Export every insight as a JSON array built inside SQLite.
+
+        json_group_array/json_object assemble the document in one query,
+        skipping per-row dicts and Python-side JSON encoding. The output
+        matches encoding get_all_insights() as JSON.
+
+        Returns:
+            UTF-8 JSON bytes: a list of insight objects in id order.
+        """
+        conn = self._connection()
+        columns = [row["name"] for row in conn.execute("PRAGMA table_info(insights)")]
+        pairs = ", ".join(f"'{name}', {name}" for name in columns)
+        row = conn.execute(
+            f"""
+            SELECT json_group_array(json_object({pairs}))
+            FROM (SELECT * FROM insights ORDER BY id)
+            """
+        ).fetchone()
+        return row[0].encode()
+
+    def iter_all_insights(self, batch_size: int = 1000) -> Iterator[dict]:
+        """Iterate over all insights, fetching batch_size rows at a time.
+
+        Uses its own connection, so writes made through this storage while
+        iterating do not disturb the read. The connection closes when the
+        iterator is exhausted or closed.
+
+        Args:
+            batch_size: Rows pulled from SQLite per fetch.
+
+        Yields:
+            Insight records as dicts.
+        """
         conn = self._get_connection()
         try:
-            cursor = conn.execute("SELECT * FROM insights")
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.arraysize = batch_size
+            cursor.execute("SELECT * FROM insights")
+            names = [column[0] for column in cursor.description]
+            for rows in iter(cursor.fetchmany, []):
+                for row in rows:
+                    yield dict(zip(names, row))
         finally:
             conn.close()
 
+    def get_distinct_categories(self) -> set[str]:
+        """Get the set of categories that have at least one insight.
+
+        Returns:
+            Set of category values.
+        """
+        conn = self._connection()
+        cursor = conn.execute(
+            "SELECT DISTINCT COALESCE(category, 'other') FROM insights"
+        )
+        return {row[0] for row in cursor.fetchall()}
+
     # -------------------------------------------------------------------------
     # Problem Clusters
     # -------------------------------------------------------------------------
@@ -354,8 +565,8 @@ class SQLiteStorage(StorageBackend):
         Returns:
             The record ID as string.
         """
-        conn = self._get_connection()
-        try:
+        conn = self._connection()
+        with conn:
             cursor = conn.execute(
                 """
                 INSERT INTO clusters
@@ -366,15 +577,12 @@ class SQLiteStorage(StorageBackend):
                     name,
                     description,
                     category.value,
-                    json.dumps(insight_ids),
+                    orjson.dumps(insight_ids),
                     frequency,
                     datetime.utcnow().isoformat(),
                 )
             )
-            conn.commit()
             return str(cursor.lastrowid)
-        finally:
-            conn.close()
 
     def get_clusters(self) -> list[dict]:
         """Get all problem clusters.
@@ -382,13 +590,14 @@ class SQLiteStorage(StorageBackend):
         Returns:
             List of cluster records.
         """
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute("SELECT * FROM clusters")
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
-        finally:
-            conn.close()
+        # JSON is stored as bytes; hand it back as text like older rows
+        return self._fetch_dicts(
+            """
+            SELECT id, name, description, category,
+                   CAST(insight_ids AS TEXT) AS insight_ids, frequency, created_at
+            FROM clusters
+            """
+        )
 
     # -------------------------------------------------------------------------
     # Opportunity Scores
@@ -420,8 +629,8 @@ class SQLiteStorage(StorageBackend):
         Returns:
             The record ID as string.
         """
-        conn = self._get_connection()
-        try:
+        conn = self._connection()
+        with conn:
             cursor = conn.execute(
                 """
                 INSERT INTO opportunity_scores
@@ -441,10 +650,7 @@ class SQLiteStorage(StorageBackend):
                     datetime.utcnow().isoformat(),
                 )
             )
-            conn.commit()
             return str(cursor.lastrowid)
-        finally:
-            conn.close()
 
     def get_ranked_opportunities(self) -> list[dict]:
         """Get opportunities ranked by total score.
@@ -452,15 +658,9 @@ class SQLiteStorage(StorageBackend):
         Returns:
             List of opportunity records sorted by score descending.
         """
-        conn = self._get_connection()
-        try:
-            cursor = conn.execute(
-                "SELECT * FROM opportunity_scores ORDER BY total_score DESC"
-            )
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
-        finally:
-            conn.close()
+        return self._fetch_dicts(
+            "SELECT * FROM opportunity_scores ORDER BY total_score DESC"
+        )
 
     # -------------------------------------------------------------------------
     # Stats
@@ -472,52 +672,50 @@ class SQLiteStorage(StorageBackend):
         Returns:
             Dictionary with counts and stats.
         """
-        conn = self._get_connection()
-        try:
-            raw_count = conn.execute("SELECT COUNT(*) FROM raw_sources").fetchone()[0]
-            insights_count = conn.execute("SELECT COUNT(*) FROM insights").fetchone()[0]
-            clusters_count = conn.execute("SELECT COUNT(*) FROM clusters").fetchone()[0]
-            scores_count = conn.execute("SELECT COUNT(*) FROM opportunity_scores").fetchone()[0]
-
-            # Interview counts
-            participants_count = conn.execute(
-                "SELECT COUNT(*) FROM interview_participants"
-            ).fetchone()[0]
-            interview_insights_count = conn.execute(
-                "SELECT COUNT(*) FROM interview_insights"
-            ).fetchone()[0]
-
-            # Category breakdown
-            cursor = conn.execute(
-                "SELECT category, COUNT(*) as count FROM insights GROUP BY category"
-            )
-            category_counts = {row["category"]: row["count"] for row in cursor.fetchall()}
-
-            # Interview category breakdown
-            cursor = conn.execute(
-                "SELECT pain_category, COUNT(*) as count FROM interview_insights GROUP BY pain_category"
-            )
-            interview_category_counts = {
-                row["pain_category"]: row["count"] for row in cursor.fetchall()
-            }
-
-            return {
-                "raw_data_points": raw_count,
-                "classified_insights": insights_count,
-                "problem_clusters": clusters_count,
-                "scored_opportunities": scores_count,
-                "category_breakdown": category_counts,
-                "interview_participants": participants_count,
-                "interview_insights": interview_insights_count,
-                "interview_category_breakdown": interview_category_counts,
-            }
-        finally:
-            conn.close()
+        conn = self._connection()
+        counts = conn.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM raw_sources) AS raw_count,
+                (SELECT COUNT(*) FROM insights) AS insights_count,
+                (SELECT COUNT(*) FROM clusters) AS clusters_count,
+                (SELECT COUNT(*) FROM opportunity_scores) AS scores_count,
+                (SELECT COUNT(*) FROM interview_participants) AS participants_count,
+                (SELECT COUNT(*) FROM interview_insights) AS interview_insights_count
+            """
+        ).fetchone()
+
+        # Scraped and interview category breakdowns, tagged by table
+        cursor = conn.execute(
+            """
+            SELECT 'insights' AS tbl, category, COUNT(*) AS count
+            FROM insights GROUP BY category
+            UNION ALL
+            SELECT 'interview_insights', pain_category, COUNT(*)
+            FROM interview_insights GROUP BY pain_category
+            """
+        )
+        category_counts: dict[str, int] = {}
+        interview_category_counts: dict[str, int] = {}
+        for row in cursor:
+            target = category_counts if row["tbl"] == "insights" else interview_category_counts
+            target[row["category"]] = row["count"]
+
+        return {
+            "raw_data_points": counts["raw_count"],
+            "classified_insights": counts["insights_count"],
+            "problem_clusters": counts["clusters_count"],
+            "scored_opportunities": counts["scores_count"],
+            "category_breakdown": category_counts,
+            "interview_participants": counts["participants_count"],
+            "interview_insights": counts["interview_insights_count"],
+            "interview_category_breakdown": interview_category_counts,
+        }
 
     def clear_all(self) -> None:
         """Clear all data from the database. Useful for testing."""
-        conn = self._get_connection()
-        try:
+        conn = self._connection()
+        with conn:
             conn.executescript("""
                 DELETE FROM opportunity_scores;
                 DELETE FROM clusters;
@@ -526,6 +724,3 @@ class SQLiteStorage(StorageBackend):
                 DELETE FROM interview_insights;
                 DELETE FROM interview_participants;
             """)
-            conn.commit()
-        finally:
-            conn.close()
@@ -9,6 +9,7 @@ These tests verify the full interview research pipeline works end-to-end:
 Run with: pytest tests/e2e/test_interview_research.py -v -m e2e
 """
 
+import io
 import json
 import tempfile
 from datetime import datetime, timedelta
@@ -126,6 +127,31 @@ class TestInterviewStorageOperations:
         assert insights[0].wtp_amount_low == 20
         assert insights[0].wtp_amount_high == 40
 
+    def test_e2e_iter_all_insights(self, interview_storage, sample_participant, sample_insight):
+        """Test streaming insights matches the list API."""
+        storage, _, _ = interview_storage
+
+        storage.save_participant(sample_participant)
+        storage.save_insight(sample_insight)
+
+        streamed = list(storage.iter_all_insights())
+        assert streamed == storage.get_all_insights()
+        assert streamed[0].verbatim_quotes == sample_insight.verbatim_quotes
+
+    def test_e2e_iter_insight_rows(self, interview_storage, sample_participant, sample_insight):
+        """Test export rows carry decoded values and omit private fields."""
+        storage, _, _ = interview_storage
+
+        storage.save_participant(sample_participant)
+        storage.save_insight(sample_insight)
+
+        [row] = storage.iter_insight_rows()
+        assert row["interview_id"] == sample_insight.interview_id
+        assert row["pain_category"] == sample_insight.pain_category.value
+        assert row["verbatim_quotes"] == sample_insight.verbatim_quotes
+        assert "interviewer_notes" not in row
+        assert "recording_url" not in row
+
     def test_e2e_multiple_participants_and_insights(self, interview_storage):
         """Test with multiple participants and insights."""
         storage, _, _ = interview_storage
@@ -182,6 +208,9 @@ class TestInterviewStorageOperations:
         beta_testers = storage.get_beta_testers()
         assert len(beta_testers) == 2  # P000 and P002
 
+        recent = storage.get_recent_participants(datetime.utcnow() - timedelta(days=1, hours=12))
+        assert [p.participant_id for p in recent] == ["P000", "P001"]
+
     def test_e2e_category_queries(self, interview_storage, sample_participant, sample_insight):
         """Test querying insights by category."""
         storage, _, _ = interview_storage
@@ -261,6 +290,21 @@ class TestInterviewStorageOperations:
         # avg_wtp uses COALESCE(wtp_amount_low, wtp_amount_high), so it's the low value
         assert stats["avg_wtp_amount"] == 20.0
 
+    def test_e2e_statistics_refresh_after_write(
+        self, interview_storage, sample_participant, sample_insight
+    ):
+        """Test cached statistics are invalidated by writes."""
+        storage, _, _ = interview_storage
+
+        storage.save_participant(sample_participant)
+        assert storage.get_interview_stats()["total_insights"] == 0
+        assert storage.get_category_summary() == {}
+
+        storage.save_insight(sample_insight)
+
+        assert storage.get_interview_stats()["total_insights"] == 1
+        assert storage.get_category_summary()["analytics"]["count"] == 1
+
     def test_e2e_category_summary(self, interview_storage, sample_participant):
         """Test category summary generation."""
         storage, _, _ = interview_storage
@@ -525,6 +569,22 @@ class TestReportExport:
         assert len(data["insights"]) == 1
         assert data["insights"][0]["pain_category"] == "analytics"
 
+    def test_e2e_json_export_to_stream(self, interview_storage, sample_participant, sample_insight):
+        """Test JSON export written straight to a binary stream."""
+        storage, main_storage, _ = interview_storage
+
+        storage.save_participant(sample_participant)
+        storage.save_insight(sample_insight)
+
+        from scripts.export_interview_report import export_json
+
+        out = io.BytesIO()
+        assert export_json(storage, main_storage, out) is None
+        data = json.loads(out.getvalue())
+
+        assert data["stats"]["total_participants"] == 1
+        assert len(data["insights"]) == 1
+
     def test_e2e_export_script_cli(self, interview_storage, sample_participant, sample_insight):
         """Test export script via subprocess."""
         storage, main_storage, db_path = interview_storage
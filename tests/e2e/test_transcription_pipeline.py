@@ -19,8 +19,11 @@ from research.transcription import (
     Transcript,
     TranscriptSegment,
     parse_vtt,
+    parse_vtt_bytes,
     import_vtt_file,
+    iter_vtt_segments,
     get_default_transcript_dir,
+    load_transcripts,
 )
 from research.transcript_classifier import (
     TranscriptClassifier,
@@ -113,6 +116,13 @@ class TestVTTParser:
         segments = parse_vtt("WEBVTT\n\n")
         assert segments == []
 
+    def test_parse_vtt_bytes_matches_parse_vtt(self, sample_vtt_content):
+        """Test the bytes parser yields the same segments as the str parser."""
+        expected = parse_vtt(sample_vtt_content)
+        segments = parse_vtt_bytes(sample_vtt_content.encode("utf-8"))
+
+        assert segments == expected
+
 
 @pytest.mark.e2e
 class TestVTTImport:
@@ -150,6 +160,55 @@ class TestVTTImport:
         with pytest.raises(FileNotFoundError):
             import_vtt_file(Path("/nonexistent/file.vtt"), output_dir=temp_output_dir)
 
+    def test_import_vtt_file_empty(self, temp_output_dir):
+        """Test VTT import of an empty file."""
+        empty_vtt = temp_output_dir / "empty.vtt"
+        empty_vtt.write_bytes(b"")
+
+        transcript = import_vtt_file(empty_vtt)
+
+        assert transcript.segments == []
+        assert transcript.full_text == ""
+
+    def test_iter_vtt_segments_window(self):
+        """Test streaming only the segments inside a time window."""
+        all_segments = list(iter_vtt_segments(SAMPLE_VTT))
+        window_start = all_segments[1].start
+        window_end = all_segments[3].start
+
+        segments = list(iter_vtt_segments(SAMPLE_VTT, start=window_start, end=window_end))
+
+        assert segments == [
+            seg for seg in all_segments
+            if seg.end >= window_start and seg.start <= window_end
+        ]
+
+    def test_iter_vtt_segments_from_file_object(self):
+        """Test streaming segments from an open binary file."""
+        with open(SAMPLE_VTT, "rb") as f:
+            segments = list(iter_vtt_segments(f))
+
+        assert segments == list(iter_vtt_segments(SAMPLE_VTT))
+
+    def test_iter_vtt_segments_from_str_path(self):
+        """Test streaming VTT segments from a plain string path."""
+        segments = list(iter_vtt_segments(str(SAMPLE_VTT)))
+
+        assert segments
+        assert segments == list(iter_vtt_segments(SAMPLE_VTT))
+
+    def test_default_transcript_dir_follows_cwd(self, tmp_path, monkeypatch):
+        """Test the memoized default directory is resolved per working directory."""
+        project = tmp_path / "project"
+        (project / "sub").mkdir(parents=True)
+        (project / "pyproject.toml").write_text("")
+
+        monkeypatch.chdir(project / "sub")
+        assert get_default_transcript_dir() == project / "data" / "interviews" / "transcripts"
+
+        monkeypatch.chdir(tmp_path)
+        assert get_default_transcript_dir() == tmp_path / "data" / "interviews" / "transcripts"
+
 
 @pytest.mark.e2e
 class TestVTTImportCLI:
@@ -218,6 +277,23 @@ class TestTranscriptModel:
         assert len(transcript.segments) > 0
         assert "inventory" in transcript.full_text.lower()
 
+    def test_transcript_from_json_bytes(self):
+        """Test loading transcript from JSON bytes."""
+        transcript = Transcript.from_json_bytes(SAMPLE_TRANSCRIPT.read_bytes())
+
+        assert transcript == Transcript.from_json_file(SAMPLE_TRANSCRIPT)
+
+    def test_load_transcripts_from_directory(self, temp_output_dir):
+        """Test batch loading transcripts from a directory."""
+        for name in ("b", "a"):
+            Transcript(
+                source_file=f"{name}.vtt", method="zoom_vtt", full_text=name
+            ).to_json_file(temp_output_dir / f"{name}.json")
+
+        transcripts = load_transcripts(temp_output_dir)
+
+        assert [t.source_file for t in transcripts] == ["a.vtt", "b.vtt"]
+
     def test_transcript_to_json_file(self, temp_output_dir):
         """Test saving transcript to JSON file."""
         transcript = Transcript(
@@ -110,6 +110,18 @@ class TestStatsCommand:
 
             assert "Error" in result.stdout
 
+    def test_stats_closes_storage_at_exit(self):
+        """Test that the storage is registered to be closed when the CLI exits."""
+        with patch("main.get_storage") as mock_get_storage, \
+                patch("main.atexit.register") as mock_register:
+            mock_storage = MagicMock()
+            mock_storage.get_stats.return_value = {}
+            mock_get_storage.return_value = mock_storage
+
+            runner.invoke(app, ["stats"])
+
+            mock_register.assert_called_once_with(mock_storage.close)
+
 
 class TestOpportunitiesCommand:
     """Tests for the opportunities command."""
@@ -241,3 +253,38 @@ class TestClassifyCommand:
             call_args = mock_classify.call_args
             assert call_args[0][2] == "sqlite"  # storage_backend
             assert call_args[0][3] == "/tmp/test.db"  # db_path
+
+    @pytest.mark.asyncio
+    async def test_classify_saves_in_batches_despite_failures(self, sample_classified_insight):
+        """Test that insights are flushed per batch and one failed batch is skipped."""
+        from main import _classify
+
+        records = [
+            {
+                "source": "reddit",
+                "source_id": f"s{i}",
+                "url": f"https://example.com/{i}",
+                "content": "Text",
+                "created_at": "2024-01-01T00:00:00",
+            }
+            for i in range(5)
+        ]
+
+        async def classify_batch(datapoints, concurrency):
+            for dp in datapoints:
+                yield sample_classified_insight.model_copy(update={"source_id": dp.source_id})
+
+        storage = MagicMock()
+        storage.get_unprocessed_raw_data.return_value = records
+        storage.save_insights_async = AsyncMock(side_effect=[None, RuntimeError("boom"), None])
+        classifier = MagicMock()
+        classifier.classify_batch = classify_batch
+
+        with patch("main.get_storage", return_value=storage), \
+             patch("main.Classifier", return_value=classifier), \
+             patch("main.SAVE_BATCH_SIZE", 2):
+            await _classify(5, 1, "sqlite", None)
+
+        assert storage.save_insights_async.await_count == 3
+        marked = [call.args[0] for call in storage.mark_batch_processed.call_args_list]
+        assert marked == [["s0", "s1"], ["s4"]]
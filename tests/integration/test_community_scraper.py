@@ -180,12 +180,20 @@ class TestCommunityScraperPipelineIntegration:
             topic_response.status_code = 200
             topic_response.text = SAMPLE_TOPIC_HTML
 
-            # Return board listing first, then topic for each link
-            mock_get.side_effect = [
-                board_response,  # Board listing
-                topic_response,  # First topic
-                topic_response,  # Second topic (if reached)
-            ]
+            # Later listing pages are empty
+            missing_response = MagicMock()
+            missing_response.status_code = 404
+            missing_response.text = ""
+
+            # Board listing pages are prefetched, so route by URL, not call order
+            def respond(url, **kwargs):
+                if "/t/" in url:
+                    return topic_response
+                if url.endswith("?page=1"):
+                    return board_response
+                return missing_response
+
+            mock_get.side_effect = respond
 
             count = 0
             async for datapoint in scraper.scrape(limit=1):
@@ -199,6 +207,34 @@ class TestCommunityScraperPipelineIntegration:
 
             assert count >= 0  # May be 0 if selectors don't match mock HTML exactly
 
+    @pytest.mark.asyncio
+    async def test_scrape_board_fetches_only_remaining_topics(self, scraper):
+        """Test that a board page fetches no more topics than the limit allows."""
+        with patch.object(scraper.client, 'get', new_callable=AsyncMock) as mock_get, \
+                patch("scrapers.community.settings.request_delay_seconds", 0):
+            board_response = MagicMock()
+            board_response.status_code = 200
+            board_response.text = SAMPLE_BOARD_HTML
+
+            topic_response = MagicMock()
+            topic_response.status_code = 200
+            topic_response.text = SAMPLE_TOPIC_HTML
+
+            def respond(url, **kwargs):
+                return topic_response if "/t/" in url else board_response
+
+            mock_get.side_effect = respond
+
+            posts = [
+                post async for post in scraper._scrape_board("/c/shopify-discussion", 1)
+            ]
+
+            topic_urls = [c.args[0] for c in mock_get.call_args_list if "/t/" in c.args[0]]
+            assert len(posts) == 1
+            assert topic_urls == [
+                "https://community.shopify.com/c/shopify-discussion/t/inventory-problem/12345"
+            ]
+
     @pytest.mark.asyncio
     async def test_health_check_integration(self, scraper):
         """Test health check method."""
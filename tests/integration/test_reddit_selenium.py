@@ -57,6 +57,13 @@ SAMPLE_COMMENTS_RSS = """<?xml version="1.0" encoding="UTF-8"?>
 """
 
 
+@pytest.fixture(autouse=True)
+def fresh_shared_session():
+    """Start each test without a module-wide session."""
+    with patch("scrapers.reddit_selenium._SESSION", None):
+        yield
+
+
 class TestScraperStorageIntegration:
     """Tests for scraper integration with SQLite storage."""
 
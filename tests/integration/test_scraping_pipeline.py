@@ -34,12 +34,11 @@ class TestRedditScrapingPipeline:
             mock_settings.airtable_api_key = "test"
             mock_settings.airtable_base_id = "test"
             storage = AirtableStorage()
-            storage._tables = {}
 
             mock_table = MagicMock()
             mock_table.first.return_value = None
             mock_table.create.return_value = {"id": "rec123"}
-            storage._get_table = MagicMock(return_value=mock_table)
+            storage.api.table = MagicMock(return_value=mock_table)
 
             return storage
 
@@ -90,7 +89,7 @@ class TestRedditScrapingPipeline:
         assert "shopify" in dp.title.lower() or "shopify" in dp.content.lower()
 
         # Verify storage was called
-        mock_storage._get_table.assert_called()
+        mock_storage.api.table.assert_called()
 
 
 class TestAppStoreScrapingPipeline:
@@ -132,6 +131,23 @@ class TestAppStoreScrapingPipeline:
         # Should get the review from our mock HTML (may be 0 if filters apply)
         assert len(datapoints) >= 0
 
+    @pytest.mark.asyncio
+    async def test_scrape_reuses_pooled_drivers(self, mock_selenium):
+        """Test apps are scraped concurrently on a bounded driver pool."""
+        mock_selenium.side_effect = lambda **kwargs: MagicMock(
+            page_source="<html><body></body></html>"
+        )
+
+        scraper = AppStoreScraper(max_workers=2)
+        scraper.TARGET_APPS = ["app-a", "app-b", "app-c", "app-d"]
+
+        with patch("scrapers.appstore.settings.request_delay_seconds", 0):
+            datapoints = [dp async for dp in scraper.scrape(limit=20)]
+
+        assert datapoints == []
+        assert mock_selenium.call_count <= 2
+        assert scraper._drivers == []
+
 
 class TestCommunityScrapingPipeline:
     """Integration tests for Community forum scraping pipeline."""
@@ -155,11 +171,15 @@ class TestCommunityScrapingPipeline:
         </body></html>
         """
 
-        responses = [
-            MagicMock(status_code=200, text=board_html),  # Board page
-            MagicMock(status_code=200, text=sample_community_topic_html),  # Topic page
-        ]
-        mock_client.get = AsyncMock(side_effect=responses)
+        def respond(url, **kwargs):
+            # Board listing pages are prefetched, so route by URL, not call order
+            if "/t/" in url:
+                return MagicMock(status_code=200, text=sample_community_topic_html)
+            if url.endswith("?page=1"):
+                return MagicMock(status_code=200, text=board_html)
+            return MagicMock(status_code=404, text="")
+
+        mock_client.get = AsyncMock(side_effect=respond)
         mock_client.aclose = AsyncMock()
         mock_httpx.return_value = mock_client
 
@@ -316,8 +336,10 @@ class TestFullPipeline:
 
             # 3. Store
             storage = AirtableStorage()
-            storage._tables = {}
-            storage._get_table = MagicMock(return_value=mock_table)
+            # One mock per table, all recording creates on mock_table
+            storage.api.table = MagicMock(
+                side_effect=lambda base, name: MagicMock(name=name, create=mock_table.create)
+            )
 
             for dp in raw_datapoints:
                 storage.save_raw_datapoint(dp)
@@ -5,7 +5,7 @@ from datetime import datetime
 from unittest.mock import MagicMock, AsyncMock, patch
 from bs4 import BeautifulSoup
 
-from scrapers.community import CommunityScraper
+from scrapers.community import CommunityScraper, _parse_topic_html
 from scrapers.base import DataSource, RawDataPoint
 
 
@@ -342,3 +342,31 @@ class TestCommunityScraperMultipleSelectors:
             datapoint = await scraper._scrape_topic("https://test.com")
             assert datapoint is not None
             assert len(datapoint.metadata["replies"]) == 2
+
+
+class TestParseTopicHtml:
+    """Tests for the worker-side topic page parser."""
+
+    def test_returns_picklable_fields(self):
+        """Test fields come back as plain data for the parent process."""
+        fields = _parse_topic_html(SAMPLE_TOPIC_WITH_REPLIES_HTML)
+        assert fields["title"] == "How to fix inventory sync issues?"
+        assert fields["author"] == "original_poster"
+        assert "inventory syncing" in fields["content"]
+        assert all(isinstance(reply, dict) for reply in fields["replies"])
+
+    def test_returns_none_without_posts(self):
+        """Test pages with no post bodies are skipped."""
+        assert _parse_topic_html("<html><body><h1>Empty</h1></body></html>") is None
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_down_parse_pool(self):
+        """Test close() releases the worker pool created on first parse."""
+        scraper = CommunityScraper()
+        with patch.object(scraper, '_fetch_page', new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = SAMPLE_TOPIC_WITH_REPLIES_HTML
+            assert await scraper._scrape_topic("https://test.com") is not None
+        assert scraper._parse_pool is not None
+
+        await scraper.close()
+        assert scraper._parse_pool is None
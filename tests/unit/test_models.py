@@ -3,7 +3,7 @@
 import pytest
 from datetime import datetime
 
-from scrapers.base import RawDataPoint, DataSource
+from scrapers.base import RawDataPoint, RawDataPointFast, DataSource
 from analysis.classifier import ClassifiedInsight, ProblemCategory
 
 
@@ -95,6 +95,24 @@ class TestRawDataPoint:
         assert isinstance(dp.metadata, dict)
 
 
+class TestRawDataPointFast:
+    """Tests for the slotted RawDataPoint counterpart."""
+
+    def test_round_trips_through_model(self, sample_raw_datapoint):
+        """Test conversion to and from RawDataPoint keeps every field."""
+        fast = RawDataPointFast.from_model(sample_raw_datapoint)
+        assert fast.full_text == sample_raw_datapoint.full_text
+        assert fast.to_model() == sample_raw_datapoint
+        assert fast.to_model(validate=True) == sample_raw_datapoint
+
+    def test_has_no_instance_dict(self, sample_raw_datapoint):
+        """Test instances are slotted and immutable."""
+        fast = RawDataPointFast.from_model(sample_raw_datapoint)
+        assert not hasattr(fast, "__dict__")
+        with pytest.raises(AttributeError):
+            fast.content = "changed"
+
+
 class TestProblemCategory:
     """Tests for ProblemCategory enum."""
 
@@ -1,13 +1,17 @@
 """Unit tests for Reddit Selenium/RSS scraper."""
 
 import pytest
+import threading
 from datetime import datetime
 from unittest.mock import MagicMock, patch, Mock
 import xml.etree.ElementTree as ET
 
+import orjson
+
 from scrapers.reddit_selenium import (
     RedditSeleniumScraper,
     scrape_reddit_posts,
+    iter_reddit_posts,
     _extract_selftext_from_html,
     _fetch_rss_simple,
     _fetch_post_comments,
@@ -66,6 +70,13 @@ SAMPLE_COMMENTS_RSS_XML = """<?xml version="1.0" encoding="UTF-8"?>
 """
 
 
+@pytest.fixture(autouse=True)
+def fresh_shared_session():
+    """Start each test without a module-wide session."""
+    with patch("scrapers.reddit_selenium._SESSION", None):
+        yield
+
+
 class TestExtractSelftextFromHtml:
     """Tests for _extract_selftext_from_html function."""
 
@@ -95,6 +106,23 @@ class TestExtractSelftextFromHtml:
         assert "Paragraph 1" in result
         assert "Paragraph 2" in result
 
+    def test_decodes_entities_inside_markup(self):
+        """Test that entities inside markup are decoded."""
+        html = "<p>Fees &amp; taxes</p>"
+        result = _extract_selftext_from_html(html)
+        assert result == "Fees & taxes"
+
+    def test_keeps_escaped_markup_as_text(self):
+        """Test that escaped tags in the post body are not stripped."""
+        html = "<p>Wrap it in &lt;b&gt; tags</p>"
+        result = _extract_selftext_from_html(html)
+        assert result == "Wrap it in <b> tags"
+
+    def test_decodes_entities_in_plain_text(self):
+        """Test that text without markup still has its entities decoded."""
+        result = _extract_selftext_from_html("  Fees &amp; taxes  ")
+        assert result == "Fees & taxes"
+
     def test_removes_link_comments_boilerplate(self):
         """Test removal of [link] [comments] boilerplate."""
         html = "Content here [link] [comments]"
@@ -191,6 +219,12 @@ class TestRedditSeleniumScraper:
         assert scraper._has_pain_keywords("FRUSTRATED with this")
         assert scraper._has_pain_keywords("PROBLEM here")
 
+    def test_has_pain_keywords_regex_fallback(self, scraper):
+        """Test keyword matching without the Aho-Corasick accelerator."""
+        with patch.object(RedditSeleniumScraper, "_PAIN_AUTOMATON", None):
+            assert scraper._has_pain_keywords("Doesn't Work after the update")
+            assert not scraper._has_pain_keywords("Everything works great")
+
     def test_is_relevant_with_shopify(self, scraper):
         """Test _is_relevant returns True when Shopify is mentioned."""
         assert scraper._is_relevant("Shopify question", "How do I do this?")
@@ -337,6 +371,23 @@ class TestFetchPostComments:
 class TestScrapeRedditPosts:
     """Tests for scrape_reddit_posts function."""
 
+    @patch("scrapers.reddit_selenium.requests.Session")
+    def test_reuses_session_across_calls(self, mock_client_class):
+        """Test that successive calls share one session."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = SAMPLE_RSS_XML
+        mock_client.get.return_value = mock_response
+
+        scrape_reddit_posts(limit=1, sort_types=["hot"], request_delay=0.01)
+        scrape_reddit_posts(limit=1, sort_types=["new"], request_delay=0.01)
+
+        assert mock_client_class.call_count == 1
+        mock_client.close.assert_not_called()
+
     @patch("scrapers.reddit_selenium.requests.Session")
     def test_uses_default_sort_types(self, mock_client_class):
         """Test that default sort types are used."""
@@ -419,6 +470,35 @@ class TestScrapeRedditPosts:
         for post in results:
             assert "comments" in post
 
+    @patch("scrapers.reddit_selenium.requests.Session")
+    def test_fetches_comments_once_per_unique_post(self, mock_client_class):
+        """Test that posts shared by several feeds get one comment fetch."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        def get(url, timeout):
+            response = MagicMock()
+            response.status_code = 200
+            is_comments = "/comments/" in url
+            response.text = SAMPLE_COMMENTS_RSS_XML if is_comments else SAMPLE_RSS_XML
+            return response
+
+        mock_client.get.side_effect = get
+
+        results = scrape_reddit_posts(
+            limit=100,
+            sort_types=["hot", "new", "top_week"],
+            include_comments=True,
+            request_delay=0.01,
+        )
+
+        assert len(results) == 2
+        comment_urls = [
+            call.args[0] for call in mock_client.get.call_args_list
+            if "/comments/" in call.args[0]
+        ]
+        assert len(comment_urls) == len(set(comment_urls)) == 2
+
     @patch("scrapers.reddit_selenium.requests.Session")
     def test_handles_unknown_sort_type(self, mock_client_class):
         """Test handling of unknown sort type."""
@@ -442,6 +522,61 @@ class TestScrapeRedditPosts:
         # Should still get results from valid sort type
         assert len(results) > 0
 
+    @patch("scrapers.reddit_selenium.requests.Session")
+    def test_fetches_feeds_concurrently(self, mock_client_class):
+        """Test that sort feeds are requested at the same time."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = SAMPLE_RSS_XML
+        # Each get blocks until the other feed's get has started
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get(url, timeout):
+            barrier.wait()
+            return mock_response
+
+        mock_client.get.side_effect = get
+
+        results = scrape_reddit_posts(
+            limit=100,
+            sort_types=["hot", "new"],
+            include_comments=False,
+            request_delay=0.01,
+        )
+
+        assert len(results) == 2
+        assert not barrier.broken
+
+    @pytest.mark.asyncio
+    @patch("scrapers.reddit_selenium.requests.Session")
+    async def test_iter_reddit_posts_yields_posts_with_comments(self, mock_client_class):
+        """Test the async generator yields each post with its comments attached."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        def get(url, timeout):
+            response = MagicMock()
+            response.status_code = 200
+            is_comments = "/comments/" in url
+            response.text = SAMPLE_COMMENTS_RSS_XML if is_comments else SAMPLE_RSS_XML
+            return response
+
+        mock_client.get.side_effect = get
+
+        posts = []
+        async for post in iter_reddit_posts(
+            limit=10, sort_types=["hot"], include_comments=True, request_delay=0.01
+        ):
+            posts.append(post)
+
+        assert [post["id"] for post in posts] == ["abc123", "def456"]
+        for post in posts:
+            assert [c["author"] for c in post["comments"]] == ["commenter1", "commenter2"]
+        mock_client.close.assert_not_called()
+
 
 class TestScraperClassMethods:
     """Tests for RedditSeleniumScraper class methods."""
@@ -454,7 +589,7 @@ class TestScraperClassMethods:
         ns = {"atom": "http://www.w3.org/2005/Atom"}
         entry = root.find("atom:entry", ns)
 
-        result = scraper._parse_rss_entry(entry, ns)
+        result = scraper._parse_rss_entry(entry)
 
         assert result is not None
         assert isinstance(result, RawDataPoint)
@@ -463,6 +598,18 @@ class TestScraperClassMethods:
         assert "test_user" in result.author
         assert "abc123" in result.source_id
 
+    def test_parse_rss_entry_skips_seen_post(self):
+        """Test _parse_rss_entry returns None for an already seen post id."""
+        scraper = RedditSeleniumScraper()
+        root = ET.fromstring(SAMPLE_RSS_XML)
+        ns = {"atom": "http://www.w3.org/2005/Atom"}
+        entry = root.find("atom:entry", ns)
+
+        seen_post_ids = set()
+        assert scraper._parse_rss_entry(entry, seen_post_ids) is not None
+        assert seen_post_ids == {"abc123"}
+        assert scraper._parse_rss_entry(entry, seen_post_ids) is None
+
     @patch("scrapers.reddit_selenium.requests.Session")
     def test_fetch_rss_posts(self, mock_client_class):
         """Test _fetch_rss_posts method."""
@@ -478,3 +625,119 @@ class TestScraperClassMethods:
 
         assert len(results) == 2
         assert all(isinstance(r, RawDataPoint) for r in results)
+
+    @patch("scrapers.reddit_selenium.requests.Session")
+    @pytest.mark.asyncio
+    async def test_scrape_posts_fetches_every_feed(self, mock_client_class):
+        """Test _scrape_posts fetches all endpoints and dedupes across them."""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = SAMPLE_RSS_XML
+        mock_client.get.return_value = mock_response
+
+        scraper = RedditSeleniumScraper(request_delay=0)
+        results = await scraper._scrape_posts(limit=100)
+
+        # The mock has no JSON body, so every listing falls back to RSS
+        fetched = {call.args[0] for call in mock_client.get.call_args_list}
+        assert set(RSS_ENDPOINTS.values()) <= fetched
+        assert len(results) == len({r.source_id for r in results})
+
+    @patch("scrapers.reddit_selenium.requests.Session")
+    @pytest.mark.asyncio
+    async def test_session_reused_until_close(self, mock_client_class):
+        """Test health check and scrape share one session until close()."""
+        mock_client = mock_client_class.return_value
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = SAMPLE_RSS_XML
+        mock_client.get.return_value = mock_response
+
+        scraper = RedditSeleniumScraper(request_delay=0)
+        assert await scraper.health_check()
+        await scraper._scrape_posts(limit=1)
+        mock_client_class.assert_called_once()
+        mock_client.close.assert_not_called()
+
+        await scraper.close()
+        mock_client.close.assert_called_once()
+
+    @patch("scrapers.reddit_selenium.requests.Session")
+    @pytest.mark.asyncio
+    async def test_scrape_stamps_one_batch_timestamp(self, mock_client_class):
+        """Test every datapoint of a scrape shares the batch scraped_at."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = SAMPLE_RSS_XML
+        mock_client_class.return_value.get.return_value = mock_response
+
+        scraper = RedditSeleniumScraper(request_delay=0)
+        datapoints = [dp async for dp in scraper.scrape(limit=10)]
+
+        assert len(datapoints) > 1
+        assert {dp.scraped_at for dp in datapoints} == {scraper._batch_ts}
+
+    def test_fetch_listing_posts_prefers_json_when_enabled(self):
+        """Test listings are read from the JSON endpoint when opted in."""
+        listing = {"data": {"children": [{"kind": "t3", "data": {
+            "id": "xyz789",
+            "title": "Shopify checkout problem",
+            "selftext": "Checkout keeps failing",
+            "author": "merchant",
+            "permalink": "/r/shopify/comments/xyz789/checkout/",
+            "created_utc": 1705312200.0,
+            "score": 12,
+            "num_comments": 3,
+            "subreddit": "shopify",
+        }}]}}
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(listing)
+        mock_client.get.return_value = mock_response
+
+        scraper = RedditSeleniumScraper(use_json=True)
+        results = scraper._fetch_listing_posts(mock_client, RSS_ENDPOINTS["hot"])
+
+        mock_client.get.assert_called_once_with(
+            "https://www.reddit.com/r/shopify/.json", timeout=30
+        )
+        assert len(results) == 1
+        assert results[0].source_id == "reddit_post_xyz789"
+        assert results[0].url == "https://www.reddit.com/r/shopify/comments/xyz789/checkout/"
+        assert results[0].metadata["scrape_method"] == "json"
+
+    def test_fetch_listing_posts_uses_rss_by_default(self):
+        """Test listings go straight to RSS unless JSON is opted in."""
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = SAMPLE_RSS_XML
+        mock_client.get.return_value = mock_response
+
+        scraper = RedditSeleniumScraper()
+        results = scraper._fetch_listing_posts(mock_client, RSS_ENDPOINTS["hot"])
+
+        assert results
+        requested = [c.args[0] for c in mock_client.get.call_args_list]
+        assert not any(url.endswith(".json") for url in requested)
+
+    def test_denied_json_falls_back_to_rss_for_the_session(self):
+        """Test a denied JSON request is not retried for later feeds."""
+        denied = MagicMock(status_code=403)
+        rss = MagicMock(status_code=200, text=SAMPLE_RSS_XML)
+        mock_client = MagicMock()
+        mock_client.get.side_effect = lambda url, **kwargs: (
+            denied if url.endswith(".json") else rss
+        )
+
+        scraper = RedditSeleniumScraper(use_json=True)
+        scraper._fetch_listing_posts(mock_client, RSS_ENDPOINTS["hot"])
+        scraper._fetch_listing_posts(mock_client, RSS_ENDPOINTS["new"])
+
+        requested = [c.args[0] for c in mock_client.get.call_args_list]
+        assert sum(url.endswith(".json") for url in requested) == 1
+        assert scraper.use_json is False
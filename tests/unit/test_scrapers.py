@@ -1,14 +1,20 @@
 """Unit tests for scrapers."""
 
+import asyncio
+import threading
+import time
+
+import httpx
+import lxml.html
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, AsyncMock, patch
 from bs4 import BeautifulSoup
 
-from scrapers.base import DataSource, RawDataPoint
+from scrapers.base import DataSource, RateLimiter, RawDataPoint
 from scrapers.reddit import RedditScraper
-from scrapers.appstore import AppStoreScraper
-from scrapers.community import CommunityScraper
+from scrapers.appstore import AppStoreScraper, _REVIEW_STRAINER
+from scrapers.community import CommunityScraper, _number
 from scrapers.twitter import TwitterScraper
 
 
@@ -89,6 +95,29 @@ class TestRedditScraper:
         dp = scraper._submission_to_datapoint(sample_reddit_submission)
         assert dp.content == "[No body text]"
 
+    @pytest.mark.asyncio
+    async def test_scrape_scans_subreddits_concurrently(self, sample_reddit_submission):
+        """Test every subreddit is scanned on its own PRAW client."""
+        sample_reddit_submission.title = "Shopify sync problem"
+        sample_reddit_submission.comments = MagicMock()
+        sample_reddit_submission.comments.__getitem__.return_value = []
+
+        with patch("scrapers.reddit.praw.Reddit") as mock_reddit, \
+             patch("scrapers.reddit.settings") as mock_settings:
+            mock_settings.request_delay_seconds = 0
+            mock_reddit.return_value.subreddit.return_value.search.return_value = [
+                sample_reddit_submission
+            ]
+            scraper = RedditScraper()
+            scraper.subreddits = ["shopify", "ecommerce"]
+
+            datapoints = [dp async for dp in scraper.scrape(limit=4)]
+
+        # One client for the scraper itself plus one per subreddit
+        assert mock_reddit.call_count == 3
+        # The submission matches all four search queries in both subreddits
+        assert len(datapoints) == 8
+
 
 class TestAppStoreScraper:
     """Tests for AppStoreScraper."""
@@ -156,6 +185,19 @@ class TestAppStoreScraper:
         )
         assert scraper._is_negative_review(dp) is False
 
+    def test_is_negative_review_regex_fallback(self, scraper):
+        """Test _is_negative_review without the Aho-Corasick accelerator."""
+        dp = RawDataPoint(
+            source=DataSource.APP_STORE,
+            source_id="test",
+            url="https://example.com",
+            content="Great app, HOWEVER the export is Broken",
+            created_at=datetime.now(),
+            metadata={"rating": 5},
+        )
+        with patch.object(AppStoreScraper, "_PAIN_AUTOMATON", None):
+            assert scraper._is_negative_review(dp) is True
+
     def test_parse_review_element(self, scraper):
         """Test parsing review from star rating element."""
         # Create HTML that matches the current scraper's expected structure
@@ -166,9 +208,12 @@ class TestAppStoreScraper:
         </div>
         '''
         soup = BeautifulSoup(html, "html.parser")
+        container = soup.find(class_="lg:tw-col-span-3")
         star_elem = soup.find(attrs={"aria-label": "2 out of 5 stars"})
 
-        dp = scraper._parse_review_element(star_elem, "test-app", "https://apps.shopify.com/test-app")
+        dp = scraper._parse_review_element(
+            container, star_elem, "test-app", "https://apps.shopify.com/test-app"
+        )
 
         assert dp is not None
         assert dp.source == DataSource.APP_STORE
@@ -176,6 +221,117 @@ class TestAppStoreScraper:
         assert dp.metadata["rating"] == 2
         assert "crashes" in dp.content.lower()
 
+    def test_review_id_is_stable(self, scraper):
+        """Test review IDs are derived from a stable content hash."""
+        html = '''
+        <div class="lg:tw-col-span-3">
+            <div aria-label="2 out of 5 stars">Rating</div>
+            <div>December 15, 2025 The app crashes frequently and is hard to use.</div>
+        </div>
+        '''
+        soup = BeautifulSoup(html, "html.parser")
+        container = soup.find(class_="lg:tw-col-span-3")
+        star_elem = soup.find(attrs={"aria-label": "2 out of 5 stars"})
+
+        first = scraper._parse_review_element(
+            container, star_elem, "test-app", "https://apps.shopify.com/test-app"
+        )
+        second = AppStoreScraper()._parse_review_element(
+            container, star_elem, "test-app", "https://apps.shopify.com/test-app"
+        )
+
+        assert first.source_id == second.source_id
+        assert first.source_id.startswith("appstore_test-app_")
+
+    def test_extract_reviews_skips_summary_ratings(self, scraper):
+        """Test only ratings inside review containers become reviews."""
+        html = '''
+        <div aria-label="4.5 out of 5 stars">Summary</div>
+        <div class="tw-order-2">
+            <div class="lg:tw-col-span-3">
+                <div aria-label="1 out of 5 stars">Rating</div>
+                <div>December 1, 2025 First review text is long enough.</div>
+            </div>
+            <div class="lg:tw-col-span-3">
+                <div aria-label="3 out of 5 stars">Rating</div>
+                <div>December 2, 2025 Second review text is long enough.</div>
+            </div>
+        </div>
+        '''
+        soup = BeautifulSoup(html, "lxml")
+
+        reviews = scraper._extract_reviews_from_soup(
+            soup, "test-app", "https://apps.shopify.com/test-app"
+        )
+
+        assert [r.metadata["rating"] for r in reviews] == [1, 3]
+        assert reviews[0].content == "Rating December 1, 2025 First review text is long enough."
+
+    def test_review_strainer_keeps_only_containers(self, scraper):
+        """Test the parse-time strainer keeps review containers only."""
+        html = '''
+        <html><body>
+            <header><div aria-label="4.5 out of 5 stars">Summary</div></header>
+            <div class="tw-order-2 tw-mt-4">
+                <div aria-label="2 out of 5 stars">Rating</div>
+                <div>December 3, 2025 Syncing breaks every few days.</div>
+            </div>
+            <div class="tw-order-20">Not a review</div>
+        </body></html>
+        '''
+        soup = BeautifulSoup(html, "lxml", parse_only=_REVIEW_STRAINER)
+
+        assert "Summary" not in soup.get_text()
+        assert "Not a review" not in soup.get_text()
+        reviews = scraper._extract_reviews_from_soup(
+            soup, "test-app", "https://apps.shopify.com/test-app"
+        )
+        assert [r.metadata["rating"] for r in reviews] == [2]
+
+    @pytest.mark.asyncio
+    async def test_seen_review_ids_persist(self, tmp_path):
+        """Test seen review IDs are saved on close and reloaded."""
+        seen_path = tmp_path / "seen.json"
+        scraper = AppStoreScraper(seen_ids_path=seen_path)
+        scraper._seen_review_ids = {"flow": {"appstore_flow_abc"}}
+        await scraper.close()
+
+        reloaded = AppStoreScraper(seen_ids_path=seen_path)
+        assert reloaded._load_seen_review_ids() == {"flow": {"appstore_flow_abc"}}
+
+    @pytest.mark.asyncio
+    async def test_scrape_survives_driver_start_failure(self, scraper):
+        """Test a browser that fails to start skips the app instead of crashing."""
+        with patch.object(scraper, "_create_driver", side_effect=Exception("no chrome")):
+            reviews = [review async for review in scraper.scrape(limit=5)]
+
+        assert reviews == []
+        assert scraper._idle_drivers == []
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_running_selenium_calls(self, scraper):
+        """Test pooled drivers are only quit once their thread calls return."""
+        started = threading.Event()
+        release = threading.Event()
+        events = []
+        driver = MagicMock()
+        driver.quit.side_effect = lambda: events.append("quit")
+
+        def load(*args):
+            started.set()
+            release.wait(5)
+            events.append("loaded")
+            return ""
+
+        scraper._drivers.append(driver)
+        call = asyncio.ensure_future(scraper._in_thread(load))
+        await asyncio.to_thread(started.wait, 5)
+        call.cancel()
+        threading.Timer(0.05, release.set).start()
+        await scraper.close()
+
+        assert events == ["loaded", "quit"]
+
 
 class TestCommunityScraper:
     """Tests for CommunityScraper."""
@@ -214,16 +370,71 @@ class TestCommunityScraper:
         )
         assert scraper._is_relevant(dp) is False
 
-    def test_extract_number(self, scraper):
+    @pytest.mark.asyncio
+    async def test_close_leaves_shared_client_open(self):
+        """Test an injected client is not closed with the scraper."""
+        client = AsyncMock()
+        scraper = CommunityScraper(client=client)
+        assert scraper.client is client
+
+        await scraper.close()
+        client.aclose.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_page_serves_fresh_pages_from_cache(self, tmp_path):
+        """Test a cached page within max_age is returned without a request."""
+        scraper = CommunityScraper(cache_path=str(tmp_path / "pages.db"))
+        url = "https://community.shopify.com/t/topic/1"
+        with patch.object(scraper.client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = httpx.Response(200, text="<html>first</html>")
+            assert await scraper._fetch_page(url, max_age=60) == "<html>first</html>"
+            assert await scraper._fetch_page(url, max_age=60) == "<html>first</html>"
+        assert mock_get.call_count == 1
+        await scraper.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_page_revalidates_stale_pages(self, tmp_path):
+        """Test a stale cached page is revalidated and kept on 304."""
+        scraper = CommunityScraper(cache_path=str(tmp_path / "pages.db"))
+        url = "https://community.shopify.com/t/topic/1"
+        modified = "Mon, 15 Jan 2024 10:00:00 GMT"
+        with patch.object(scraper.client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = httpx.Response(
+                200, text="<html>first</html>", headers={"Last-Modified": modified}
+            )
+            await scraper._fetch_page(url)
+
+            mock_get.return_value = httpx.Response(304)
+            assert await scraper._fetch_page(url) == "<html>first</html>"
+            assert mock_get.call_args.kwargs["headers"] == {"If-Modified-Since": modified}
+        await scraper.close()
+
+    def test_is_relevant_case_insensitive(self, scraper, sample_raw_datapoint):
+        """Test _is_relevant matches keywords regardless of case."""
+        sample_raw_datapoint.title = "FEATURE REQUEST"
+        sample_raw_datapoint.content = "Bulk Editing Is Missing"
+        assert scraper._is_relevant(sample_raw_datapoint) is True
+
+    def test_parse_date_relative_days_crosses_month(self, scraper):
+        """Test relative day offsets are not clamped to the current month."""
+        result = scraper._parse_date("45 days ago")
+        expected = datetime.utcnow() - timedelta(days=45)
+        assert abs((result - expected).total_seconds()) < 5
+
+    def test_parse_date_relative_hours(self, scraper):
+        """Test hour offsets are applied rather than ignored."""
+        result = scraper._parse_date("3 hours ago")
+        expected = datetime.utcnow() - timedelta(hours=3)
+        assert abs((result - expected).total_seconds()) < 5
+
+    def test_number(self):
         """Test extracting numbers from elements."""
-        html = '<span class="reply-count">15 replies</span>'
-        soup = BeautifulSoup(html, "html.parser")
-        assert scraper._extract_number(soup, ".reply-count") == 15
+        elem = lxml.html.fromstring('<span class="reply-count">15 replies</span>')
+        assert _number(elem) == 15
 
-    def test_extract_number_missing_element(self, scraper):
+    def test_number_missing_element(self):
         """Test extracting number when element missing."""
-        soup = BeautifulSoup("<div></div>", "html.parser")
-        assert scraper._extract_number(soup, ".nonexistent") == 0
+        assert _number(None) == 0
 
     def test_parse_date_iso_format(self, scraper):
         """Test parsing ISO format dates."""
@@ -232,6 +443,15 @@ class TestCommunityScraper:
         assert result.month == 1
         assert result.day == 15
 
+    def test_parse_date_uses_ciso8601_when_available(self, scraper):
+        """Test ISO dates go through ciso8601 when it is installed."""
+        fake = MagicMock()
+        fake.parse_datetime.return_value = datetime(2024, 1, 15)
+        with patch("scrapers.community.ciso8601", fake):
+            result = scraper._parse_date("2024-01-15T10:30:00Z")
+        fake.parse_datetime.assert_called_once_with("2024-01-15T10:30:00Z")
+        assert result == datetime(2024, 1, 15)
+
     def test_parse_date_relative(self, scraper):
         """Test parsing relative dates."""
         result = scraper._parse_date("3 days ago")
@@ -303,3 +523,59 @@ class TestTwitterScraper:
         dp = scraper._tweet_to_datapoint(tweet, {}, "query")
 
         assert dp.author == "unknown"
+
+    @pytest.mark.asyncio
+    async def test_scrape_searches_queries_concurrently(self, scraper):
+        """Test queries run in parallel but tweets come out in query order."""
+        # Each search blocks until a full batch of searches has started
+        barrier = threading.Barrier(scraper.MAX_CONCURRENT_QUERIES, timeout=5)
+
+        def search(query, **kwargs):
+            barrier.wait()
+            tweet = MagicMock()
+            tweet.id = str(scraper.SEARCH_QUERIES.index(query))
+            tweet.text = query
+            tweet.author_id = "user123"
+            tweet.created_at = datetime(2024, 1, 15)
+            tweet.public_metrics = {}
+            return MagicMock(data=[tweet], includes={})
+
+        scraper.client.search_recent_tweets.side_effect = search
+
+        with patch("scrapers.twitter.settings.request_delay_seconds", 0):
+            datapoints = [dp async for dp in scraper.scrape(limit=100)]
+
+        assert [dp.content for dp in datapoints] == scraper.SEARCH_QUERIES
+        assert not barrier.broken
+
+
+class TestRateLimiter:
+    """Tests for the RateLimiter token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_starts_without_waiting(self):
+        """Test that banked tokens are handed out immediately."""
+        limiter = RateLimiter(10.0, burst=3)
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+        assert time.monotonic() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill_once_bucket_is_empty(self):
+        """Test that an empty bucket spaces requests by the interval."""
+        limiter = RateLimiter(0.05, burst=1)
+        start = time.monotonic()
+        for _ in range(3):
+            async with limiter:
+                pass
+        assert time.monotonic() - start >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_zero_interval_disables_limiting(self):
+        """Test that a non-positive interval never blocks."""
+        limiter = RateLimiter(0, burst=1)
+        start = time.monotonic()
+        for _ in range(100):
+            await limiter.acquire()
+        assert time.monotonic() - start < 0.5
@@ -1,11 +1,15 @@
 """Unit tests for SQLite storage module."""
 
 import pytest
+import sqlite3
 import tempfile
+import threading
 import os
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 from scrapers.base import RawDataPoint, DataSource
 from analysis.classifier import ClassifiedInsight, ProblemCategory
 from storage.sqlite import SQLiteStorage
@@ -64,6 +68,88 @@ class TestSQLiteStorageInit:
             assert "idx_insights_category" in indexes
             assert "idx_opportunity_scores_total" in indexes
 
+    def test_unprocessed_query_uses_partial_index(self):
+        """Test that the unprocessed queue is read through the partial index."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = SQLiteStorage(db_path=os.path.join(tmpdir, "test.db"))
+
+            conn = storage._get_connection()
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT source_id FROM raw_sources "
+                "WHERE processed = 0 ORDER BY id LIMIT 10"
+            ).fetchall()
+            conn.close()
+
+            assert any("idx_raw_sources_processed" in row["detail"] for row in plan)
+
+    def test_rebuilds_full_processed_index_as_partial(self):
+        """Test that an older database's whole-column index is replaced."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "test.db")
+            SQLiteStorage(db_path=db_path).close()
+            conn = sqlite3.connect(db_path)
+            conn.executescript("""
+                DROP INDEX idx_raw_sources_processed;
+                CREATE INDEX idx_raw_sources_processed ON raw_sources(processed);
+            """)
+            conn.close()
+
+            storage = SQLiteStorage(db_path=db_path)
+
+            conn = storage._get_connection()
+            sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'idx_raw_sources_processed'"
+            ).fetchone()[0]
+            conn.close()
+            assert "WHERE processed = 0" in sql
+
+    def test_uses_wal_journal(self):
+        """Test that the database runs in WAL mode with relaxed syncing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, "test.db")
+            storage = SQLiteStorage(db_path=db_path)
+
+            conn = storage._get_connection()
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+            conn.close()
+
+            assert journal_mode == "wal"
+            assert synchronous == 1  # NORMAL
+
+    def test_reuses_connection_per_thread(self):
+        """Test that calls on one thread share a connection and threads do not."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = SQLiteStorage(db_path=os.path.join(tmpdir, "test.db"))
+            conn = storage._connection()
+
+            other: list = []
+            thread = threading.Thread(target=lambda: other.append(storage._connection()))
+            thread.start()
+            thread.join()
+
+            assert storage._connection() is conn
+            assert other[0] is not conn
+
+            storage.close()
+            assert storage._connection() is not conn
+            storage.close()
+
+    def test_close_closes_worker_thread_connections(self):
+        """Test that close() also closes connections opened on other threads."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = SQLiteStorage(db_path=os.path.join(tmpdir, "test.db"))
+
+            other: list = []
+            thread = threading.Thread(target=lambda: other.append(storage._connection()))
+            thread.start()
+            thread.join()
+
+            storage.close()
+
+            with pytest.raises(sqlite3.ProgrammingError):
+                other[0].execute("SELECT 1")
+
 
 class TestSaveRawDatapoint:
     """Tests for save_raw_datapoint method."""
@@ -151,6 +237,34 @@ class TestSaveRawDatapoint:
         assert metadata["subreddit"] == "shopify"
         assert metadata["score"] == 45
 
+    def test_save_raw_datapoints_bulk(self, storage, sample_raw_datapoint):
+        """Test bulk saves reuse existing IDs and insert the rest once."""
+        existing_id = storage.save_raw_datapoint(sample_raw_datapoint)
+        new = sample_raw_datapoint.model_copy(update={"source_id": "bulk_new"})
+        newer = new.model_copy(update={"title": "Newer title"})
+
+        result = storage.save_raw_datapoints([sample_raw_datapoint, new, newer])
+
+        assert result[0] == existing_id
+        assert result[1] == result[2] != existing_id
+        conn = storage._get_connection()
+        rows = conn.execute("SELECT title FROM raw_sources WHERE source_id = 'bulk_new'").fetchall()
+        conn.close()
+        assert [row["title"] for row in rows] == ["Newer title"]
+
+    def test_save_raw_datapoints_large_batch(self, storage, sample_raw_datapoint):
+        """Test that batches beyond SQLite's bound-variable limit save in full."""
+        datapoints = [
+            sample_raw_datapoint.model_copy(update={"source_id": f"big_{i}"})
+            for i in range(1200)
+        ]
+
+        first = storage.save_raw_datapoints(datapoints)
+        again = storage.save_raw_datapoints(datapoints)
+
+        assert len(set(first)) == 1200
+        assert again == first
+
 
 class TestGetUnprocessedRawData:
     """Tests for get_unprocessed_raw_data method."""
@@ -171,6 +285,19 @@ class TestGetUnprocessedRawData:
         assert isinstance(result, list)
         assert len(result) == 1
 
+    def test_get_unprocessed_returns_metadata_text(self, storage, sample_raw_datapoint):
+        """Test that metadata stored as a JSON blob comes back as JSON text."""
+        storage.save_raw_datapoint(sample_raw_datapoint)
+
+        conn = storage._get_connection()
+        stored_type = conn.execute("SELECT typeof(metadata) FROM raw_sources").fetchone()[0]
+        conn.close()
+        [record] = storage.get_unprocessed_raw_data()
+
+        assert stored_type == "blob"
+        assert isinstance(record["metadata"], str)
+        assert orjson.loads(record["metadata"])["subreddit"] == "shopify"
+
     def test_get_unprocessed_respects_limit(self, storage):
         """Test that limit parameter is respected."""
         for i in range(10):
@@ -314,6 +441,19 @@ class TestSaveInsight:
         assert "analytics" in row["keywords"]
         assert "conversion tracking" in row["keywords"]
 
+    def test_save_insights_bulk(self, storage, sample_classified_insight):
+        """Test bulk saving insights returns IDs in input order."""
+        insights = [
+            sample_classified_insight.model_copy(update={"source_id": f"bulk_{i}"})
+            for i in range(3)
+        ]
+
+        result = storage.save_insights(insights)
+
+        assert len(set(result)) == 3
+        assert storage.save_insights(insights[::-1]) == result[::-1]
+        assert len(storage.get_all_insights()) == 3
+
 
 class TestGetInsights:
     """Tests for insight getter methods."""
@@ -374,6 +514,39 @@ class TestGetInsights:
 
         assert len(result) == 1
         assert result[0]["source_id"] == sample_classified_insight.source_id
+        assert type(result[0]) is dict
+        assert result[0].get("category") == "analytics"
+
+    def test_iter_all_insights_streams_in_batches(self, storage, sample_classified_insight):
+        """Test that iterating yields every insight across fetch batches."""
+        storage.save_insights([
+            sample_classified_insight.model_copy(update={"source_id": f"iter_{i}"})
+            for i in range(5)
+        ])
+
+        result = storage.iter_all_insights(batch_size=2)
+
+        assert next(result)["source_id"] == "iter_0"
+        assert [r["source_id"] for r in result] == [f"iter_{i}" for i in range(1, 5)]
+
+    def test_export_insights_json_matches_rows(self, storage, sample_classified_insight):
+        """Test that the SQLite-built JSON export equals the dict rows."""
+        assert orjson.loads(storage.export_insights_json()) == []
+
+        storage.save_insights([
+            sample_classified_insight,
+            sample_classified_insight.model_copy(update={"source_id": "export_2"}),
+        ])
+
+        assert orjson.loads(storage.export_insights_json()) == storage.get_all_insights()
+
+    def test_get_distinct_categories(self, storage, sample_classified_insight):
+        """Test fetching the set of insight categories."""
+        assert storage.get_distinct_categories() == set()
+
+        storage.save_insight(sample_classified_insight)
+
+        assert storage.get_distinct_categories() == {sample_classified_insight.category.value}
 
 
 class TestSaveCluster:
@@ -612,6 +785,36 @@ class TestGetStats:
         assert stats["scored_opportunities"] == 0
         assert stats["category_breakdown"]["analytics"] == 1
 
+    def test_get_stats_separates_interview_breakdown(self, storage, sample_classified_insight):
+        """Test that scraped and interview categories are counted apart."""
+        storage.save_insight(sample_classified_insight)
+        conn = storage._get_connection()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO interview_participants
+                (participant_id, interview_date, store_vertical, monthly_gmv_range,
+                 store_age_months, team_size, app_count)
+                VALUES ('p1', '2024-01-01', 'apparel', '10k-50k', 12, 2, 8)
+                """
+            )
+            conn.execute(
+                """
+                INSERT INTO interview_insights
+                (interview_id, participant_id, pain_category, pain_summary,
+                 frustration_level, frequency, business_impact)
+                VALUES ('i1', 'p1', 'inventory', 'Stock drift', 4, 'weekly', 'high')
+                """
+            )
+        conn.close()
+
+        stats = storage.get_stats()
+
+        assert stats["category_breakdown"] == {"analytics": 1}
+        assert stats["interview_participants"] == 1
+        assert stats["interview_insights"] == 1
+        assert stats["interview_category_breakdown"] == {"inventory": 1}
+
 
 class TestClearAll:
     """Tests for clear_all method."""
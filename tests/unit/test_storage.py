@@ -1,12 +1,17 @@
 """Unit tests for storage module."""
 
 import pytest
+import threading
+import time
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import orjson
+from requests import HTTPError
+
 from scrapers.base import RawDataPoint, DataSource
 from analysis.classifier import ClassifiedInsight, ProblemCategory
-from storage.airtable import AirtableStorage
+from storage.airtable import AirtableStorage, _RateLimiter, _ThrottledAdapter
 
 
 class TestAirtableStorage:
@@ -33,26 +38,34 @@ class TestAirtableStorage:
         assert AirtableStorage.CLUSTERS_TABLE == "Problem Clusters"
         assert AirtableStorage.SCORES_TABLE == "Opportunity Scores"
 
-    def test_get_table_caches_reference(self, storage, mock_api):
-        """Test that table references are cached."""
-        mock_table = MagicMock()
-        storage.api.table = MagicMock(return_value=mock_table)
+    def test_api_retries_transient_errors(self, storage, mock_api):
+        """Test that the API client gets a timeout and a retry strategy."""
+        kwargs = mock_api.call_args.kwargs
+        assert kwargs["timeout"] == (10, 60)
+        assert 503 in kwargs["retry_strategy"].status_forcelist
 
-        # Get same table twice
-        table1 = storage._get_table("Test Table")
-        table2 = storage._get_table("Test Table")
+    def test_retries_post_only_when_rate_limited(self, storage, mock_api):
+        """Test that creates are not replayed after a server error."""
+        retry = mock_api.call_args.kwargs["retry_strategy"]
 
-        # Should only call api.table once
-        assert storage.api.table.call_count == 1
-        assert table1 is table2
+        assert retry.is_retry("POST", 429)
+        assert not retry.is_retry("POST", 503)
+        assert retry.is_retry("PATCH", 503)
+        assert retry.is_retry("GET", 503)
+        assert not retry.new(total=0).is_retry("POST", 429)
 
-    def test_get_table_different_tables(self, storage, mock_api):
-        """Test getting different tables."""
+    def test_table_accessors_cache_reference(self, storage, mock_api):
+        """Test that table references are cached."""
         storage.api.table = MagicMock(side_effect=lambda base, name: MagicMock(name=name))
 
-        table1 = storage._get_table("Table 1")
-        table2 = storage._get_table("Table 2")
+        assert storage.raw_table is storage.raw_table
+        storage.api.table.assert_called_once_with("test-base", "Raw Sources")
+
+    def test_table_accessors_different_tables(self, storage, mock_api):
+        """Test getting different tables."""
+        storage.api.table = MagicMock(side_effect=lambda base, name: MagicMock(name=name))
 
+        assert storage.raw_table is not storage.insights_table
         assert storage.api.table.call_count == 2
 
 
@@ -67,7 +80,6 @@ class TestSaveRawDatapoint:
             mock_settings.airtable_api_key = "test-key"
             mock_settings.airtable_base_id = "test-base"
             storage = AirtableStorage()
-            storage._tables = {}
             return storage
 
     def test_save_new_datapoint(self, storage, sample_raw_datapoint):
@@ -75,7 +87,7 @@ class TestSaveRawDatapoint:
         mock_table = MagicMock()
         mock_table.first.return_value = None  # No existing record
         mock_table.create.return_value = {"id": "rec123"}
-        storage._get_table = MagicMock(return_value=mock_table)
+        storage.api.table = MagicMock(return_value=mock_table)
 
         result = storage.save_raw_datapoint(sample_raw_datapoint)
 
@@ -87,18 +99,36 @@ class TestSaveRawDatapoint:
         assert call_args["source_id"] == sample_raw_datapoint.source_id
         assert call_args["source"] == "reddit"
         assert call_args["url"] == sample_raw_datapoint.url
+        assert orjson.loads(call_args["metadata"]) == sample_raw_datapoint.metadata
 
     def test_save_duplicate_returns_existing_id(self, storage, sample_raw_datapoint):
         """Test that saving duplicate returns existing record ID."""
         mock_table = MagicMock()
-        mock_table.first.return_value = {"id": "existing_rec"}
-        storage._get_table = MagicMock(return_value=mock_table)
+        mock_table.all.return_value = [
+            {"id": "existing_rec", "fields": {"source_id": sample_raw_datapoint.source_id}},
+        ]
+        storage.api.table = MagicMock(return_value=mock_table)
 
         result = storage.save_raw_datapoint(sample_raw_datapoint)
 
         assert result == "existing_rec"
         mock_table.create.assert_not_called()
 
+    def test_loads_existing_ids_once(self, storage, sample_raw_datapoint):
+        """Test that existing source ids are fetched in one projected scan."""
+        mock_table = MagicMock()
+        mock_table.all.return_value = []
+        mock_table.create.return_value = {"id": "rec123"}
+        storage.api.table = MagicMock(return_value=mock_table)
+
+        first = storage.save_raw_datapoint(sample_raw_datapoint)
+        second = storage.save_raw_datapoint(sample_raw_datapoint)
+
+        assert first == second == "rec123"
+        mock_table.all.assert_called_once_with(fields=["source_id"])
+        mock_table.create.assert_called_once()
+        mock_table.first.assert_not_called()
+
     def test_save_truncates_long_content(self, storage):
         """Test that very long content is truncated."""
         long_content = "x" * 150000  # Over 100k limit
@@ -113,7 +143,7 @@ class TestSaveRawDatapoint:
         mock_table = MagicMock()
         mock_table.first.return_value = None
         mock_table.create.return_value = {"id": "rec123"}
-        storage._get_table = MagicMock(return_value=mock_table)
+        storage.api.table = MagicMock(return_value=mock_table)
 
         storage.save_raw_datapoint(dp)
 
@@ -132,7 +162,6 @@ class TestSaveInsight:
             mock_settings.airtable_api_key = "test-key"
             mock_settings.airtable_base_id = "test-base"
             storage = AirtableStorage()
-            storage._tables = {}
             return storage
 
     def test_save_new_insight(self, storage, sample_classified_insight):
@@ -140,7 +169,7 @@ class TestSaveInsight:
         mock_table = MagicMock()
         mock_table.first.return_value = None
         mock_table.create.return_value = {"id": "rec_insight_123"}
-        storage._get_table = MagicMock(return_value=mock_table)
+        storage.api.table = MagicMock(return_value=mock_table)
 
         result = storage.save_insight(sample_classified_insight)
 
@@ -158,7 +187,7 @@ class TestSaveInsight:
         mock_table = MagicMock()
         mock_table.first.return_value = None
         mock_table.create.return_value = {"id": "rec_insight_123"}
-        storage._get_table = MagicMock(return_value=mock_table)
+        storage.api.table = MagicMock(return_value=mock_table)
 
         result = storage.save_insight(sample_classified_insight, raw_record_id="rec_raw_456")
 
@@ -170,7 +199,7 @@ class TestSaveInsight:
         mock_table = MagicMock()
         mock_table.first.return_value = None
         mock_table.create.return_value = {"id": "rec123"}
-        storage._get_table = MagicMock(return_value=mock_table)
+        storage.api.table = MagicMock(return_value=mock_table)
 
         storage.save_insight(sample_classified_insight)
 
@@ -182,7 +211,7 @@ class TestSaveInsight:
         mock_table = MagicMock()
         mock_table.first.return_value = None
         mock_table.create.return_value = {"id": "rec123"}
-        storage._get_table = MagicMock(return_value=mock_table)
+        storage.api.table = MagicMock(return_value=mock_table)
 
         storage.save_insight(sample_classified_insight)
 
@@ -190,6 +219,106 @@ class TestSaveInsight:
         assert "I'd happily pay $20/month" in call_args["wtp_quotes"]
 
 
+class TestSaveBatches:
+    """Tests for the bulk save methods."""
+
+    @pytest.fixture
+    def storage(self):
+        """Create storage with mocked internals."""
+        with patch("storage.airtable.Api"), \
+             patch("storage.airtable.settings") as mock_settings:
+            mock_settings.airtable_api_key = "test-key"
+            mock_settings.airtable_base_id = "test-base"
+            storage = AirtableStorage()
+            return storage
+
+    def test_save_insights_batches_new_records(self, storage, sample_classified_insight):
+        """Test that only new insights are created, in one batch call."""
+        existing = sample_classified_insight.model_copy(update={"source_id": "existing"})
+        mock_table = MagicMock()
+        mock_table.all.return_value = [{"id": "rec_existing", "fields": {"source_id": "existing"}}]
+        mock_table.batch_create.return_value = [{"id": "rec_new"}]
+        storage.api.table = MagicMock(return_value=mock_table)
+
+        result = storage.save_insights([existing, sample_classified_insight])
+
+        assert result == ["rec_existing", "rec_new"]
+        mock_table.create.assert_not_called()
+        [records] = mock_table.batch_create.call_args[0]
+        assert [r["source_id"] for r in records] == [sample_classified_insight.source_id]
+
+    def test_save_insights_dedupes_by_source_id(self, storage, sample_classified_insight):
+        """Test that a repeated source_id is created once, from its last item."""
+        first = sample_classified_insight.model_copy(update={"problem_statement": "first"})
+        last = sample_classified_insight.model_copy(update={"problem_statement": "last"})
+        mock_table = MagicMock()
+        mock_table.all.return_value = []
+        mock_table.batch_create.return_value = [{"id": "rec_new"}]
+        storage.api.table = MagicMock(return_value=mock_table)
+
+        result = storage.save_insights([first, last])
+
+        assert result == ["rec_new", "rec_new"]
+        [records] = mock_table.batch_create.call_args[0]
+        assert [r["problem_statement"] for r in records] == ["last"]
+
+    def test_mark_batch_processed_uses_known_record_ids(self, storage):
+        """Test that records are marked in one batch update without lookups."""
+        mock_table = MagicMock()
+        mock_table.all.return_value = [
+            {"id": "rec_1", "fields": {"source_id": "s1"}},
+            {"id": "rec_2", "fields": {"source_id": "s2"}},
+        ]
+        storage.api.table = MagicMock(return_value=mock_table)
+
+        storage.mark_batch_processed(["s1", "missing", "s2", "s1"])
+
+        mock_table.first.assert_not_called()
+        mock_table.batch_update.assert_called_once_with([
+            {"id": "rec_1", "fields": {"processed": True}},
+            {"id": "rec_2", "fields": {"processed": True}},
+        ])
+
+    def test_save_raw_datapoints_skips_batch_when_all_exist(self, storage, sample_raw_datapoint):
+        """Test that no batch request is made when every record exists."""
+        mock_table = MagicMock()
+        mock_table.all.return_value = [
+            {"id": "rec_existing", "fields": {"source_id": sample_raw_datapoint.source_id}},
+        ]
+        storage.api.table = MagicMock(return_value=mock_table)
+
+        result = storage.save_raw_datapoints([sample_raw_datapoint])
+
+        assert result == ["rec_existing"]
+        mock_table.batch_create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_insights_async_sends_chunks_concurrently(
+        self, storage, sample_classified_insight
+    ):
+        """Test that 10-record chunks are created in parallel, IDs in input order."""
+        insights = [
+            sample_classified_insight.model_copy(update={"source_id": f"s{i}"})
+            for i in range(25)
+        ]
+        barrier = threading.Barrier(3, timeout=5)
+
+        def batch_create(records):
+            barrier.wait()
+            return [{"id": f"rec_{r['source_id']}"} for r in records]
+
+        mock_table = MagicMock()
+        mock_table.all.return_value = []
+        mock_table.batch_create.side_effect = batch_create
+        storage.api.table = MagicMock(return_value=mock_table)
+
+        result = await storage.save_insights_async(insights)
+
+        assert result == [f"rec_s{i}" for i in range(25)]
+        sizes = sorted(len(c.args[0]) for c in mock_table.batch_create.call_args_list)
+        assert sizes == [5, 10, 10]
+
+
 class TestGetMethods:
     """Tests for getter methods."""
 
@@ -201,20 +330,42 @@ class TestGetMethods:
             mock_settings.airtable_api_key = "test-key"
             mock_settings.airtable_base_id = "test-base"
             storage = AirtableStorage()
-            storage._tables = {}
             return storage
 
     def test_get_unprocessed_raw_data(self, storage, mock_airtable_records):
         """Test fetching unprocessed raw data."""
         mock_table = MagicMock()
-        mock_table.all.return_value = mock_airtable_records
-        storage._get_table = MagicMock(return_value=mock_table)
+        mock_table.iterate.return_value = iter([mock_airtable_records])
+        storage.api.table = MagicMock(return_value=mock_table)
 
         result = storage.get_unprocessed_raw_data(limit=50)
 
         assert len(result) == 2
         assert result[0]["source_id"] == "reddit_post_abc123"
-        mock_table.all.assert_called_once()
+        mock_table.iterate.assert_called_once()
+        assert mock_table.iterate.call_args.kwargs["page_size"] == 50
+
+    def test_get_unprocessed_raw_data_stops_at_limit(self, storage):
+        """Test that paging stops once the limit is reached."""
+        pages = [
+            [{"id": f"rec{p}{i}", "fields": {"source_id": f"s{p}{i}"}} for i in range(100)]
+            for p in range(3)
+        ]
+        fetched = []
+
+        def iterate(**options):
+            for page in pages:
+                fetched.append(page)
+                yield page
+
+        mock_table = MagicMock()
+        mock_table.iterate.side_effect = iterate
+        storage.api.table = MagicMock(return_value=mock_table)
+
+        result = storage.get_unprocessed_raw_data(limit=150)
+
+        assert len(result) == 150
+        assert len(fetched) == 2
 
     def test_get_insights_by_category(self, storage):
         """Test fetching insights by category."""
@@ -224,7 +375,7 @@ class TestGetMethods:
         ]
         mock_table = MagicMock()
         mock_table.all.return_value = mock_records
-        storage._get_table = MagicMock(return_value=mock_table)
+        storage.api.table = MagicMock(return_value=mock_table)
 
         result = storage.get_insights_by_category(ProblemCategory.ANALYTICS)
 
@@ -238,11 +389,55 @@ class TestGetMethods:
         ]
         mock_table = MagicMock()
         mock_table.all.return_value = mock_records
-        storage._get_table = MagicMock(return_value=mock_table)
+        storage.api.table = MagicMock(return_value=mock_table)
 
         result = storage.get_all_insights()
 
         assert len(result) == 2
+        mock_table.all.assert_called_once_with()
+
+    def test_get_all_insights_projects_fields(self, storage):
+        """Test that requested fields are forwarded to the scan."""
+        mock_table = MagicMock()
+        mock_table.all.return_value = [{"id": "rec1", "fields": {"category": "analytics"}}]
+        storage.api.table = MagicMock(return_value=mock_table)
+
+        result = storage.get_all_insights(fields=["category"])
+
+        assert result == [{"category": "analytics"}]
+        mock_table.all.assert_called_once_with(fields=["category"])
+
+    def test_iter_all_insights_streams_pages(self, storage):
+        """Test that insights are yielded page by page without a full scan."""
+        mock_table = MagicMock()
+        mock_table.iterate.return_value = iter([
+            [{"id": "rec1", "fields": {"category": "analytics"}}],
+            [{"id": "rec2", "fields": {"category": "marketing"}}],
+        ])
+        storage.api.table = MagicMock(return_value=mock_table)
+
+        result = storage.iter_all_insights(fields=["category"])
+
+        assert next(result) == {"category": "analytics"}
+        assert list(result) == [{"category": "marketing"}]
+        mock_table.all.assert_not_called()
+        mock_table.iterate.assert_called_once_with(page_size=100, fields=["category"])
+
+    def test_reads_are_cached_until_write(self, storage, sample_classified_insight):
+        """Test that repeat reads reuse the cache and writes invalidate it."""
+        mock_table = MagicMock()
+        mock_table.all.return_value = [{"id": "rec1", "fields": {"category": "analytics"}}]
+        mock_table.create.return_value = {"id": "rec2"}
+        storage.api.table = MagicMock(return_value=mock_table)
+
+        storage.get_all_insights()
+        storage.get_all_insights()
+        assert mock_table.all.call_count == 1
+
+        storage.save_insight(sample_classified_insight)
+        mock_table.all.reset_mock()
+        storage.get_all_insights()
+        assert mock_table.all.call_count == 1
 
     def test_get_ranked_opportunities(self, storage):
         """Test fetching ranked opportunities."""
@@ -252,7 +447,7 @@ class TestGetMethods:
         ]
         mock_table = MagicMock()
         mock_table.all.return_value = mock_records
-        storage._get_table = MagicMock(return_value=mock_table)
+        storage.api.table = MagicMock(return_value=mock_table)
 
         result = storage.get_ranked_opportunities()
 
@@ -271,14 +466,13 @@ class TestSaveCluster:
             mock_settings.airtable_api_key = "test-key"
             mock_settings.airtable_base_id = "test-base"
             storage = AirtableStorage()
-            storage._tables = {}
             return storage
 
     def test_save_cluster(self, storage):
         """Test saving a problem cluster."""
         mock_table = MagicMock()
         mock_table.create.return_value = {"id": "rec_cluster_123"}
-        storage._get_table = MagicMock(return_value=mock_table)
+        storage.api.table = MagicMock(return_value=mock_table)
 
         result = storage.save_cluster(
             name="Analytics Gap",
@@ -307,14 +501,13 @@ class TestSaveOpportunityScore:
             mock_settings.airtable_api_key = "test-key"
             mock_settings.airtable_base_id = "test-base"
             storage = AirtableStorage()
-            storage._tables = {}
             return storage
 
     def test_save_opportunity_score(self, storage):
         """Test saving an opportunity score."""
         mock_table = MagicMock()
         mock_table.create.return_value = {"id": "rec_score_123"}
-        storage._get_table = MagicMock(return_value=mock_table)
+        storage.api.table = MagicMock(return_value=mock_table)
 
         result = storage.save_opportunity_score(
             cluster_id="rec_cluster_456",
@@ -345,13 +538,12 @@ class TestGetStats:
             mock_settings.airtable_api_key = "test-key"
             mock_settings.airtable_base_id = "test-base"
             storage = AirtableStorage()
-            storage._tables = {}
             return storage
 
     def test_get_stats(self, storage):
         """Test getting statistics."""
         # Mock different tables with different record counts
-        def mock_get_table(name):
+        def make_table(base, name):
             mock_table = MagicMock()
             if name == "Raw Sources":
                 mock_table.all.return_value = [{"id": f"rec{i}"} for i in range(100)]
@@ -367,7 +559,7 @@ class TestGetStats:
                 mock_table.all.return_value = [{"id": "rec1"}]
             return mock_table
 
-        storage._get_table = mock_get_table
+        storage.api.table = MagicMock(side_effect=make_table)
 
         stats = storage.get_stats()
 
@@ -377,3 +569,95 @@ class TestGetStats:
         assert stats["scored_opportunities"] == 1
         assert stats["category_breakdown"]["analytics"] == 2
         assert stats["category_breakdown"]["marketing"] == 1
+
+    def test_get_stats_scans_tables_concurrently(self, storage):
+        """Test that the four table scans are in flight at the same time."""
+        # Each scan blocks until all four have started
+        barrier = threading.Barrier(4, timeout=5)
+
+        def scan(**options):
+            barrier.wait()
+            return []
+
+        mock_table = MagicMock()
+        mock_table.all.side_effect = scan
+        storage.api.table = MagicMock(return_value=mock_table)
+
+        stats = storage.get_stats()
+
+        assert stats["raw_data_points"] == 0
+        assert mock_table.all.call_count == 4
+
+    def test_get_stats_reads_category_counts_table(self, storage):
+        """Test that a configured summary table replaces the insights scan."""
+        def make_table(base, name):
+            mock_table = MagicMock()
+            if name == "Category Counts":
+                mock_table.all.return_value = [
+                    {"id": "rec1", "fields": {"category": "analytics", "count": 5}},
+                    {"id": "rec2", "fields": {"category": "marketing", "count": 2}},
+                ]
+            elif name == "Insights":
+                mock_table.all.side_effect = AssertionError("insights scanned")
+            else:
+                mock_table.all.return_value = []
+            return mock_table
+
+        storage.api.table = MagicMock(side_effect=make_table)
+        storage.category_counts_table = "Category Counts"
+
+        stats = storage.get_stats()
+
+        assert stats["classified_insights"] == 7
+        assert stats["category_breakdown"] == {"analytics": 5, "marketing": 2}
+
+    def test_get_stats_falls_back_without_category_counts_table(self, storage):
+        """Test that a missing summary table falls back to the scan once."""
+        missing = MagicMock()
+        missing.all.side_effect = HTTPError(response=MagicMock(status_code=404))
+        scanned = MagicMock()
+        scanned.all.return_value = [{"id": "rec1", "fields": {"category": "analytics"}}]
+        storage.api.table = MagicMock(
+            side_effect=lambda base, name: missing if name == "Category Counts" else scanned
+        )
+        storage.category_counts_table = "Category Counts"
+
+        stats = storage.get_stats()
+        storage.get_stats()
+
+        assert stats["category_breakdown"] == {"analytics": 1}
+        assert missing.all.call_count == 1
+
+    def test_get_stats_projects_one_field_per_table(self, storage):
+        """Test that the scans do not download full records."""
+        mock_table = MagicMock()
+        mock_table.all.return_value = []
+        storage.api.table = MagicMock(return_value=mock_table)
+
+        storage.get_stats()
+
+        for call in mock_table.all.call_args_list:
+            assert len(call.kwargs["fields"]) == 1
+
+
+class TestThrottling:
+    """Tests for Airtable request pacing."""
+
+    def test_session_mounts_throttled_adapter(self):
+        """Test that API requests go through the rate-limited adapter."""
+        with patch("storage.airtable.settings") as mock_settings:
+            mock_settings.airtable_api_key = "test-key"
+            mock_settings.airtable_base_id = "test-base"
+            storage = AirtableStorage()
+
+        adapter = storage.api.session.get_adapter("https://api.airtable.com/v0/test-base")
+        assert isinstance(adapter, _ThrottledAdapter)
+        assert 429 in adapter.max_retries.status_forcelist
+
+    def test_limiter_spaces_requests_once_burst_is_spent(self):
+        """Test that an empty bucket blocks for the interval."""
+        limiter = _RateLimiter(0.05, burst=1)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.1